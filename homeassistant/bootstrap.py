@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Mapping
 import contextlib
 from functools import partial
 from itertools import chain
@@ -87,7 +88,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
 from .setup import (
@@ -132,6 +133,11 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+SETUP_TIMES_STORAGE_KEY = "core.setup_times"
+SETUP_TIMES_STORAGE_VERSION = 1
+# Setup time assumed for integrations without a recorded setup time
+DEFAULT_SETUP_TIME = 0.1
+
 
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 
@@ -773,6 +779,7 @@ async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
     config: dict[str, Any],
+    critical_path_times: Mapping[str, float] | None = None,
 ) -> None:
     """Set up multiple domains. Log on failure."""
     # Avoid creating tasks for domains that were setup in a previous stage
@@ -780,6 +787,10 @@ async def async_setup_multi_components(
     # Create setup tasks for base platforms first since everything will have
     # to wait to be imported, and the sooner we can get the base platforms
     # loaded the sooner we can start loading the rest of the integrations.
+    # The other domains are started longest critical path first, so the
+    # domains that delay the most other domains get the import executor
+    # before the rest.
+    path_times = critical_path_times or {}
     futures = {
         domain: hass.async_create_task_internal(
             async_setup_component(hass, domain, config),
@@ -787,7 +798,12 @@ async def async_setup_multi_components(
             eager_start=True,
         )
         for domain in sorted(
-            domains_not_yet_setup, key=SETUP_ORDER_SORT_KEY, reverse=True
+            domains_not_yet_setup,
+            key=lambda domain: (
+                SETUP_ORDER_SORT_KEY(domain),
+                path_times.get(domain, 0.0),
+            ),
+            reverse=True,
         )
     }
     results = await asyncio.gather(*futures.values(), return_exceptions=True)
@@ -965,6 +981,48 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+def _async_get_critical_path_times(
+    domains: set[str],
+    integration_cache: dict[str, loader.Integration],
+    setup_times: Mapping[str, float],
+) -> dict[str, float]:
+    """Return the longest chain of setup times starting at each domain.
+
+    The chain follows the domains that wait for a domain through their
+    dependencies and after dependencies.
+    """
+    waiting: defaultdict[str, set[str]] = defaultdict(set)
+    for domain in domains:
+        if (integration := integration_cache.get(domain)) is None:
+            continue
+        for dep in chain(integration.dependencies, integration.after_dependencies):
+            if dep in domains:
+                waiting[dep].add(domain)
+
+    path_times: dict[str, float] = {}
+
+    def _path_time(domain: str, visiting: set[str]) -> float:
+        if (path_time := path_times.get(domain)) is not None:
+            return path_time
+        visiting.add(domain)
+        path_time = setup_times.get(domain, DEFAULT_SETUP_TIME) + max(
+            (
+                _path_time(dependent, visiting)
+                for dependent in waiting[domain]
+                # Guard against after dependencies waiting on each other
+                if dependent not in visiting
+            ),
+            default=0.0,
+        )
+        visiting.remove(domain)
+        path_times[domain] = path_time
+        return path_time
+
+    for domain in domains:
+        _path_time(domain, set())
+    return path_times
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -972,10 +1030,24 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
+    setup_times_store = Store[dict[str, float]](
+        hass, SETUP_TIMES_STORAGE_VERSION, SETUP_TIMES_STORAGE_KEY, private=True
+    )
+    load_setup_times = create_eager_task(setup_times_store.async_load(), loop=hass.loop)
+
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
         hass, config
     )
 
+    try:
+        previous_setup_times = await load_setup_times or {}
+    except HomeAssistantError as err:
+        _LOGGER.warning("Unable to load the setup times of the last start: %s", err)
+        previous_setup_times = {}
+    critical_path_times = _async_get_critical_path_times(
+        domains_to_setup, integration_cache, previous_setup_times
+    )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -1020,7 +1092,9 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            await async_setup_multi_components(
+                hass, domain_group, config, critical_path_times
+            )
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -1032,7 +1106,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_1_domains, config, critical_path_times
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -1048,7 +1124,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_2_domains, config, critical_path_times
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1068,8 +1146,25 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    setup_time = async_get_setup_timings(hass)
+    # Average with the last start to smooth out a single slow start
+    hass.async_create_background_task(
+        setup_times_store.async_save(
+            {
+                **previous_setup_times,
+                **{
+                    domain: round(
+                        (previous_setup_times.get(domain, seconds) + seconds) / 2, 3
+                    )
+                    for domain, seconds in setup_time.items()
+                },
+            }
+        ),
+        "save setup times",
+        eager_start=True,
+    )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
-        setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
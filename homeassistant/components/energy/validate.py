@@ -7,6 +7,7 @@ import dataclasses
 import functools
 
 from homeassistant.components import recorder, sensor
+from homeassistant.components.recorder.const import QueryClass
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     STATE_UNAVAILABLE,
@@ -604,12 +605,13 @@ async def async_validate(hass: HomeAssistant) -> EnergyPreferencesValidation:
 
     # Fetch the needed statistics metadata
     statistics_metadata.update(
-        await recorder.get_instance(hass).async_add_executor_job(
+        await recorder.get_instance(hass).async_add_read_executor_job(
+            QueryClass.ENERGY,
             functools.partial(
                 recorder.statistics.get_metadata,
                 hass,
                 statistic_ids=set(wanted_statistics_metadata),
-            )
+            ),
         )
     )
 
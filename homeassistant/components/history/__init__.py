@@ -12,6 +12,7 @@ import voluptuous as vol
 from homeassistant.components import frontend
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.const import QueryClass
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
 from homeassistant.core import HomeAssistant, valid_entity_id
@@ -118,7 +119,8 @@ class HistoryPeriodView(HomeAssistantView):
 
         return cast(
             web.Response,
-            await get_instance(hass).async_add_executor_job(
+            await get_instance(hass).async_add_read_executor_job(
+                QueryClass.HISTORY,
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
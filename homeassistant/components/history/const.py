@@ -5,3 +5,16 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+MAX_COLUMNAR_CHUNK_SIZE = 10000
+
+# Reading columnar chunks pauses while the connection has more than
+# this many messages waiting to be written, polling every
+# COLUMNAR_CHUNK_WAIT seconds
+MAX_PENDING_COLUMNAR_CHUNKS = 128
+COLUMNAR_CHUNK_WAIT = 0.05
+
+# A columnar stream holds a read executor worker and an open database
+# cursor, so it is ended with an error once the client stays behind
+# for longer than this many seconds
+MAX_COLUMNAR_CHUNK_PAUSE = 30
@@ -7,12 +7,15 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
+import threading
+import time
 from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import downsample, get_instance, history
+from homeassistant.components.recorder.const import QueryClass
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -35,10 +38,17 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import json_bytes
-from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.async_ import create_eager_task, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    COLUMNAR_CHUNK_WAIT,
+    EVENT_COALESCE_TIME,
+    MAX_COLUMNAR_CHUNK_PAUSE,
+    MAX_COLUMNAR_CHUNK_SIZE,
+    MAX_PENDING_COLUMNAR_CHUNKS,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,25 +82,109 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
-    """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
+    """Fetch history significant_states and convert them to json in the executor.
+
+    When max_points is passed, entities with downsampled states in the
+    period are served from the downsampled tier and only the remaining
+    entities are fetched from the states table.
+    """
+    significant_states: dict[str, list[Any]] = {}
+    if max_points and entity_ids:
+        significant_states |= (
+            downsample.get_downsampled_states(
+                hass, start_time, end_time or dt_util.utcnow(), entity_ids, max_points
+            )
+            or {}
         )
-    )
+        entity_ids = [
+            entity_id for entity_id in entity_ids if entity_id not in significant_states
+        ]
+    if not significant_states or entity_ids:
+        significant_states |= history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+    return json_bytes(messages.result_message(msg_id, significant_states))
+
+
+@callback
+def _async_send_columnar_chunk(connection: ActiveConnection, chunk: bytes) -> int:
+    """Send a columnar chunk and return the number of pending messages."""
+    connection.send_message(chunk)
+    return connection.pending_messages()
+
+
+def _ws_stream_significant_states_columnar(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    stopped: threading.Event,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    chunk_size: int,
+) -> bool:
+    """Fetch history significant_states and send them as columnar chunks in the executor.
+
+    Each chunk is serialized and handed to the event loop as soon
+    as it is read from the database so the full result is never
+    materialized. Reading pauses while the client is behind and
+    stops once the connection is closed or the subscription is
+    removed.
+
+    Returns True if every chunk was sent and False if the stream
+    was stopped. Raises TimeoutError if the client stays behind for
+    longer than MAX_COLUMNAR_CHUNK_PAUSE seconds.
+    """
+    loop = hass.loop
+    for entity_id, timestamps, states in history.get_significant_states_columnar_chunks(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        chunk_size,
+    ):
+        if stopped.is_set():
+            return False
+        chunk = json_bytes(
+            messages.event_message(
+                msg_id,
+                {
+                    "entity_id": entity_id,
+                    COMPRESSED_STATE_LAST_UPDATED: timestamps,
+                    COMPRESSED_STATE_STATE: states,
+                },
+            )
+        )
+        pending = run_callback_threadsafe(
+            loop, _async_send_columnar_chunk, connection, chunk
+        ).result()
+        if pending < MAX_PENDING_COLUMNAR_CHUNKS:
+            continue
+        deadline = time.monotonic() + MAX_COLUMNAR_CHUNK_PAUSE
+        while pending >= MAX_PENDING_COLUMNAR_CHUNKS:
+            if stopped.wait(COLUMNAR_CHUNK_WAIT):
+                return False
+            if time.monotonic() > deadline:
+                raise TimeoutError
+            pending = run_callback_threadsafe(
+                loop, connection.pending_messages
+            ).result()
+    return not stopped.is_set()
 
 
 @websocket_api.websocket_command(
@@ -103,13 +197,29 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Exclusive("chunk_size", "response_format"): vol.All(
+            int, vol.Range(min=1, max=MAX_COLUMNAR_CHUNK_SIZE)
+        ),
+        vol.Exclusive("max_points", "response_format"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    When chunk_size is passed, the result is an empty success message
+    followed by event messages with parallel arrays of the last_updated
+    timestamps and the states for one entity each, and a final event
+    message that marks the stream as complete. Attributes are never
+    included in this mode.
+
+    When max_points is passed, numeric entities are served from the
+    recorder's downsampled states with at most max_points compressed
+    states each, which also carry the min and max in the bucket.
+    """
+    chunk_size: int | None = msg.get("chunk_size")
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
 
@@ -129,7 +239,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history_during_period(connection, msg["id"], chunk_size)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -149,14 +259,50 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history_during_period(connection, msg["id"], chunk_size)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if chunk_size:
+        msg_id: int = msg["id"]
+        stopped = threading.Event()
+        connection.subscriptions[msg_id] = stopped.set
+        connection.send_result(msg_id)
+        try:
+            completed = await get_instance(hass).async_add_read_executor_job(
+                QueryClass.HISTORY,
+                _ws_stream_significant_states_columnar,
+                hass,
+                connection,
+                stopped,
+                msg_id,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                chunk_size,
+            )
+        except TimeoutError:
+            connection.send_error(
+                msg_id,
+                websocket_api.ERR_TIMEOUT,
+                "Client did not keep up with the history stream",
+            )
+            return
+        finally:
+            # Also stops reading if this task is cancelled
+            stopped.set()
+            connection.subscriptions.pop(msg_id, None)
+        if completed:
+            connection.send_message(messages.event_message(msg_id, {"complete": True}))
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
+            QueryClass.HISTORY,
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -167,10 +313,23 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
 
+@callback
+def _async_send_empty_history_during_period(
+    connection: ActiveConnection, msg_id: int, chunk_size: int | None
+) -> None:
+    """Send an empty history during period response."""
+    if not chunk_size:
+        connection.send_result(msg_id, {})
+        return
+    connection.send_result(msg_id)
+    connection.send_message(messages.event_message(msg_id, {"complete": True}))
+
+
 def _generate_stream_message(
     states: dict[str, list[dict[str, Any]]],
     start_day: dt,
@@ -279,7 +438,8 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_executor_job(
+        QueryClass.HISTORY,
         _generate_historical_response,
         hass,
         msg_id,
@@ -7,10 +7,11 @@ from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -36,6 +37,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.collection import chunked_or_all
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
 
@@ -81,6 +83,7 @@ from .models import (
 )
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.context import context_origins_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -157,32 +160,100 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
+            return self.humanify(self._get_rows(session, start_day, end_day))
+
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        limit: int,
+        cursor: tuple[float, int, int] | None = None,
+    ) -> tuple[list[dict[str, Any]], tuple[float, int, int] | None]:
+        """Get a page of events after the cursor.
+
+        Returns the events and the cursor to pass for the next page,
+        or None if there are no more events.
+        """
+        with session_scope(hass=self.hass, read_only=True) as session:
+            rows = self._get_rows(session, start_day, end_day, limit, cursor)
+            next_cursor: tuple[float, int, int] | None = None
+            if len(rows) >= limit:
+                last_row = rows[-1]
+                next_cursor = (
+                    last_row[TIME_FIRED_TS_POS],
+                    int(last_row[EVENT_TYPE_POS] is PSEUDO_EVENT_STATE_CHANGED),
+                    last_row[ROW_ID_POS],
                 )
+            if rows:
+                self._load_context_origins(session, rows, rows[-1][TIME_FIRED_TS_POS])
+            return self.humanify(rows), next_cursor
+
+    def _get_rows(
+        self,
+        session: Session,
+        start_day: dt,
+        end_day: dt,
+        limit: int | None = None,
+        cursor: tuple[float, int, int] | None = None,
+    ) -> Sequence[Row]:
+        """Get the rows for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
             )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
+        stmt = statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+            limit,
+            cursor,
+        )
+        return cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
+
+    def _load_context_origins(
+        self, session: Session, rows: Sequence[Row], end_ts: float
+    ) -> None:
+        """Load the rows that started the contexts of rows up to end_ts.
+
+        A page does not hold the context only rows, so the rows that
+        started its contexts are looked up by their index.
+        """
+        context_lookup = self.logbook_run.context_lookup
+        context_id_bins = {
+            context_id_bin
+            for row in rows
+            for context_id_bin in (
+                row[CONTEXT_ID_BIN_POS],
+                row[CONTEXT_PARENT_ID_BIN_POS],
             )
+            if context_id_bin is not None and context_id_bin not in context_lookup
+        }
+        if not context_id_bins:
+            return
+        # The ids are bound once for the events and once for the states
+        max_bind_vars = get_instance(self.hass).max_bind_vars // 2
+        for context_id_bins_chunk in chunked_or_all(context_id_bins, max_bind_vars):
+            for row in execute_stmt_lambda_element(
+                session,
+                context_origins_stmt(list(context_id_bins_chunk), end_ts),
+                orm_rows=False,
+            ):
+                if (context_id_bin := row[CONTEXT_ID_BIN_POS]) not in context_lookup:
+                    context_lookup[context_id_bin] = row
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
@@ -4,14 +4,20 @@ from __future__ import annotations
 
 from collections.abc import Collection
 from datetime import datetime as dt
+import math
+from typing import Any
 
+from sqlalchemy import case, select, tuple_
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.sql.selectable import CompoundSelect, Select, Subquery
 
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import ulid_to_bytes_or_none
 from homeassistant.helpers.json import json_dumps
 
 from .all import all_stmt
+from .common import PSEUDO_EVENT_STATE_CHANGED
 from .devices import devices_stmt
 from .entities import entities_stmt
 from .entities_and_devices import entities_devices_stmt
@@ -26,10 +32,97 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    limit: int | None = None,
+    cursor: tuple[float, int, int] | None = None,
 ) -> StatementLambdaElement:
-    """Generate the logbook statement for a logbook request."""
+    """Generate the logbook statement for a logbook request.
+
+    When a limit is passed, only the first rows in keyset order are
+    returned without the context only rows. The cursor is the keyset
+    of the last row of the previous page and the rows after it are
+    returned.
+    """
     start_day = start_day_dt.timestamp()
-    end_day = end_day_dt.timestamp()
+    if cursor is not None:
+        # Rows sharing the timestamp of the cursor are selected
+        # and the ones up to the cursor are filtered by the keyset
+        start_day = max(start_day, math.nextafter(cursor[0], -math.inf))
+    stmt = _statement_for_request(
+        start_day,
+        end_day_dt.timestamp(),
+        event_type_ids,
+        entity_ids,
+        states_metadata_ids,
+        device_ids,
+        filters,
+        context_id,
+    )
+    if not limit:
+        return stmt
+    if cursor is None:
+        stmt += lambda s: _select_page(s, limit)
+        return stmt
+    cursor_ts, cursor_state, cursor_row_id = cursor
+    stmt += lambda s: _select_page_after(
+        s, cursor_ts, cursor_state, cursor_row_id, limit
+    )
+    return stmt
+
+
+def _select_page(union: CompoundSelect, limit: int) -> Select:
+    """Select the first rows of a logbook statement in keyset order."""
+    sub = union.order_by(None).subquery()
+    return (
+        select(sub)
+        .where(sub.c.context_only.is_(None))
+        .order_by(*_keyset_columns(sub))
+        .limit(limit)
+    )
+
+
+def _select_page_after(
+    union: CompoundSelect,
+    cursor_ts: float,
+    cursor_state: int,
+    cursor_row_id: int,
+    limit: int,
+) -> Select:
+    """Select the first rows of a logbook statement after the cursor."""
+    sub = union.order_by(None).subquery()
+    keyset = _keyset_columns(sub)
+    return (
+        select(sub)
+        .where(sub.c.context_only.is_(None))
+        .where(tuple_(*keyset) > tuple_(cursor_ts, cursor_state, cursor_row_id))
+        .order_by(*keyset)
+        .limit(limit)
+    )
+
+
+def _keyset_columns(sub: Subquery) -> tuple[ColumnElement[Any], ...]:
+    """Return the columns that order the rows of a logbook statement.
+
+    The row ids of the events and the states are from different tables
+    so they are ordered by the time first and then by the table.
+    """
+    return (
+        sub.c.time_fired_ts,
+        case((sub.c.event_type.is_(PSEUDO_EVENT_STATE_CHANGED), 1), else_=0),
+        sub.c.row_id,
+    )
+
+
+def _statement_for_request(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    entity_ids: list[str] | None,
+    states_metadata_ids: Collection[int] | None,
+    device_ids: list[str] | None,
+    filters: Filters | None,
+    context_id: str | None,
+) -> StatementLambdaElement:
+    """Generate the logbook statement for a time range."""
     # No entities: logbook sends everything for the timeframe
     # limited by the context_id and the yaml configured filter
     if not entity_ids and not device_ids:
@@ -0,0 +1,50 @@
+"""Context queries for logbook."""
+
+from __future__ import annotations
+
+from sqlalchemy import lambda_stmt, union_all
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    States,
+    StatesMeta,
+)
+
+from .common import (
+    apply_events_context_hints,
+    apply_states_context_hints,
+    select_events_context_only,
+    select_states_context_only,
+)
+
+
+def context_origins_stmt(
+    context_id_bins: list[bytes], end_day: float
+) -> StatementLambdaElement:
+    """Generate a query for the rows of the given contexts up to end_day.
+
+    The rows are found through the context_id_bin indexes and are ordered
+    by time so the first row of each context is the one that started it.
+    """
+    return lambda_stmt(
+        lambda: union_all(
+            apply_events_context_hints(
+                select_events_context_only()
+                .where(Events.context_id_bin.in_(context_id_bins))
+                .where(Events.time_fired_ts <= end_day)
+                .outerjoin(
+                    EventTypes, (Events.event_type_id == EventTypes.event_type_id)
+                )
+                .outerjoin(EventData, (Events.data_id == EventData.data_id))
+            ),
+            apply_states_context_hints(
+                select_states_context_only()
+                .where(States.context_id_bin.in_(context_id_bins))
+                .where(States.last_updated_ts <= end_day)
+                .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+            ),
+        ).order_by(Events.time_fired_ts)
+    )
@@ -12,6 +12,7 @@ import voluptuous as vol
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.const import QueryClass
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import InvalidEntityFormatError
@@ -111,4 +112,6 @@ class LogbookView(HomeAssistantView):
             """Fetch events and generate JSON."""
             return self.json(event_processor.get_events(start_day, end_day))
 
-        return await get_instance(hass).async_add_executor_job(json_events)
+        return await get_instance(hass).async_add_read_executor_job(
+            QueryClass.LOGBOOK, json_events
+        )
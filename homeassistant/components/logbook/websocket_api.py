@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.const import QueryClass
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
@@ -163,7 +164,8 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_executor_job(
+        QueryClass.LOGBOOK,
         _ws_stream_get_events,
         msg_id,
         start_time,
@@ -441,6 +443,23 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    limit: int,
+    cursor: tuple[float, int, int] | None,
+    event_processor: EventProcessor,
+) -> bytes:
+    """Fetch a page of events and convert it to json in the executor."""
+    events, next_cursor = event_processor.get_events_page(
+        start_time, end_time, limit, cursor
+    )
+    return json_bytes(
+        messages.result_message(msg_id, {"events": events, "next_cursor": next_cursor})
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -449,14 +468,27 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("cursor"): vol.All(
+            vol.ExactSequence([vol.Coerce(float), vol.In((0, 1)), int]),
+            vol.Coerce(tuple),
+        ),
     }
 )
 @websocket_api.async_response
 async def ws_get_events(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle logbook get events websocket command."""
+    """Handle logbook get events websocket command.
+
+    When a limit is passed, the events are returned in pages. Each page
+    holds the next_cursor to pass as cursor to get the next page.
+    """
     start_time_str = msg["start_time"]
+    limit: int | None = msg.get("limit")
+    empty_result: list[Any] | dict[str, Any] = (
+        {"events": [], "next_cursor": None} if limit else []
+    )
     end_time_str = msg.get("end_time")
     utc_now = dt_util.utcnow()
 
@@ -475,7 +507,7 @@ async def ws_get_events(
         return
 
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        connection.send_result(msg["id"], empty_result)
         return
 
     device_ids = msg.get("device_ids")
@@ -485,7 +517,7 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            connection.send_result(msg["id"], empty_result)
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -500,8 +532,24 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if limit:
+        connection.send_message(
+            await get_instance(hass).async_add_read_executor_job(
+                QueryClass.LOGBOOK,
+                _ws_formatted_get_events_page,
+                msg["id"],
+                start_time,
+                end_time,
+                limit,
+                msg.get("cursor"),
+                event_processor,
+            )
+        )
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
+            QueryClass.LOGBOOK,
             _ws_formatted_get_events,
             msg["id"],
             start_time,
@@ -17,10 +17,17 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    HassJobProfiler,
+    HomeAssistant,
+    ServiceCall,
+    async_get_job_profiler,
+    async_set_job_profiler,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
@@ -40,6 +47,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_TOP_JOBS = "top_jobs"
+SERVICE_SET_SLOW_CALLBACK_THRESHOLD = "set_slow_callback_threshold"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,15 +72,23 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_TOP_JOBS,
+    SERVICE_SET_SLOW_CALLBACK_THRESHOLD,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
 
+DEFAULT_TOP_JOBS = 10
+
+# Same as the asyncio debug slow_callback_duration
+DEFAULT_SLOW_CALLBACK_THRESHOLD = 0.1
+
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_COUNT = "count"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
@@ -85,6 +102,9 @@ async def async_setup_entry(  # noqa: C901
     """Set up Profiler from a config entry."""
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
+    job_profiler = HassJobProfiler(DEFAULT_SLOW_CALLBACK_THRESHOLD)
+    async_set_job_profiler(job_profiler)
+    websocket_api.async_register_command(hass, websocket_top_jobs)
 
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
@@ -260,6 +280,35 @@ async def async_setup_entry(  # noqa: C901
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
+    async def _async_top_jobs(call: ServiceCall) -> None:
+        """Log the jobs that spent the most time in the event loop."""
+        for stats in job_profiler.top_jobs(call.data[CONF_COUNT]):
+            _LOGGER.critical(
+                "Job %s: %d calls, %.3f seconds total, %.3f seconds max",
+                stats.origin,
+                stats.count,
+                stats.total_time,
+                stats.max_time,
+            )
+
+        persistent_notification.async_create(
+            hass,
+            (
+                "The jobs that spent the most time in the event loop have been"
+                " dumped to the log. See [the logs](/config/logs) to review them."
+            ),
+            title="Top jobs completed",
+            notification_id="profile_top_jobs",
+        )
+
+    async def _async_set_slow_callback_threshold(call: ServiceCall) -> None:
+        """Set the time after which a callback is logged as slow."""
+        seconds = call.data[CONF_SECONDS]
+        # Always log this at critical level so we know when
+        # it's been changed when reviewing logs
+        _LOGGER.critical("Setting slow callback threshold to %s seconds", seconds)
+        job_profiler.slow_threshold = seconds
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -382,6 +431,34 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_TOP_JOBS,
+        _async_top_jobs,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_COUNT, default=DEFAULT_TOP_JOBS): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                )
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_SET_SLOW_CALLBACK_THRESHOLD,
+        _async_set_slow_callback_threshold,
+        schema=vol.Schema(
+            {
+                vol.Optional(
+                    CONF_SECONDS, default=DEFAULT_SLOW_CALLBACK_THRESHOLD
+                ): vol.All(vol.Coerce(float), vol.Range(min=0))
+            }
+        ),
+    )
+
     return True
 
 
@@ -389,12 +466,44 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
+    async_set_job_profiler(None)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/top_jobs",
+        vol.Optional(CONF_COUNT, default=DEFAULT_TOP_JOBS): vol.All(
+            int, vol.Range(min=1)
+        ),
+    }
+)
+@callback
+def websocket_top_jobs(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the jobs that spent the most time in the event loop."""
+    if (job_profiler := async_get_job_profiler()) is None:
+        connection.send_error(msg["id"], "not_loaded", "Profiler is not loaded")
+        return
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "origin": stats.origin,
+                "count": stats.count,
+                "total_time": stats.total_time,
+                "max_time": stats.max_time,
+            }
+            for stats in job_profiler.top_jobs(msg[CONF_COUNT])
+        ],
+    )
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
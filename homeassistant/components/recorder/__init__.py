@@ -34,10 +34,12 @@ from .const import (  # noqa: F401
     DOMAIN,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_METHODS,
+    SPILL_DIR,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
 from .core import Recorder
+from .partition import PARTITION_INTERVALS
 from .services import async_register_services
 from .tasks import AddRecorderPlatformTask
 from .util import get_instance
@@ -51,6 +53,10 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_BULK_INSERT_STATES = False
+DEFAULT_DOWNSAMPLE_STATES = False
+DEFAULT_DB_READ_POOL = False
+DEFAULT_SPILL_TO_DISK = False
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
@@ -61,6 +67,11 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT_STATES = "bulk_insert_states"
+CONF_DOWNSAMPLE_STATES = "downsample_states"
+CONF_DB_READ_POOL = "db_read_pool"
+CONF_PARTITION_INTERVAL = "partition_interval"
+CONF_SPILL_TO_DISK = "spill_to_disk"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -104,6 +115,19 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_BULK_INSERT_STATES, default=DEFAULT_BULK_INSERT_STATES
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_DOWNSAMPLE_STATES, default=DEFAULT_DOWNSAMPLE_STATES
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_DB_READ_POOL, default=DEFAULT_DB_READ_POOL
+                    ): cv.boolean,
+                    vol.Optional(CONF_PARTITION_INTERVAL): vol.In(PARTITION_INTERVALS),
+                    vol.Optional(
+                        CONF_SPILL_TO_DISK, default=DEFAULT_SPILL_TO_DISK
+                    ): cv.boolean,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -140,6 +164,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_repack = conf[CONF_AUTO_REPACK]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    bulk_insert_states = conf[CONF_BULK_INSERT_STATES]
+    downsample_states = conf[CONF_DOWNSAMPLE_STATES]
+    db_read_pool = conf[CONF_DB_READ_POOL]
+    partition_interval = PARTITION_INTERVALS.get(conf.get(CONF_PARTITION_INTERVAL))
+    spill_to_disk = conf[CONF_SPILL_TO_DISK]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
@@ -163,6 +192,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        bulk_insert_states=bulk_insert_states,
+        downsample_states=downsample_states,
+        db_read_pool=db_read_pool,
+        partition_interval=partition_interval,
+        spill_path=hass.config.path(SPILL_DIR) if spill_to_disk else None,
     )
     get_instance.cache_clear()
     instance.async_initialize()
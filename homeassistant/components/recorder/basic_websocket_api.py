@@ -37,6 +37,8 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        read_pool = instance.read_pool_info
+        attributes_cache = instance.attributes_cache_info
     else:
         backlog = None
         migration_in_progress = False
@@ -44,12 +46,16 @@ def ws_info(
         recording = False
         is_running = False
         max_backlog = None
+        read_pool = None
+        attributes_cache = None
 
     recorder_info = {
+        "attributes_cache": attributes_cache,
         "backlog": backlog,
         "max_backlog": max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "read_pool": read_pool,
         "recording": recording,
         "thread_running": is_running,
     }
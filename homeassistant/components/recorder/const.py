@@ -30,6 +30,13 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
+# When spilling to disk is enabled, events are written to the spill
+# queue once this many items wait in memory and read back once the
+# backlog has dropped below SPILL_DRAIN_BACKLOG
+SPILL_QUEUE_BACKLOG = 10000
+SPILL_DRAIN_BACKLOG = 1000
+SPILL_DIR = "recorder_spill"
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -45,6 +52,11 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READ_WORKER_PREFIX = "DbReadWorker"
+
+# The read only pool is sized to the number of cores within these bounds
+MIN_DB_READ_WORKERS = 2
+MAX_DB_READ_WORKERS = 8
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
@@ -80,3 +92,12 @@ class SupportedDialect(StrEnum):
     SQLITE = "sqlite"
     MYSQL = "mysql"
     POSTGRESQL = "postgresql"
+
+
+class QueryClass(StrEnum):
+    """Classes of read only queries served by the read only pool."""
+
+    HISTORY = "history"
+    LOGBOOK = "logbook"
+    STATISTICS = "statistics"
+    ENERGY = "energy"
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
 import logging
+import os
 import queue
 import sqlite3
 import threading
@@ -16,7 +17,14 @@ from typing import TYPE_CHECKING, Any, cast
 
 from propcache import cached_property
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -51,18 +59,24 @@ from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
 from .const import (
+    DB_READ_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     KEEPALIVE_TIME,
     LAST_REPORTED_SCHEMA_VERSION,
     MARIADB_PYMYSQL_URL_PREFIX,
     MARIADB_URL_PREFIX,
+    MAX_DB_READ_WORKERS,
     MAX_QUEUE_BACKLOG_MIN_VALUE,
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
+    MIN_DB_READ_WORKERS,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    SPILL_DRAIN_BACKLOG,
+    SPILL_QUEUE_BACKLOG,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
+    QueryClass,
     SupportedDialect,
 )
 from .db_schema import (
@@ -77,7 +91,7 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import DBInterruptibleThreadPoolExecutor, DBReadOnlyThreadPoolExecutor
 from .migration import (
     EntityIDMigration,
     EventIDPostMigration,
@@ -88,6 +102,7 @@ from .migration import (
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import get_migration_changes
+from .spill import SpillQueue
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -100,9 +115,12 @@ from .tasks import (
     AdjustStatisticsTask,
     ChangeStatisticsUnitTask,
     ClearStatisticsTask,
+    ClosePartitionsTask,
     CommitTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
+    DownsampleStatesTask,
+    DrainSpillQueueTask,
     ImportStatisticsTask,
     KeepAliveTask,
     PerodicCleanupTask,
@@ -125,6 +143,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_only_connection_for_dialect,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -148,6 +167,7 @@ DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
+SPILL_CHECK_INTERVAL = timedelta(seconds=10)
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -173,6 +193,11 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        bulk_insert_states: bool,
+        downsample_states: bool,
+        db_read_pool: bool,
+        partition_interval: timedelta | None,
+        spill_path: str | None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -190,6 +215,24 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        # When enabled, states are accumulated as plain rows and written
+        # with a single executemany per commit instead of ORM objects
+        self.bulk_insert_states = bulk_insert_states
+        # When enabled, numeric states are reduced to min/max/last rows
+        # every five minutes for long-range history requests
+        self.downsample_states = downsample_states
+        # When enabled, history, logbook, statistics and energy queries
+        # run on a separate pool of read only connections
+        self.db_read_pool = db_read_pool
+        self.read_worker_thread_ids: set[int] = set()
+        # When set, the states and events tables are partitioned and
+        # purged by dropping partitions older than the retention period
+        self.partition_interval = partition_interval
+        # Only warn once that the database does not support partitioning
+        self.partitioning_unsupported_logged = False
+        # When set, events are spilled to disk instead of growing the
+        # queue while the recorder falls behind
+        self.spill_queue = SpillQueue(spill_path) if spill_path else None
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -200,6 +243,7 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        self.read_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -223,15 +267,18 @@ class Recorder(threading.Thread):
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: DBReadOnlyThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
+        self._spill_watcher: CALLBACK_TYPE | None = None
         self._keep_alive_listener: CALLBACK_TYPE | None = None
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
@@ -269,7 +316,16 @@ class Recorder(threading.Thread):
         return self._event_listener is not None
 
     def get_session(self) -> Session:
-        """Get a new sqlalchemy session."""
+        """Get a new sqlalchemy session.
+
+        Sessions created in the threads of the read only pool are bound
+        to the read only engine.
+        """
+        if (
+            self._get_read_session is not None
+            and threading.get_ident() in self.read_worker_thread_ids
+        ):
+            return self._get_read_session()
         if self._get_session is None:
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
@@ -291,18 +347,75 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        if self._read_pool_supported:
+            self._db_read_executor = DBReadOnlyThreadPoolExecutor(
+                self.read_worker_thread_ids,
+                thread_name_prefix=DB_READ_WORKER_PREFIX,
+                max_workers=self._read_pool_size,
+                shutdown_hook=self._shutdown_read_pool,
+            )
+
+    @property
+    def _read_pool_supported(self) -> bool:
+        """Return if the read only pool is enabled and can be used.
+
+        An in-memory SQLite database only has a single connection.
+        """
+        return self.db_read_pool and not (
+            self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url
+        )
+
+    @property
+    def _read_pool_size(self) -> int:
+        """Return the number of read only connections, sized to the cores."""
+        return min(max(os.cpu_count() or 1, MIN_DB_READ_WORKERS), MAX_DB_READ_WORKERS)
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
         if self.engine and hasattr(self.engine.pool, "shutdown"):
             self.engine.pool.shutdown()
 
+    def _shutdown_read_pool(self) -> None:
+        """Close the read only dbpool connections in the current thread."""
+        if self.read_engine and hasattr(self.read_engine.pool, "shutdown"):
+            self.read_engine.pool.shutdown()
+
+    @property
+    def read_pool_info(self) -> dict[str, Any] | None:
+        """Return the size and queue statistics of the read only pool."""
+        if self._db_read_executor is None:
+            return None
+        return {
+            "workers": self._db_read_executor.max_workers,
+            "active": self._get_read_session is not None,
+            "queues": self._db_read_executor.stats(),
+        }
+
+    @property
+    def attributes_cache_info(self) -> dict[str, Any]:
+        """Return the size and hit counters of the state attributes cache."""
+        return self.state_attributes_manager.cache_info
+
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
         queue_put = self._queue.put_nowait
+        if spill_queue := self.spill_queue:
+            queue_size = self._queue.qsize
+            spill_put = spill_queue.put
+            memory_put = queue_put
+
+            @callback
+            def _queue_or_spill_put(event: Event) -> None:
+                """Put an event in the process queue or spill it to disk."""
+                if spill_queue.active or queue_size() >= SPILL_QUEUE_BACKLOG:
+                    spill_put(event)
+                else:
+                    memory_put(event)
+
+            queue_put = _queue_or_spill_put
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -341,6 +454,13 @@ class Recorder(threading.Thread):
             QUEUE_CHECK_INTERVAL,
             name="Recorder queue watcher",
         )
+        if spill_queue:
+            self._spill_watcher = async_track_time_interval(
+                self.hass,
+                self._async_check_spill_queue,
+                SPILL_CHECK_INTERVAL,
+                name="Recorder spill queue watcher",
+            )
 
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
@@ -365,6 +485,22 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_executor_job[_T](
+        self, query_class: QueryClass, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a read only executor job from within the event loop.
+
+        The job runs in the read only pool when it is available and in
+        the database executor otherwise.
+        """
+        if self._db_read_executor is None or self._get_read_session is None:
+            return self.async_add_executor_job(target, *args)
+        return asyncio.wrap_future(
+            self._db_read_executor.submit_query(query_class, target, *args),
+            loop=self.hass.loop,
+        )
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -385,6 +521,22 @@ class Recorder(threading.Thread):
         )
         self._async_stop_queue_watcher_and_event_listener()
 
+    @callback
+    def _async_check_spill_queue(self, *_: Any) -> None:
+        """Schedule recording the spilled events once the recorder caught up."""
+        spill_queue = self.spill_queue
+        assert spill_queue is not None
+        if (
+            not spill_queue.pending
+            or spill_queue.draining
+            or self._database_lock_task
+            or self.backlog >= SPILL_DRAIN_BACKLOG
+        ):
+            return
+        _LOGGER.debug("Recorder caught up, recording spilled events")
+        spill_queue.begin_drain()
+        self.queue_task(DrainSpillQueueTask())
+
     def _available_memory(self) -> int:
         """Return the available memory in bytes."""
         if not self._psutil:
@@ -407,6 +559,9 @@ class Recorder(threading.Thread):
         if self._queue_watcher:
             self._queue_watcher()
             self._queue_watcher = None
+        if self._spill_watcher:
+            self._spill_watcher()
+            self._spill_watcher = None
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
@@ -513,11 +668,15 @@ class Recorder(threading.Thread):
         Called after all migration steps are finished.
         """
         self._async_setup_periodic_tasks()
+        if self.partition_interval:
+            self.queue_task(ClosePartitionsTask())
         self.async_recorder_ready.set()
 
     @callback
     def async_nightly_tasks(self, now: datetime) -> None:
         """Trigger the purge."""
+        if self.partition_interval:
+            self.queue_task(ClosePartitionsTask())
         if self.auto_purge:
             # Purge will schedule the periodic cleanups
             # after it completes to ensure it does not happen
@@ -533,6 +692,8 @@ class Recorder(threading.Thread):
         """Run tasks every five minutes."""
         self.queue_task(ADJUST_LRU_SIZE_TASK)
         self.async_periodic_statistics()
+        if self.downsample_states:
+            self.queue_task(DownsampleStatesTask(statistics.get_start_time()))
 
     def _adjust_lru_size(self) -> None:
         """Trigger the LRU adjustment.
@@ -544,6 +705,7 @@ class Recorder(threading.Thread):
             self.state_attributes_manager.adjust_lru_size(new_size)
             self.states_meta_manager.adjust_lru_size(new_size)
             self.statistics_meta_manager.adjust_lru_size(new_size)
+        self.state_attributes_manager.adapt_lru_size()
 
     @callback
     def async_periodic_statistics(self) -> None:
@@ -718,6 +880,9 @@ class Recorder(threading.Thread):
         self.thread_id = thread_id
         self.recorder_and_worker_thread_ids.add(thread_id)
 
+        if self.spill_queue:
+            self.spill_queue.open()
+
         setup_result = self._setup_recorder()
 
         if not setup_result:
@@ -787,6 +952,7 @@ class Recorder(threading.Thread):
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
+        self._prime_state_attributes_cache()
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
         self._run_event_loop()
 
@@ -823,12 +989,22 @@ class Recorder(threading.Thread):
         # and not the old ones as soon as the API is available.
         self.hass.add_job(self.async_set_db_ready)
 
+    def _prime_state_attributes_cache(self) -> None:
+        """Prime the state attributes cache so restarts do not start cold."""
+        with session_scope(session=self.get_session(), read_only=True) as session:
+            self.state_attributes_manager.load_recent(session)
+
     def _run_event_loop(self) -> None:
         """Run the event loop for the recorder."""
         # Use a session for the event read loop
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         queue_ = self._queue
+        if self.spill_queue and self.spill_queue.has_recovered_segments:
+            # Events spilled before the last shutdown are older than
+            # anything in the queue so they are recorded first
+            _LOGGER.debug("Recording events spilled before the last shutdown")
+            self._record_spilled_events(self.spill_queue.drain_recovered())
         startup_task_or_events: list[RecorderTask | Event] = []
         while not queue_.empty() and (task_or_event := queue_.get_nowait()):
             startup_task_or_events.append(task_or_event)
@@ -844,8 +1020,16 @@ class Recorder(threading.Thread):
         while not self.stop_requested:
             self._guarded_process_one_task_or_event_or_recover(queue_.get())
 
+    def _record_spilled_events(self, segments: Iterator[list[Event[Any]]]) -> None:
+        """Record spilled events, committing after each segment."""
+        for events in segments:
+            self._pre_process_startup_events(events)
+            for event in events:
+                self._guarded_process_one_task_or_event_or_recover(event)
+            self._commit_event_session_or_retry()
+
     def _pre_process_startup_events(
-        self, startup_task_or_events: list[RecorderTask | Event[Any]]
+        self, startup_task_or_events: Iterable[RecorderTask | Event[Any]]
     ) -> None:
         """Pre process startup events."""
         # Prime all the state_attributes and event_data caches
@@ -1026,7 +1210,10 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
         if event.event_type == EVENT_STATE_CHANGED:
-            self._process_state_changed_event_into_session(event)
+            if self.bulk_insert_states and self.states_meta_manager.active:
+                self._process_state_changed_event_into_pending_rows(event)
+            else:
+                self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
         # Commit if the commit interval is zero
@@ -1162,6 +1349,176 @@ class Recorder(threading.Thread):
 
         self._add_to_session(session, dbstate)
 
+    def _process_state_changed_event_into_pending_rows(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Process a state_changed event into a row for the next bulk insert.
+
+        The metadata_id and attributes_id of the row are resolved in
+        batch by _insert_pending_state_rows when the session is committed.
+        """
+        entity_id = event.data["entity_id"]
+        if entity_id is None or not (
+            shared_attrs_bytes := self.state_attributes_manager.serialize_from_event(
+                event
+            )
+        ):
+            return
+
+        row = States.row_from_event(event)
+        old_state = event.data["old_state"]
+        states_manager = self.states_manager
+        if (pending_row := states_manager.get_pending_row(entity_id)) is not None:
+            # The old_state_id is linked when the pending row is inserted
+            if old_state:
+                pending_row["last_reported_ts"] = old_state.last_reported_timestamp
+        elif old_state_id := states_manager.pop_committed(entity_id):
+            row["old_state_id"] = old_state_id
+            if old_state:
+                states_manager.update_pending_last_reported(
+                    old_state_id, old_state.last_reported_timestamp
+                )
+        states_manager.add_pending_row(entity_id, row, shared_attrs_bytes)
+        self._event_session_has_pending_writes = True
+
+    def _insert_pending_state_rows(self, session: Session) -> None:
+        """Bulk insert the pending state rows.
+
+        The states_meta and state_attributes ids are resolved in batch
+        and any missing ones are flushed before the states are inserted
+        with one executemany per generation. A generation contains at
+        most one row per entity so that rows can be linked to the
+        old_state_id of the previous row for the same entity that was
+        inserted in the previous generation.
+        """
+        states_manager = self.states_manager
+        if not (pending_rows := states_manager.get_pending_rows()):
+            return
+
+        states_meta_manager = self.states_meta_manager
+        state_attributes_manager = self.state_attributes_manager
+        metadata_ids = states_meta_manager.get_many(pending_rows, session, True)
+        new_states_meta: dict[str, StatesMeta] = {}
+        for entity_id, rows in pending_rows.items():
+            if metadata_ids[entity_id] is not None:
+                continue
+            if pending_states_meta := states_meta_manager.get_pending(entity_id):
+                new_states_meta[entity_id] = pending_states_meta
+            elif any(row["state"] is not None for row, _ in rows):
+                # If the entity was only removed, we don't need to add it to the
+                # StatesMeta table since it either never existed or was just renamed.
+                states_meta = StatesMeta(entity_id=entity_id)
+                states_meta_manager.add_pending(states_meta)
+                session.add(states_meta)
+                new_states_meta[entity_id] = states_meta
+
+        shared_attrs_to_hash: dict[str, bytes] = {}
+        attributes_ids: dict[str, int | None] = {}
+        for rows in pending_rows.values():
+            for _, shared_attrs_bytes in rows:
+                shared_attrs = shared_attrs_bytes.decode("utf-8")
+                if (
+                    shared_attrs in attributes_ids
+                    or shared_attrs in shared_attrs_to_hash
+                ):
+                    continue
+                if attributes_id := state_attributes_manager.get_from_cache(
+                    shared_attrs
+                ):
+                    attributes_ids[shared_attrs] = attributes_id
+                else:
+                    shared_attrs_to_hash[shared_attrs] = shared_attrs_bytes
+        new_state_attributes: dict[str, StateAttributes] = {}
+        if shared_attrs_to_hash:
+            hashes = {
+                shared_attrs: StateAttributes.hash_shared_attrs_bytes(
+                    shared_attrs_bytes
+                )
+                for shared_attrs, shared_attrs_bytes in shared_attrs_to_hash.items()
+            }
+            for shared_attrs, attributes_id in state_attributes_manager.get_many(
+                hashes.items(), session
+            ).items():
+                if attributes_id is not None:
+                    attributes_ids[shared_attrs] = attributes_id
+                    continue
+                if not (
+                    dbstate_attributes := state_attributes_manager.get_pending(
+                        shared_attrs
+                    )
+                ):
+                    dbstate_attributes = StateAttributes(
+                        shared_attrs=shared_attrs, hash=hashes[shared_attrs]
+                    )
+                    state_attributes_manager.add_pending(dbstate_attributes)
+                    session.add(dbstate_attributes)
+                new_state_attributes[shared_attrs] = dbstate_attributes
+
+        if new_states_meta or new_state_attributes:
+            # Assign ids to the new StatesMeta and StateAttributes
+            session.flush()
+            for entity_id, states_meta in new_states_meta.items():
+                metadata_ids[entity_id] = states_meta.metadata_id
+            for shared_attrs, dbstate_attributes in new_state_attributes.items():
+                attributes_ids[shared_attrs] = dbstate_attributes.attributes_id
+
+        insertable_rows = [
+            (entity_id, rows)
+            for entity_id, rows in pending_rows.items()
+            if metadata_ids[entity_id] is not None
+        ]
+        last_state_ids: dict[str, int] = {}
+        generation = 0
+        while generation_rows := [
+            (entity_id, rows[generation][0], rows[generation][1])
+            for entity_id, rows in insertable_rows
+            if len(rows) > generation
+        ]:
+            params: list[dict[str, Any]] = []
+            for entity_id, row, shared_attrs_bytes in generation_rows:
+                row["metadata_id"] = metadata_ids[entity_id]
+                row["attributes_id"] = attributes_ids[
+                    shared_attrs_bytes.decode("utf-8")
+                ]
+                if generation:
+                    # Only link to the previous row if the entity was not removed
+                    row["old_state_id"] = last_state_ids.pop(entity_id, None)
+                params.append(row)
+            for (entity_id, row, _), state_id in zip(
+                generation_rows,
+                self._execute_states_insert(session, params),
+                strict=True,
+            ):
+                if row["state"] is not None:
+                    last_state_ids[entity_id] = state_id
+                else:
+                    last_state_ids.pop(entity_id, None)
+            generation += 1
+
+        for entity_id, state_id in last_state_ids.items():
+            states_manager.set_pending_rows_last_state_id(entity_id, state_id)
+
+    def _execute_states_insert(
+        self, session: Session, params: list[dict[str, Any]]
+    ) -> list[int]:
+        """Insert states rows with Core and return their state_ids in order."""
+        assert self.engine is not None
+        connection = session.connection()
+        stmt = insert(States)
+        if self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+            return list(
+                connection.execute(
+                    stmt.returning(States.state_id, sort_by_parameter_order=True),
+                    params,
+                ).scalars()
+            )
+        # The dialect cannot return the ids from an executemany, fallback
+        # to one insert per row which is still cheaper than the ORM
+        return [
+            cast(int, connection.execute(stmt, row).inserted_primary_key[0])
+            for row in params
+        ]
+
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
         if (
@@ -1207,6 +1564,7 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        self._insert_pending_state_rows(session)
 
         if (
             pending_last_reported
@@ -1426,10 +1784,38 @@ class Recorder(threading.Thread):
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        if self._read_pool_supported:
+            self._setup_read_connection(kwargs)
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_connection(self, kwargs: dict[str, Any]) -> None:
+        """Create the engine for the read only pool."""
+        kwargs = {**kwargs, "pool_size": self._read_pool_size}
+        if kwargs.get("poolclass") is RecorderPool:
+            kwargs["recorder_and_worker_thread_ids"] = self.read_worker_thread_ids
+        self.read_engine = create_engine(self.db_url, **kwargs, future=True)
+        sqlalchemy_event.listen(
+            self.read_engine, "connect", self._setup_read_only_connection
+        )
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=self.read_engine, future=True)
+        )
+
+    def _setup_read_only_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings for the read only pool."""
+        assert self.read_engine is not None
+        dialect_name = self.read_engine.dialect.name
+        setup_connection_for_dialect(self, dialect_name, dbapi_connection, False)
+        setup_read_only_connection_for_dialect(dialect_name, dbapi_connection)
+
     def _close_connection(self) -> None:
         """Close the connection."""
+        self._get_read_session = None
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
         if self.engine:
             self.engine.dispose()
             self.engine = None
@@ -1484,8 +1870,16 @@ class Recorder(threading.Thread):
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
                 self._db_executor.shutdown(join_threads_or_timeout=False)
+            if self._db_read_executor:
+                self._db_read_executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
+            if self.spill_queue:
+                # Events still waiting to be spilled are written out
+                # and recorded on the next start
+                self.spill_queue.close()
             if self._db_executor:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
                 self._db_executor.join_threads_or_timeout()
+            if self._db_read_executor:
+                self._db_read_executor.join_threads_or_timeout()
@@ -77,7 +77,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 47
+SCHEMA_VERSION = 49
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -94,6 +94,9 @@ TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 TABLE_MIGRATION_CHANGES = "migration_changes"
+TABLE_STATES_DOWNSAMPLED = "states_downsampled"
+TABLE_STATES_DOWNSAMPLED_SHORT_TERM = "states_downsampled_short_term"
+TABLE_RECORDER_PARTITIONS = "recorder_partitions"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -116,6 +119,9 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATES_DOWNSAMPLED,
+    TABLE_STATES_DOWNSAMPLED_SHORT_TERM,
+    TABLE_RECORDER_PARTITIONS,
 ]
 
 TABLES_TO_CHECK = [
@@ -536,6 +542,47 @@ class States(Base):
             last_reported_ts=last_reported_ts,
         )
 
+    @staticmethod
+    def row_from_event(event: Event[EventStateChangedData]) -> dict[str, Any]:
+        """Create the column values for a bulk insert from a state_changed event.
+
+        Unlike from_event, no ORM object is created and a removed
+        entity is represented by a None state. The metadata_id,
+        attributes_id and old_state_id are resolved by the caller
+        before the row is inserted.
+        """
+        state = event.data["new_state"]
+        if state is None:
+            state_value = None
+            last_updated_ts = event.time_fired_timestamp
+            last_changed_ts = None
+            last_reported_ts = None
+        else:
+            state_value = state.state
+            last_updated_ts = state.last_updated_timestamp
+            if state.last_updated == state.last_changed:
+                last_changed_ts = None
+            else:
+                last_changed_ts = state.last_changed_timestamp
+            if state.last_updated == state.last_reported:
+                last_reported_ts = None
+            else:
+                last_reported_ts = state.last_reported_timestamp
+        context = event.context
+        return {
+            "state": state_value,
+            "context_id_bin": ulid_to_bytes_or_none(context.id),
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+            "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+            "origin_idx": event.origin.idx,
+            "last_updated_ts": last_updated_ts,
+            "last_changed_ts": last_changed_ts,
+            "last_reported_ts": last_reported_ts,
+            "old_state_id": None,
+            "attributes_id": None,
+            "metadata_id": None,
+        }
+
     def to_native(self, validate_entity_id: bool = True) -> State | None:
         """Convert to an HA state object."""
         context = Context(
@@ -668,6 +715,63 @@ class StatesMeta(Base):
         )
 
 
+class StatesDownsampledBase:
+    """Downsampled states base class.
+
+    Holds the minimum and maximum numeric state of an entity and the
+    last numeric state as it was recorded for each bucket of length
+    duration.
+    """
+
+    id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    metadata_id: Mapped[int | None] = mapped_column(
+        ID_TYPE,
+        ForeignKey(f"{TABLE_STATES_META}.metadata_id"),
+    )
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    last: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_STATE))
+
+    duration: timedelta
+
+
+class StatesDownsampled(Base, StatesDownsampledBase):
+    """Downsampled states with one hour buckets."""
+
+    duration = timedelta(hours=1)
+
+    __table_args__ = (
+        # Used for fetching downsampled states for an entity in a time window
+        Index(
+            "ix_states_downsampled_metadata_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATES_DOWNSAMPLED
+
+
+class StatesDownsampledShortTerm(Base, StatesDownsampledBase):
+    """Downsampled states with five minute buckets."""
+
+    duration = timedelta(minutes=5)
+
+    __table_args__ = (
+        # Used for fetching downsampled states for an entity in a time window
+        Index(
+            "ix_states_downsampled_short_term_metadata_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATES_DOWNSAMPLED_SHORT_TERM
+
+
 class StatisticsBase:
     """Statistics base class."""
 
@@ -866,6 +970,34 @@ class MigrationChanges(Base):
     version: Mapped[int] = mapped_column(SmallInteger)
 
 
+class RecorderPartitions(Base):
+    """Representation of a closed partition of the states or events table.
+
+    The partition holds the rows with an id below end_id which were
+    written before end_ts.
+    """
+
+    __tablename__ = TABLE_RECORDER_PARTITIONS
+    __table_args__ = (
+        Index("ix_recorder_partitions_table_name_end_ts", "table_name", "end_ts"),
+        _DEFAULT_TABLE_ARGS,
+    )
+
+    partition_id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    table_name: Mapped[str] = mapped_column(String(64))
+    partition_name: Mapped[str] = mapped_column(String(64))
+    end_id: Mapped[int] = mapped_column(ID_TYPE)
+    end_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.RecorderPartitions(id={self.partition_id},"
+            f" table_name='{self.table_name}', partition_name='{self.partition_name}',"
+            f" end_id={self.end_id})>"
+        )
+
+
 class SchemaChanges(Base):
     """Representation of schema version changes."""
 
@@ -0,0 +1,272 @@
+"""Downsampled states tier for the recorder.
+
+Every five minutes the numeric states recorded during the previous period are
+reduced to one row per entity holding the minimum, maximum and last state,
+and at the end of each hour the five minute rows are rolled up into hourly
+rows. Long-range history requests can then be answered from these tables
+instead of scanning the raw states table.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select
+from sqlalchemy.engine.row import Row
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement, lambda_stmt
+
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.recorder import get_instance
+
+from .db_schema import (
+    States,
+    StatesDownsampled,
+    StatesDownsampledBase,
+    StatesDownsampledShortTerm,
+)
+from .util import execute_stmt_lambda_element, session_scope
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+DOWNSAMPLED_STATE_MIN = "min"
+DOWNSAMPLED_STATE_MAX = "max"
+
+SHORT_TERM_DURATION_S = StatesDownsampledShortTerm.duration.total_seconds()
+HOURLY_DURATION_S = StatesDownsampled.duration.total_seconds()
+
+
+def _float_or_none(state: str | None) -> float | None:
+    """Return the state as a float or None if it is not numeric."""
+    if state is None:
+        return None
+    try:
+        return float(state)
+    except ValueError:
+        return None
+
+
+def _states_in_period_stmt(
+    start_time_ts: float, end_time_ts: float
+) -> StatementLambdaElement:
+    """Generate the statement to fetch all states recorded in a period."""
+    return lambda_stmt(
+        lambda: select(States.metadata_id, States.state)
+        .filter(States.last_updated_ts >= start_time_ts)
+        .filter(States.last_updated_ts < end_time_ts)
+        .filter(States.metadata_id.is_not(None))
+        .order_by(States.metadata_id, States.last_updated_ts)
+    )
+
+
+def _downsampled_rows_in_period_stmt(
+    table: type[StatesDownsampledBase],
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: list[int] | None,
+) -> StatementLambdaElement:
+    """Generate the statement to fetch downsampled rows in a period."""
+    stmt = lambda_stmt(
+        lambda: select(
+            table.metadata_id, table.start_ts, table.min, table.max, table.last
+        )
+        .filter(table.start_ts >= start_time_ts)
+        .filter(table.start_ts < end_time_ts)
+    )
+    if metadata_ids:
+        stmt += lambda q: q.filter(table.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.order_by(table.metadata_id, table.start_ts)
+    return stmt
+
+
+def _period_compiled(
+    session: Session, table: type[StatesDownsampledBase], start_time_ts: float
+) -> bool:
+    """Return True if a period has already been compiled."""
+    return (
+        session.execute(
+            select(table.id).filter(table.start_ts == start_time_ts).limit(1)
+        ).first()
+        is not None
+    )
+
+
+def _compile_short_term(
+    session: Session, start_time_ts: float, end_time_ts: float
+) -> list[StatesDownsampledShortTerm]:
+    """Reduce the states recorded in a five minute period."""
+    compiled: list[StatesDownsampledShortTerm] = []
+    for metadata_id, rows in groupby(
+        execute_stmt_lambda_element(
+            session, _states_in_period_stmt(start_time_ts, end_time_ts)
+        ),
+        itemgetter(0),
+    ):
+        values: list[float] = []
+        last: str | None = None
+        for row in rows:
+            if (value := _float_or_none(row[1])) is not None:
+                values.append(value)
+                last = row[1]
+        if not values:
+            continue
+        compiled.append(
+            StatesDownsampledShortTerm(
+                metadata_id=metadata_id,
+                start_ts=start_time_ts,
+                min=min(values),
+                max=max(values),
+                # Keep the state as recorded so it is served unchanged
+                last=last,
+            )
+        )
+    return compiled
+
+
+def _compile_hourly(
+    session: Session, start_time_ts: float, end_time_ts: float
+) -> list[StatesDownsampled]:
+    """Roll up the five minute rows of an hour."""
+    compiled: list[StatesDownsampled] = []
+    for metadata_id, group in groupby(
+        execute_stmt_lambda_element(
+            session,
+            _downsampled_rows_in_period_stmt(
+                StatesDownsampledShortTerm, start_time_ts, end_time_ts, None
+            ),
+        ),
+        itemgetter(0),
+    ):
+        rows = list(group)
+        compiled.append(
+            StatesDownsampled(
+                metadata_id=metadata_id,
+                start_ts=start_time_ts,
+                min=min(row[2] for row in rows),
+                max=max(row[3] for row in rows),
+                last=rows[-1][4],
+            )
+        )
+    return compiled
+
+
+def compile_downsampled_states(instance: Recorder, start: datetime) -> None:
+    """Compile the downsampled states for the five minute period starting at start.
+
+    When the period is the last one of an hour, the hourly rows are
+    compiled as well.
+    """
+    end = start + StatesDownsampledShortTerm.duration
+    start_ts = start.timestamp()
+    with session_scope(session=instance.get_session()) as session:
+        if not _period_compiled(session, StatesDownsampledShortTerm, start_ts):
+            session.add_all(_compile_short_term(session, start_ts, end.timestamp()))
+            session.flush()
+        if end.minute != 0:
+            return
+        hour_start_ts = (end - StatesDownsampled.duration).timestamp()
+        if not _period_compiled(session, StatesDownsampled, hour_start_ts):
+            session.add_all(_compile_hourly(session, hour_start_ts, end.timestamp()))
+
+
+def _rebucket(
+    rows: Iterable[Row],
+    start_time_ts: float,
+    bucket_width_s: float,
+) -> list[dict[str, Any]]:
+    """Merge downsampled rows of one entity into buckets of bucket_width_s."""
+    buckets: dict[int, list[Any]] = {}
+    for _, row_start_ts, row_min, row_max, row_last in rows:
+        bucket = max(int((row_start_ts - start_time_ts) // bucket_width_s), 0)
+        if (values := buckets.get(bucket)) is None:
+            buckets[bucket] = [row_min, row_max, row_last]
+            continue
+        values[0] = min(row_min, values[0])
+        values[1] = max(row_max, values[1])
+        values[2] = row_last
+    return [
+        {
+            COMPRESSED_STATE_STATE: bucket_last,
+            COMPRESSED_STATE_LAST_UPDATED: start_time_ts + bucket * bucket_width_s,
+            DOWNSAMPLED_STATE_MIN: bucket_min,
+            DOWNSAMPLED_STATE_MAX: bucket_max,
+        }
+        for bucket, (bucket_min, bucket_max, bucket_last) in buckets.items()
+    ]
+
+
+def get_downsampled_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: Sequence[str],
+    max_points: int,
+) -> dict[str, list[dict[str, Any]]] | None:
+    """Return at most max_points downsampled points per entity.
+
+    Each point is a compressed state with the last value in the bucket as
+    state, the start of the bucket as last_updated and the minimum and
+    maximum values in the bucket. Entities without downsampled data are
+    left out of the result.
+
+    Returns None when the requested resolution is finer than the five
+    minute tier, in which case the raw states should be used instead.
+    """
+    start_time_ts = start_time.timestamp()
+    end_time_ts = end_time.timestamp()
+    bucket_width_s = (end_time_ts - start_time_ts) / max_points
+    if bucket_width_s < SHORT_TERM_DURATION_S:
+        return None
+    instance = get_instance(hass)
+    if not instance.states_meta_manager.active:
+        return None
+    with session_scope(hass=hass, read_only=True) as session:
+        metadata_id_to_entity_id = {
+            metadata_id: entity_id
+            for entity_id, metadata_id in instance.states_meta_manager.get_many(
+                entity_ids, session, False
+            ).items()
+            if metadata_id is not None
+        }
+        if not metadata_id_to_entity_id:
+            return {}
+        metadata_ids = list(metadata_id_to_entity_id)
+        rows: list[Row] = []
+        short_term_start_ts = start_time_ts
+        if bucket_width_s >= HOURLY_DURATION_S:
+            rows = list(
+                execute_stmt_lambda_element(
+                    session,
+                    _downsampled_rows_in_period_stmt(
+                        StatesDownsampled, start_time_ts, end_time_ts, metadata_ids
+                    ),
+                )
+            )
+            # The hour in progress is only available in the short term table
+            if rows:
+                short_term_start_ts = max(row[1] for row in rows) + HOURLY_DURATION_S
+        rows = [
+            *rows,
+            *execute_stmt_lambda_element(
+                session,
+                _downsampled_rows_in_period_stmt(
+                    StatesDownsampledShortTerm,
+                    short_term_start_ts,
+                    end_time_ts,
+                    metadata_ids,
+                ),
+            ),
+        ]
+    rows.sort(key=itemgetter(0, 1))
+    return {
+        metadata_id_to_entity_id[metadata_id]: _rebucket(
+            group, start_time_ts, bucket_width_s
+        )
+        for metadata_id, group in groupby(rows, itemgetter(0))
+    }
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable
-from concurrent.futures.thread import _threads_queues, _worker
+from concurrent.futures import Future
+from concurrent.futures.thread import _threads_queues, _worker, _WorkItem
+import queue
 import threading
+import time
 from typing import Any
 import weakref
 
 from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
+from .const import QueryClass
+
 
 def _worker_with_shutdown_hook(
     shutdown_hook: Callable[[], None],
@@ -71,3 +77,145 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
             executor_thread.start()
             self._threads.add(executor_thread)  # type: ignore[attr-defined]
             _threads_queues[executor_thread] = self._work_queue  # type: ignore[index]
+
+
+class _QueryJob:
+    """A job tagged with the class of query it runs."""
+
+    __slots__ = ("args", "query_class", "target")
+
+    def __init__(
+        self, query_class: QueryClass, target: Callable[..., Any], args: tuple[Any, ...]
+    ) -> None:
+        """Init the job."""
+        self.query_class = query_class
+        self.target = target
+        self.args = args
+
+    def __call__(self) -> Any:
+        """Run the job."""
+        return self.target(*self.args)
+
+
+class QueryClassStats:
+    """Queue wait time statistics of a query class."""
+
+    __slots__ = ("max_wait", "pending", "served", "total_wait")
+
+    def __init__(self) -> None:
+        """Init the statistics."""
+        self.pending = 0
+        self.served = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        return {
+            "pending": self.pending,
+            "served": self.served,
+            "wait_time_avg": self.total_wait / self.served if self.served else 0.0,
+            "wait_time_max": self.max_wait,
+        }
+
+
+class QueryClassQueue:
+    """A work queue with a queue per query class.
+
+    Workers take jobs from the query classes in turn so a burst of
+    queries of one class cannot starve the others. The wake-up
+    sentinels used by the executor on shutdown are served first.
+    """
+
+    def __init__(self) -> None:
+        """Init the queue."""
+        self._not_empty = threading.Condition(threading.Lock())
+        self._queues: dict[QueryClass, deque[tuple[float, _WorkItem]]] = {
+            query_class: deque() for query_class in QueryClass
+        }
+        self._order = list(QueryClass)
+        self._next = 0
+        self._sentinels = 0
+        self.stats = {query_class: QueryClassStats() for query_class in QueryClass}
+
+    def put(self, work_item: _WorkItem | None) -> None:
+        """Add a work item to the queue of its query class."""
+        with self._not_empty:
+            if work_item is None:
+                self._sentinels += 1
+            else:
+                query_class: QueryClass = work_item.fn.query_class
+                self._queues[query_class].append((time.monotonic(), work_item))
+                self.stats[query_class].pending += 1
+            self._not_empty.notify()
+
+    def _get(self) -> _WorkItem | None:
+        """Take the next work item, the lock must be held."""
+        if self._sentinels:
+            self._sentinels -= 1
+            return None
+        order = self._order
+        for offset in range(len(order)):
+            query_class = order[(self._next + offset) % len(order)]
+            if work_queue := self._queues[query_class]:
+                self._next = (self._next + offset + 1) % len(order)
+                queued_at, work_item = work_queue.popleft()
+                wait = time.monotonic() - queued_at
+                stats = self.stats[query_class]
+                stats.pending -= 1
+                stats.served += 1
+                stats.total_wait += wait
+                stats.max_wait = max(wait, stats.max_wait)
+                return work_item
+        raise queue.Empty
+
+    def get(self, block: bool = True) -> _WorkItem | None:
+        """Take the next work item, waiting for one if block is True."""
+        with self._not_empty:
+            while True:
+                try:
+                    return self._get()
+                except queue.Empty:
+                    if not block:
+                        raise
+                self._not_empty.wait()
+
+    def get_nowait(self) -> _WorkItem | None:
+        """Take the next work item without waiting."""
+        return self.get(block=False)
+
+    def stats_as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the queue wait time statistics per query class."""
+        with self._not_empty:
+            return {
+                query_class: stats.as_dict()
+                for query_class, stats in self.stats.items()
+            }
+
+
+class DBReadOnlyThreadPoolExecutor(DBInterruptibleThreadPoolExecutor):
+    """A database executor for read only queries with a queue per query class."""
+
+    _work_queue: QueryClassQueue  # type: ignore[assignment]
+
+    def __init__(
+        self, recorder_and_worker_thread_ids: set[int], *args: Any, **kwargs: Any
+    ) -> None:
+        """Init the executor with a queue per query class."""
+        super().__init__(recorder_and_worker_thread_ids, *args, **kwargs)
+        self._work_queue = QueryClassQueue()
+
+    def submit_query[_T](
+        self, query_class: QueryClass, target: Callable[..., _T], *args: Any
+    ) -> Future[_T]:
+        """Submit a job to the queue of a query class."""
+        return self.submit(_QueryJob(query_class, target, args))
+
+    @property
+    def max_workers(self) -> int:
+        """Return the maximum number of workers."""
+        return self._max_workers
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the queue wait time statistics per query class."""
+        return self._work_queue.stats_as_dict()
@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
 
+from ..const import SupportedDialect
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    TimeWeightedAggregate,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columnar_chunks as _modern_get_significant_states_columnar_chunks,
+    get_significant_states_time_weighted_aggregates_with_session as _modern_get_significant_states_time_weighted_aggregates_with_session,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -24,9 +30,12 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "TimeWeightedAggregate",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columnar_chunks",
+    "get_significant_states_time_weighted_aggregates_with_session",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -115,6 +124,77 @@ def get_significant_states(
     )
 
 
+def get_significant_states_columnar_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    chunk_size: int,
+) -> Iterator[tuple[str, list[float], list[str | None]]]:
+    """Yield significant state changes as per entity columnar chunks."""
+    if get_instance(hass).states_meta_manager.active:
+        yield from _modern_get_significant_states_columnar_chunks(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            chunk_size,
+        )
+        return
+
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    # The legacy schema cannot be streamed so we split the full result instead
+    for entity_id, states in _legacy_get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        True,
+        True,
+        True,
+    ).items():
+        for idx in range(0, len(states), chunk_size):
+            chunk: list[dict[str, Any]] = states[idx : idx + chunk_size]  # type: ignore[assignment]
+            yield (
+                entity_id,
+                [state[COMPRESSED_STATE_LAST_UPDATED] for state in chunk],
+                [state[COMPRESSED_STATE_STATE] for state in chunk],
+            )
+
+
+def get_significant_states_time_weighted_aggregates_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+) -> dict[str, TimeWeightedAggregate]:
+    """Return aggregates of the numeric significant states during a period.
+
+    The aggregates are only calculated in the database with the modern schema
+    on SQLite and PostgreSQL, an empty dict is returned otherwise.
+    """
+    instance = get_instance(hass)
+    if not instance.states_meta_manager.active or instance.dialect_name not in (
+        SupportedDialect.SQLITE,
+        SupportedDialect.POSTGRESQL,
+    ):
+        return {}
+    return _modern_get_significant_states_time_weighted_aggregates_with_session(
+        hass, session, start_time, end_time, entity_ids
+    )
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
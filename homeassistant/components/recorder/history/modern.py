@@ -3,31 +3,43 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
-from datetime import datetime
+from datetime import datetime, timedelta
 from itertools import groupby
 from operator import itemgetter
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 from sqlalchemy import (
+    ColumnElement,
     CompoundSelect,
+    Float,
     Select,
     Subquery,
     and_,
+    case,
+    cast as sql_cast,
+    distinct,
     func,
     lambda_stmt,
     literal,
+    not_,
+    or_,
     select,
     union_all,
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 from homeassistant.helpers.recorder import get_instance
 import homeassistant.util.dt as dt_util
 
-from ..const import LAST_REPORTED_SCHEMA_VERSION
+from ..const import LAST_REPORTED_SCHEMA_VERSION, SupportedDialect
 from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, States
 from ..filters import Filters
 from ..models import (
@@ -51,6 +63,28 @@ _FIELD_MAP = {
     "last_updated_ts": 2,
 }
 
+# Only plain decimals are aggregated in the database, the length is limited
+# so every match converts to a finite float with CAST as well as with float()
+NUMERIC_STATE_PATTERN = r"^-?[0-9]+(\.[0-9]+)?$"
+NUMERIC_STATE_MAX_LENGTH = 32
+
+
+class TimeWeightedAggregate(NamedTuple):
+    """Aggregates of the numeric significant states of an entity.
+
+    Time points are integer microseconds clamped to the start of the period.
+    """
+
+    min: float
+    max: float
+    first_us: float
+    weighted_sum: float
+    unparsed_states: int
+    states_without_attributes: int
+    states_updated_at_same_time: int
+    attribute_sets: int
+    attributes: str | None
+
 
 def _stmt_and_join_attributes(
     no_attributes: bool,
@@ -135,6 +169,29 @@ def get_significant_states(
         )
 
 
+def get_significant_states_columnar_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    chunk_size: int,
+) -> Iterator[tuple[str, list[float], list[str | None]]]:
+    """Wrap get_significant_states_columnar_chunks_with_session with an sql session."""
+    with session_scope(hass=hass, read_only=True) as session:
+        yield from get_significant_states_columnar_chunks_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            chunk_size,
+        )
+
+
 def _significant_states_stmt(
     start_time_ts: float,
     end_time_ts: float | None,
@@ -229,6 +286,94 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        executed := _execute_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+            False,
+        )
+    ):
+        return {}
+    rows, entity_id_to_metadata_id, start_time_ts = executed
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_columnar_chunks_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    chunk_size: int,
+) -> Iterator[tuple[str, list[float], list[str | None]]]:
+    """Yield significant state changes as per entity columnar chunks.
+
+    Each chunk is a tuple of the entity_id and the parallel arrays of
+    last_updated timestamps and states with at most chunk_size items.
+    Only state changes are included since attributes are not fetched.
+
+    For time windows longer than a day the rows are consumed from the
+    cursor as the chunks are yielded so the whole result set is never
+    held in memory.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        executed := _execute_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            True,
+            True,
+        )
+    ):
+        return
+    rows, entity_id_to_metadata_id, start_time_ts = executed
+    yield from _sorted_states_to_columnar_chunks(
+        rows, start_time_ts, entity_id_to_metadata_id, chunk_size
+    )
+
+
+def _execute_significant_states_stmt(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    yield_rows: bool,
+) -> tuple[Iterable[Row], dict[str, int | None], float | None] | None:
+    """Execute the significant states query.
+
+    Returns the rows sorted by metadata_id and last_updated_ts, the
+    entity_id to metadata_id map and the start time timestamp if the
+    start time state is included or None if there is nothing to fetch.
+
+    If yield_rows is set, the rows of time windows longer than a day
+    are fetched from the cursor in batches instead of all at once.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -237,7 +382,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +420,16 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        execute_stmt_lambda_element(
+            session,
+            stmt,
+            start_time if yield_rows else None,
+            end_time,
+            orm_rows=False,
+        ),
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
@@ -319,6 +466,162 @@ def get_full_significant_states_with_session(
     )
 
 
+def _is_numeric_state(state: ColumnElement[str], sqlite: bool) -> ColumnElement[bool]:
+    """Return a clause matching states which are plain decimals.
+
+    SQLite calls back into Python for REGEXP, the same pattern is matched
+    with native GLOB comparisons instead.
+    """
+    if not sqlite:
+        is_decimal = state.regexp_match(NUMERIC_STATE_PATTERN)
+    else:
+        is_decimal = and_(
+            state.op("GLOB")("*[0-9]"),
+            or_(state.op("GLOB")("[0-9]*"), state.op("GLOB")("-[0-9]*")),
+            not_(state.op("GLOB")("*[^0-9.-]*")),
+            not_(state.op("GLOB")("?*-*")),
+            not_(state.op("GLOB")("*.*.*")),
+        )
+    return and_(is_decimal, func.length(state) <= NUMERIC_STATE_MAX_LENGTH)
+
+
+def _time_weighted_aggregates_stmt(
+    significant_states: Select | CompoundSelect,
+    start_us: float,
+    end_us: float,
+    sqlite: bool,
+) -> Select:
+    """Aggregate the numeric states of each entity in the database.
+
+    The durations are calculated with a single window over the states of each
+    entity, the weighted sum is aggregated over the rows in the order of the
+    window which is the order the time weighted average in Python uses.
+    """
+    states = significant_states.subquery()
+    is_numeric = case((_is_numeric_state(states.c.state, sqlite), 1), else_=0)
+    updated_us = func.round(states.c.last_updated_ts * 1_000_000, type_=Float)
+    numeric_states = select(
+        states.c.metadata_id,
+        states.c.state,
+        states.c.last_updated_ts,
+        states.c.attributes,
+        is_numeric.label("is_numeric"),
+        case((is_numeric == 1, sql_cast(states.c.state, Float))).label("value"),
+        case((updated_us < start_us, start_us), else_=updated_us).label("time_us"),
+    ).subquery()
+    durations = select(
+        numeric_states,
+        func.lead(numeric_states.c.time_us, 1, end_us)
+        .over(
+            partition_by=(numeric_states.c.metadata_id, numeric_states.c.is_numeric),
+            order_by=numeric_states.c.last_updated_ts,
+        )
+        .label("next_us"),
+    ).subquery()
+    numeric = durations.c.is_numeric == 1
+    numeric_attributes = case((numeric, durations.c.attributes))
+    return select(
+        durations.c.metadata_id,
+        func.min(durations.c.value),
+        func.max(durations.c.value),
+        func.min(case((numeric, durations.c.time_us))),
+        func.sum(
+            durations.c.value
+            * ((durations.c.next_us - durations.c.time_us) / 1_000_000.0)
+        ),
+        func.sum(
+            case(
+                (
+                    (durations.c.is_numeric == 0)
+                    & durations.c.state.not_in((STATE_UNKNOWN, STATE_UNAVAILABLE)),
+                    1,
+                ),
+                else_=0,
+            )
+        ),
+        func.sum(durations.c.is_numeric) - func.count(numeric_attributes),
+        func.sum(durations.c.is_numeric)
+        - func.count(distinct(case((numeric, durations.c.last_updated_ts)))),
+        func.count(distinct(numeric_attributes)),
+        func.min(numeric_attributes),
+    ).group_by(durations.c.metadata_id)
+
+
+def get_significant_states_time_weighted_aggregates_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+) -> dict[str, TimeWeightedAggregate]:
+    """Aggregate the significant states of entities during a statistics period.
+
+    The states are the same as returned by get_full_significant_states_with_session
+    for the time period starting one microsecond before start_time. Entities
+    without numeric states are not included in the result.
+
+    Only plain decimal states are aggregated, the number of other states which
+    are not unknown or unavailable is returned so the caller can fall back to
+    parsing the states in Python. The order of states updated at the same time
+    is not defined, the caller should fall back as well if there are any.
+    """
+    if not (
+        entity_id_to_metadata_id := get_instance(hass).states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+    ) or not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+        return {}
+    metadata_ids_in_significant_domains = [
+        metadata_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+        and split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS
+    ]
+    query_start_time = start_time - timedelta.resolution
+    run_start_ts = _get_run_start_ts_for_utc_point_in_time(hass, query_start_time)
+    include_start_time_state = bool(run_start_ts)
+    start_time_ts = dt_util.utc_to_timestamp(query_start_time)
+    end_time_ts = dt_util.utc_to_timestamp(end_time)
+    start_us = float(round(start_time.timestamp() * 1_000_000))
+    end_us = float(round(end_time.timestamp() * 1_000_000))
+    single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    sqlite = get_instance(hass).dialect_name == SupportedDialect.SQLITE
+    stmt = lambda_stmt(
+        lambda: _time_weighted_aggregates_stmt(
+            _significant_states_stmt(
+                start_time_ts,
+                end_time_ts,
+                single_metadata_id,
+                metadata_ids,
+                metadata_ids_in_significant_domains,
+                True,
+                False,
+                include_start_time_state,
+                run_start_ts,
+            ),
+            start_us,
+            end_us,
+            sqlite,
+        ),
+        track_on=[
+            sqlite,
+            bool(single_metadata_id),
+            bool(metadata_ids_in_significant_domains),
+            include_start_time_state,
+        ],
+    )
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    return {
+        metadata_id_to_entity_id[row[0]]: TimeWeightedAggregate(*row[1:])
+        for row in execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        if row[1] is not None
+    }
+
+
 def _state_changed_during_period_stmt(
     start_time_ts: float,
     end_time_ts: float | None,
@@ -816,3 +1119,40 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columnar_chunks(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_id_to_metadata_id: dict[str, int | None],
+    chunk_size: int,
+) -> Iterator[tuple[str, list[float], list[str | None]]]:
+    """Convert SQL results into per entity columnar chunks.
+
+    States must be sorted by metadata_id and last_updated. Consecutive
+    rows with the same state are skipped since only the state is
+    returned, the same as minimal_response does.
+    """
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    for metadata_id, group in groupby(states, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        prev_state: str | None = None
+        timestamps: list[float] = []
+        ent_states: list[str | None] = []
+        for idx, row in enumerate(group):
+            if (state := row[state_idx]) == prev_state and idx:
+                continue
+            prev_state = state
+            # The start time state is selected with a last_updated_ts of 0
+            timestamps.append(row[last_updated_ts_idx] or start_time_ts)
+            ent_states.append(state)
+            if len(ent_states) == chunk_size:
+                yield entity_id, timestamps, ent_states
+                timestamps = []
+                ent_states = []
+        if ent_states:
+            yield entity_id, timestamps, ent_states
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Any, cast, final
 from uuid import UUID
 
 import sqlalchemy
-from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, text, update
+from sqlalchemy import ForeignKeyConstraint, MetaData, Table, delete, func, text, update
 from sqlalchemy.engine import CursorResult, Engine
 from sqlalchemy.exc import (
     DatabaseError,
@@ -29,9 +29,11 @@ from sqlalchemy.sql.expression import true
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
 
+from . import partition
 from .auto_repairs.events.schema import (
     correct_db_schema as events_correct_db_schema,
     validate_db_schema as events_validate_db_schema,
@@ -65,14 +67,18 @@ from .db_schema import (
     MYSQL_DEFAULT_CHARSET,
     SCHEMA_VERSION,
     STATISTICS_TABLES,
+    TABLE_EVENTS,
     TABLE_STATES,
     Base,
     Events,
     EventTypes,
     LegacyBase,
     MigrationChanges,
+    RecorderPartitions,
     SchemaChanges,
     States,
+    StatesDownsampled,
+    StatesDownsampledShortTerm,
     StatesMeta,
     Statistics,
     StatisticsMeta,
@@ -246,6 +252,7 @@ def _find_schema_errors(
     schema_errors |= statistics_validate_db_schema(instance)
     schema_errors |= states_validate_db_schema(instance)
     schema_errors |= events_validate_db_schema(instance)
+    schema_errors |= _find_partitioning_errors(instance, session_maker)
     return schema_errors
 
 
@@ -346,6 +353,7 @@ def migrate_schema_live(
         statistics_correct_db_schema(instance, schema_errors)
         states_correct_db_schema(instance, schema_errors)
         events_correct_db_schema(instance, schema_errors)
+        _correct_partitioning(instance, engine, session_maker, schema_errors)
 
     return schema_status
 
@@ -1687,6 +1695,15 @@ FOREIGN_COLUMNS = (
     ),
 )
 
+# Partitioned tables cannot have foreign keys on MySQL/MariaDB, and foreign keys
+# referencing a partitioned table block dropping its partitions on PostgreSQL
+PARTITIONED_FOREIGN_COLUMNS = [
+    (table, column, foreign_table, foreign_column)
+    for table, _, foreign_mappings in FOREIGN_COLUMNS
+    if table in (TABLE_EVENTS, TABLE_STATES)
+    for column, foreign_table, foreign_column in foreign_mappings
+]
+
 
 class _SchemaVersion46Migrator(_SchemaVersionMigrator, target_version=46):
     def _apply_update(self) -> None:
@@ -1758,6 +1775,266 @@ class _SchemaVersion47Migrator(_SchemaVersionMigrator, target_version=47):
         )
 
 
+class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # Add the downsampled states tables
+        cast(Table, StatesDownsampledShortTerm.__table__).create(
+            self.engine, checkfirst=True
+        )
+        cast(Table, StatesDownsampled.__table__).create(self.engine, checkfirst=True)
+
+
+class _SchemaVersion49Migrator(_SchemaVersionMigrator, target_version=49):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # Add the table keeping track of the closed partitions
+        cast(Table, RecorderPartitions.__table__).create(self.engine, checkfirst=True)
+        if _partitioning_configured(self.instance, self.engine):
+            _partition_tables(self.engine, self.session_maker)
+
+
+def _partitioning_configured(instance: Recorder, engine: Engine) -> bool:
+    """Return if the states and events tables should be partitioned."""
+    return (
+        instance.partition_interval is not None
+        and engine.dialect.name in partition.SUPPORTED_DIALECTS
+    )
+
+
+def _find_partitioning_errors(
+    instance: Recorder, session_maker: Callable[[], Session]
+) -> set[str]:
+    """Find tables which are not partitioned as configured."""
+    assert instance.engine is not None
+    dialect_name = instance.engine.dialect.name
+    if dialect_name not in partition.SUPPORTED_DIALECTS:
+        return set()
+    configured = _partitioning_configured(instance, instance.engine)
+    with session_scope(session=session_maker(), read_only=True) as session:
+        return {
+            f"{table.name}.partitioning"
+            for table in partition.PARTITIONED_TABLES
+            if partition.is_partitioned(session, dialect_name, table.name)
+            is not configured
+        }
+
+
+def _correct_partitioning(
+    instance: Recorder,
+    engine: Engine,
+    session_maker: Callable[[], Session],
+    schema_errors: set[str],
+) -> None:
+    """Partition the tables or remove their partitions as configured."""
+    if not any(
+        f"{table.name}.partitioning" in schema_errors
+        for table in partition.PARTITIONED_TABLES
+    ):
+        return
+    if _partitioning_configured(instance, engine):
+        _partition_tables(engine, session_maker)
+    else:
+        _unpartition_tables(engine, session_maker)
+
+
+def _partition_tables(engine: Engine, session_maker: Callable[[], Session]) -> None:
+    """Partition the states and events tables.
+
+    The foreign keys in PARTITIONED_FOREIGN_COLUMNS are dropped first, the
+    recorder does not rely on them, purge disconnects and cleans up references
+    itself. The first partition holds all existing rows.
+    """
+    dialect_name = engine.dialect.name
+    for table_name, column, _, _ in PARTITIONED_FOREIGN_COLUMNS:
+        _drop_foreign_key_constraints(session_maker, engine, table_name, column)
+    now = dt_util.utcnow()
+    name = partition.partition_name(now)
+    for table in partition.PARTITIONED_TABLES:
+        with session_scope(session=session_maker()) as session:
+            if partition.is_partitioned(session, dialect_name, table.name):
+                continue
+            _LOGGER.warning(
+                "Partitioning the %s table. %s", table.name, MIGRATION_NOTE_WHILE
+            )
+            end_id = partition.next_id(session, table)
+            if dialect_name == SupportedDialect.MYSQL:
+                _partition_mysql_table(session, table, name, end_id)
+            else:
+                _partition_postgresql_table(session, table, name, end_id)
+            session.add(
+                RecorderPartitions(
+                    table_name=table.name,
+                    partition_name=name,
+                    end_id=end_id,
+                    end_ts=now.timestamp(),
+                )
+            )
+
+
+def _partition_mysql_table(
+    session: Session, table: partition.PartitionedTable, name: str, end_id: int
+) -> None:
+    """Partition a MySQL/MariaDB table.
+
+    This rebuilds the table and can take a long time for large tables.
+    """
+    session.execute(
+        text(
+            f"ALTER TABLE {table.name} PARTITION BY RANGE ({table.id_column}) ("
+            f"PARTITION {name} VALUES LESS THAN ({end_id}), "
+            f"PARTITION {partition.FUTURE_PARTITION} VALUES LESS THAN MAXVALUE)"
+        )
+    )
+
+
+def _partition_postgresql_table(
+    session: Session, table: partition.PartitionedTable, name: str, end_id: int
+) -> None:
+    """Partition a PostgreSQL table.
+
+    PostgreSQL cannot partition an existing table, so the table becomes
+    the first partition of a new partitioned table with the same name.
+    Attaching it reuses its indexes and only needs to validate the range.
+    """
+    partition_table = f"{table.name}_{name}"
+    sequence = f"{table.name}_{table.id_column}_partitioned_seq"
+    session.execute(text(f"ALTER TABLE {table.name} RENAME TO {partition_table}"))
+    # A partition cannot have its own identity column, new ids
+    # come from a sequence on the partitioned table instead
+    session.execute(
+        text(
+            f"ALTER TABLE {partition_table} ALTER COLUMN {table.id_column} "
+            "DROP IDENTITY IF EXISTS"
+        )
+    )
+    session.execute(
+        text(
+            f"ALTER TABLE {partition_table} "
+            f"RENAME CONSTRAINT {table.name}_pkey TO {partition_table}_pkey"
+        )
+    )
+    sa_table = Base.metadata.tables[table.name]
+    for index in sa_table.indexes:
+        session.execute(
+            text(f"ALTER INDEX IF EXISTS {index.name} RENAME TO {index.name}_{name}")
+        )
+    session.execute(
+        text(
+            f"CREATE TABLE {table.name} (LIKE {partition_table} INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE ({table.id_column})"
+        )
+    )
+    session.execute(
+        text(f"CREATE SEQUENCE {sequence} START WITH {end_id} OWNED BY NONE")
+    )
+    session.execute(
+        text(
+            f"ALTER TABLE {table.name} ALTER COLUMN {table.id_column} "
+            f"SET DEFAULT nextval('{sequence}')"
+        )
+    )
+    session.execute(
+        text(f"ALTER SEQUENCE {sequence} OWNED BY {table.name}.{table.id_column}")
+    )
+    session.execute(
+        text(f"ALTER TABLE {table.name} ADD PRIMARY KEY ({table.id_column})")
+    )
+    connection = session.connection()
+    for index in sa_table.indexes:
+        index.create(connection)
+    session.execute(
+        text(
+            f"ALTER TABLE {table.name} ATTACH PARTITION {partition_table} "
+            f"FOR VALUES FROM (MINVALUE) TO ({end_id})"
+        )
+    )
+    session.execute(
+        text(
+            f"CREATE TABLE {table.name}_{partition.FUTURE_PARTITION} "
+            f"PARTITION OF {table.name} FOR VALUES FROM ({end_id}) TO (MAXVALUE)"
+        )
+    )
+
+
+def _unpartition_tables(engine: Engine, session_maker: Callable[[], Session]) -> None:
+    """Convert the partitioned states and events tables back to plain tables.
+
+    This is the way back from partitioning: remove partition_interval from the
+    recorder configuration and restart. All rows which have not been purged are
+    kept and the foreign keys in PARTITIONED_FOREIGN_COLUMNS are restored.
+    """
+    dialect_name = engine.dialect.name
+    for table in partition.PARTITIONED_TABLES:
+        with session_scope(session=session_maker()) as session:
+            if partition.is_partitioned(session, dialect_name, table.name):
+                _LOGGER.warning(
+                    "Removing the partitions of the %s table. %s",
+                    table.name,
+                    MIGRATION_NOTE_WHILE,
+                )
+                if dialect_name == SupportedDialect.MYSQL:
+                    session.execute(
+                        text(f"ALTER TABLE {table.name} REMOVE PARTITIONING")
+                    )
+                else:
+                    _unpartition_postgresql_table(session, table)
+            session.execute(
+                delete(RecorderPartitions).where(
+                    RecorderPartitions.table_name == table.name
+                )
+            )
+    _restore_foreign_key_constraints(session_maker, engine, PARTITIONED_FOREIGN_COLUMNS)
+
+
+def _unpartition_postgresql_table(
+    session: Session, table: partition.PartitionedTable
+) -> None:
+    """Copy a partitioned PostgreSQL table to a new plain table.
+
+    PostgreSQL cannot turn a partitioned table back into a plain table, so
+    the rows are copied to a new table with the same name and the partitioned
+    table is dropped with its partitions afterwards.
+    """
+    partitioned = f"{table.name}_partitioned"
+    session.execute(text(f"ALTER TABLE {table.name} RENAME TO {partitioned}"))
+    session.execute(
+        text(
+            f"ALTER TABLE {partitioned} "
+            f"RENAME CONSTRAINT {table.name}_pkey TO {partitioned}_pkey"
+        )
+    )
+    sa_table = Base.metadata.tables[table.name]
+    for index in sa_table.indexes:
+        session.execute(
+            text(f"ALTER INDEX IF EXISTS {index.name} RENAME TO {index.name}_old")
+        )
+    session.execute(text(f"CREATE TABLE {table.name} (LIKE {partitioned})"))
+    session.execute(
+        text(
+            f"ALTER TABLE {table.name} ALTER COLUMN {table.id_column} "
+            "ADD GENERATED BY DEFAULT AS IDENTITY"
+        )
+    )
+    session.execute(
+        text(f"INSERT INTO {table.name} SELECT * FROM {partitioned}")  # noqa: S608
+    )
+    session.execute(
+        text(
+            f"SELECT setval(pg_get_serial_sequence('{table.name}', "  # noqa: S608
+            f"'{table.id_column}'), (SELECT COALESCE(MAX({table.id_column}), 0) + 1 "
+            f"FROM {table.name}), false)"
+        )
+    )
+    session.execute(
+        text(f"ALTER TABLE {table.name} ADD PRIMARY KEY ({table.id_column})")
+    )
+    connection = session.connection()
+    for index in sa_table.indexes:
+        index.create(connection)
+    session.execute(text(f"DROP TABLE {partitioned}"))
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
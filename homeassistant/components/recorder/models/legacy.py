@@ -114,6 +114,17 @@ class LegacyLazyState(State):
         """Set last updated datetime."""
         self._last_updated_ts = process_timestamp(value).timestamp()
 
+    @property  # type: ignore[override]
+    def last_updated_timestamp(self) -> float:
+        """Last updated timestamp."""
+        assert self._last_updated_ts is not None
+        return self._last_updated_ts
+
+    @last_updated_timestamp.setter
+    def last_updated_timestamp(self, value: float) -> None:
+        """Set last updated timestamp."""
+        self._last_updated_ts = value
+
     def as_dict(self) -> dict[str, Any]:  # type: ignore[override]
         """Return a dict representation of the LazyState.
 
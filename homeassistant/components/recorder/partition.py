@@ -0,0 +1,276 @@
+"""Partitioning of the states and events tables.
+
+On MySQL/MariaDB and PostgreSQL the states and events tables can be split
+into range partitions on their primary key. A partition is closed every
+day or week, and because ids are handed out in the order rows are written
+a closed partition only holds rows written before it was closed. Purging
+then drops whole partitions once they are older than the retention period
+instead of deleting rows in batches.
+
+The tables are converted by the schema migration when partition_interval
+is configured, and converted back to unpartitioned tables, restoring their
+foreign keys, when the option is removed again. See migration.py for the
+conversion, this module only closes and drops partitions.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm.session import Session
+
+from homeassistant.util import dt as dt_util
+
+from .const import SupportedDialect
+from .db_schema import (
+    TABLE_EVENTS,
+    TABLE_STATES,
+    Base,
+    Events,
+    RecorderPartitions,
+    States,
+)
+from .util import retryable_database_job, session_scope
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+PARTITION_INTERVALS = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+}
+
+# The nightly task may run a little earlier than the day before
+ROLLOVER_SLACK = timedelta(hours=1)
+
+# The partition new rows are written to
+FUTURE_PARTITION = "pfuture"
+
+SUPPORTED_DIALECTS = (SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL)
+
+
+@dataclass(slots=True, frozen=True)
+class PartitionedTable:
+    """A table that can be partitioned on its primary key."""
+
+    name: str
+    id_column: str
+
+
+PARTITIONED_TABLES = (
+    PartitionedTable(TABLE_STATES, "state_id"),
+    PartitionedTable(TABLE_EVENTS, "event_id"),
+)
+
+
+def partition_name(closed: datetime) -> str:
+    """Return the name of a partition closed at a point in time."""
+    return f"p{closed:%Y%m%d%H%M}"
+
+
+def next_id(session: Session, table: PartitionedTable) -> int:
+    """Return the first id that will be written after the current rows."""
+    column = Base.metadata.tables[table.name].c[table.id_column]
+    return (session.execute(select(func.max(column))).scalar() or 0) + 1
+
+
+def is_partitioned(session: Session, dialect_name: str, table: str) -> bool:
+    """Return if a table is partitioned."""
+    if dialect_name == SupportedDialect.MYSQL:
+        return bool(
+            session.execute(
+                text(
+                    "SELECT COUNT(*) FROM information_schema.partitions "
+                    "WHERE table_schema = DATABASE() AND table_name = :table "
+                    "AND partition_name IS NOT NULL"
+                ),
+                {"table": table},
+            ).scalar()
+        )
+    return (
+        session.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": table},
+        ).scalar()
+        == "p"
+    )
+
+
+def _rollover_mysql(
+    session: Session, table: PartitionedTable, name: str, start_id: int, end_id: int
+) -> None:
+    """Close the future partition of a MySQL/MariaDB table.
+
+    Only the rows written since the last rollover are moved.
+    """
+    session.execute(
+        text(
+            f"ALTER TABLE {table.name} REORGANIZE PARTITION {FUTURE_PARTITION} INTO ("
+            f"PARTITION {name} VALUES LESS THAN ({end_id}), "
+            f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN MAXVALUE)"
+        )
+    )
+
+
+def _rollover_postgresql(
+    session: Session, table: PartitionedTable, name: str, start_id: int, end_id: int
+) -> None:
+    """Close the future partition of a PostgreSQL table.
+
+    Only the rows written since the last rollover are validated
+    when the partition is attached again with its final range.
+    """
+    future = f"{table.name}_{FUTURE_PARTITION}"
+    partition = f"{table.name}_{name}"
+    session.execute(text(f"ALTER TABLE {table.name} DETACH PARTITION {future}"))
+    session.execute(text(f"ALTER TABLE {future} RENAME TO {partition}"))
+    session.execute(
+        text(
+            f"ALTER TABLE {table.name} ATTACH PARTITION {partition} "
+            f"FOR VALUES FROM ({start_id}) TO ({end_id})"
+        )
+    )
+    session.execute(
+        text(
+            f"CREATE TABLE {future} PARTITION OF {table.name} "
+            f"FOR VALUES FROM ({end_id}) TO (MAXVALUE)"
+        )
+    )
+
+
+def _drop_partition(
+    session: Session, dialect_name: str, table_name: str, name: str
+) -> None:
+    """Drop a closed partition."""
+    if dialect_name == SupportedDialect.MYSQL:
+        session.execute(text(f"ALTER TABLE {table_name} DROP PARTITION {name}"))
+    else:
+        session.execute(text(f"DROP TABLE {table_name}_{name}"))
+
+
+def _last_partition(session: Session, table_name: str) -> RecorderPartitions | None:
+    """Return the most recently closed partition of a table."""
+    return session.scalars(
+        select(RecorderPartitions)
+        .filter(RecorderPartitions.table_name == table_name)
+        .order_by(RecorderPartitions.end_ts.desc())
+        .limit(1)
+    ).first()
+
+
+def _partitioning_supported(instance: Recorder) -> bool:
+    """Return if the database supports partitioning."""
+    if instance.dialect_name in SUPPORTED_DIALECTS:
+        return True
+    log = _LOGGER.debug if instance.partitioning_unsupported_logged else _LOGGER.warning
+    instance.partitioning_unsupported_logged = True
+    log(
+        "Partitioning the states and events tables is only supported with "
+        "MySQL, MariaDB and PostgreSQL, not with %s",
+        instance.dialect_name,
+    )
+    return False
+
+
+@retryable_database_job("close partitions")
+def close_partitions(instance: Recorder, interval: timedelta) -> bool:
+    """Close the partitions of the states and events tables when due."""
+    if not _partitioning_supported(instance):
+        return True
+    assert instance.engine is not None
+    dialect_name = instance.engine.dialect.name
+    now = dt_util.utcnow()
+    name = partition_name(now)
+    for table in PARTITIONED_TABLES:
+        with session_scope(session=instance.get_session()) as session:
+            if not (last := _last_partition(session, table.name)):
+                # The schema migration has not partitioned the table
+                continue
+            if (
+                now.timestamp() - last.end_ts
+                < (interval - ROLLOVER_SLACK).total_seconds()
+            ):
+                continue
+            end_id = next_id(session, table)
+            if end_id <= last.end_id:
+                # Nothing has been written since the last rollover
+                continue
+            if dialect_name == SupportedDialect.MYSQL:
+                _rollover_mysql(session, table, name, last.end_id, end_id)
+            else:
+                _rollover_postgresql(session, table, name, last.end_id, end_id)
+            _LOGGER.debug("Closed partition %s of %s", name, table.name)
+            session.add(
+                RecorderPartitions(
+                    table_name=table.name,
+                    partition_name=name,
+                    end_id=end_id,
+                    end_ts=now.timestamp(),
+                )
+            )
+    return True
+
+
+def tables_partitioned(instance: Recorder, session: Session) -> bool:
+    """Return if the states and events tables have been partitioned."""
+    return (
+        instance.partition_interval is not None
+        and instance.dialect_name in SUPPORTED_DIALECTS
+        and session.execute(select(RecorderPartitions.partition_id).limit(1)).first()
+        is not None
+    )
+
+
+def find_expired_partitions(
+    session: Session, table_name: str, purge_before: datetime
+) -> list[RecorderPartitions]:
+    """Return the closed partitions of a table which are older than purge_before."""
+    return list(
+        session.scalars(
+            select(RecorderPartitions)
+            .filter(RecorderPartitions.table_name == table_name)
+            .filter(RecorderPartitions.end_ts < purge_before.timestamp())
+            .order_by(RecorderPartitions.end_ts)
+        )
+    )
+
+
+def drop_partition(
+    instance: Recorder, session: Session, partition: RecorderPartitions
+) -> None:
+    """Drop a closed partition and forget about it."""
+    assert instance.engine is not None
+    start = time.monotonic()
+    _drop_partition(
+        session,
+        instance.engine.dialect.name,
+        partition.table_name,
+        partition.partition_name,
+    )
+    session.delete(partition)
+    _LOGGER.debug(
+        "Dropped partition %s of %s in %.3fs",
+        partition.partition_name,
+        partition.table_name,
+        time.monotonic() - start,
+    )
+
+
+def ids_in_partitions(session: Session, table_name: str, end_id: int) -> set[int]:
+    """Return the attributes or data ids used by rows below end_id."""
+    if table_name == TABLE_STATES:
+        stmt = select(States.attributes_id).filter(States.state_id < end_id)
+    else:
+        stmt = select(Events.data_id).filter(Events.event_id < end_id)
+    return {
+        shared_id
+        for (shared_id,) in session.execute(stmt.distinct())
+        if shared_id is not None
+    }
@@ -13,7 +13,16 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
-from .db_schema import Events, States, StatesMeta
+from . import partition
+from .db_schema import (
+    TABLE_EVENTS,
+    TABLE_STATES,
+    Events,
+    States,
+    StatesDownsampled,
+    StatesDownsampledShortTerm,
+    StatesMeta,
+)
 from .models import DatabaseEngine
 from .queries import (
     attributes_ids_exist_in_states,
@@ -25,11 +34,14 @@ from .queries import (
     delete_event_types_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
+    delete_states_downsampled_rows_for_metadata_ids,
+    delete_states_downsampled_short_term_rows,
     delete_states_meta_rows,
     delete_states_rows,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    disconnect_states_rows_before_id,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -37,6 +49,7 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_short_term_downsampled_states_to_purge,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -80,6 +93,9 @@ def purge_old_data(
                 " remaining"
             )
             has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+        elif partition.tables_partitioned(instance, session):
+            _LOGGER.debug("Purge running by dropping partitions")
+            _purge_expired_partitions(instance, session, purge_before)
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id"
@@ -99,13 +115,24 @@ def purge_old_data(
         short_term_statistics = _select_short_term_statistics_to_purge(
             session, purge_before, instance.max_bind_vars
         )
+        short_term_downsampled = _select_short_term_downsampled_states_to_purge(
+            session, purge_before, instance.max_bind_vars
+        )
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
 
-        if has_more_to_purge or statistics_runs or short_term_statistics:
+        if short_term_downsampled:
+            _purge_short_term_downsampled_states(session, short_term_downsampled)
+
+        if (
+            has_more_to_purge
+            or statistics_runs
+            or short_term_statistics
+            or short_term_downsampled
+        ):
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
@@ -128,6 +155,32 @@ def purge_old_data(
     return True
 
 
+def _purge_expired_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> None:
+    """Drop the partitions of the states and events tables older than purge_before.
+
+    Rows in partitions which are not fully expired are kept until their
+    partition expires, so nothing is deleted row by row.
+    """
+    for expired in partition.find_expired_partitions(
+        session, TABLE_STATES, purge_before
+    ):
+        end_id = expired.end_id
+        attributes_ids = partition.ids_in_partitions(session, TABLE_STATES, end_id)
+        partition.drop_partition(instance, session, expired)
+        session.execute(disconnect_states_rows_before_id(end_id))
+        instance.states_manager.evict_purged_state_ids_before(end_id)
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+    for expired in partition.find_expired_partitions(
+        session, TABLE_EVENTS, purge_before
+    ):
+        data_ids = partition.ids_in_partitions(session, TABLE_EVENTS, expired.end_id)
+        partition.drop_partition(instance, session, expired)
+        _purge_unused_data_ids(instance, session, data_ids)
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
@@ -454,6 +507,19 @@ def _select_short_term_statistics_to_purge(
     return [statistic_id for (statistic_id,) in statistics]
 
 
+def _select_short_term_downsampled_states_to_purge(
+    session: Session, purge_before: datetime, max_bind_vars: int
+) -> list[int]:
+    """Return a list of short term downsampled states to purge."""
+    downsampled = session.execute(
+        find_short_term_downsampled_states_to_purge(purge_before, max_bind_vars)
+    ).all()
+    _LOGGER.debug(
+        "Selected %s short term downsampled states to remove", len(downsampled)
+    )
+    return [downsampled_id for (downsampled_id,) in downsampled]
+
+
 def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -570,6 +636,29 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
+def _purge_short_term_downsampled_states(
+    session: Session, short_term_downsampled: list[int]
+) -> None:
+    """Delete by id."""
+    deleted_rows = session.execute(
+        delete_states_downsampled_short_term_rows(short_term_downsampled)
+    )
+    _LOGGER.debug("Deleted %s short term downsampled states", deleted_rows)
+
+
+def _purge_downsampled_states_for_metadata_ids(
+    session: Session, metadata_ids: list[int], purge_before_timestamp: float
+) -> None:
+    """Delete the downsampled states of metadata_ids before purge_before_timestamp."""
+    for table in (StatesDownsampledShortTerm, StatesDownsampled):
+        deleted_rows = session.execute(
+            delete_states_downsampled_rows_for_metadata_ids(
+                table, metadata_ids, purge_before_timestamp
+            )
+        )
+        _LOGGER.debug("Deleted %s rows from %s", deleted_rows, table.__tablename__)
+
+
 def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
@@ -640,7 +729,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     # Check if excluded entity_ids are in database
     entity_filter = instance.entity_filter
     has_more_states_to_purge = False
-    excluded_metadata_ids: list[str] = [
+    excluded_metadata_ids: list[int] = [
         metadata_id
         for (metadata_id, entity_id) in session.query(
             StatesMeta.metadata_id, StatesMeta.entity_id
@@ -676,7 +765,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 def _purge_filtered_states(
     instance: Recorder,
     session: Session,
-    metadata_ids_to_purge: list[str],
+    metadata_ids_to_purge: list[int],
     database_engine: DatabaseEngine,
     purge_before_timestamp: float,
 ) -> bool:
@@ -695,6 +784,11 @@ def _purge_filtered_states(
         .all()
     )
     if not to_purge:
+        # The downsampled states are purged last so the states meta
+        # rows can be purged once the entity has no rows left
+        _purge_downsampled_states_for_metadata_ids(
+            session, metadata_ids_to_purge, purge_before_timestamp
+        )
         return True
     state_ids, attributes_ids, event_ids = zip(*to_purge, strict=False)
     filtered_event_ids = {id_ for id_ in event_ids if id_ is not None}
@@ -774,7 +868,7 @@ def purge_entity_data(
     assert database_engine is not None
     purge_before_timestamp = purge_before.timestamp()
     with session_scope(session=instance.get_session()) as session:
-        selected_metadata_ids: list[str] = [
+        selected_metadata_ids: list[int] = [
             metadata_id
             for (metadata_id, entity_id) in session.query(
                 StatesMeta.metadata_id, StatesMeta.entity_id
@@ -17,6 +17,9 @@ from .db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    StatesDownsampled,
+    StatesDownsampledBase,
+    StatesDownsampledShortTerm,
     StatesMeta,
     Statistics,
     StatisticsRuns,
@@ -44,6 +47,28 @@ def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def find_recent_shared_attributes(limit: int) -> StatementLambdaElement:
+    """Find the shared attributes of the most recently recorded states."""
+    # Join because This version of MariaDB doesn't yet support 'LIMIT & IN/ALL/ANY/SOME subquery'
+    return lambda_stmt(
+        lambda: select(
+            StateAttributes.attributes_id, StateAttributes.shared_attrs
+        ).join(
+            recent_attributes_ids := select(
+                distinct(
+                    select(States.attributes_id.label("recent_attributes_id"))
+                    .order_by(States.state_id.desc())
+                    .limit(limit)
+                    .subquery()
+                    .c.recent_attributes_id
+                ).label("recent_attributes_id")
+            ).subquery(),
+            StateAttributes.attributes_id
+            == recent_attributes_ids.c.recent_attributes_id,
+        )
+    )
+
+
 def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     """Load shared event data from the database."""
     return lambda_stmt(
@@ -540,6 +565,17 @@ def disconnect_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     )
 
 
+def disconnect_states_rows_before_id(end_id: int) -> StatementLambdaElement:
+    """Disconnect states rows from the states with an id below end_id."""
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.state_id >= end_id)
+        .where(States.old_state_id < end_id)
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     """Delete states rows."""
     return lambda_stmt(
@@ -591,6 +627,17 @@ def delete_statistics_short_term_rows(
     )
 
 
+def delete_states_downsampled_short_term_rows(
+    short_term_downsampled: Iterable[int],
+) -> StatementLambdaElement:
+    """Delete states_downsampled_short_term rows."""
+    return lambda_stmt(
+        lambda: delete(StatesDownsampledShortTerm)
+        .where(StatesDownsampledShortTerm.id.in_(short_term_downsampled))
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_rows(
     event_ids: Iterable[int],
 ) -> StatementLambdaElement:
@@ -648,6 +695,32 @@ def find_short_term_statistics_to_purge(
     )
 
 
+def delete_states_downsampled_rows_for_metadata_ids(
+    table: type[StatesDownsampledBase],
+    metadata_ids: Iterable[int],
+    purge_before_ts: float,
+) -> StatementLambdaElement:
+    """Delete downsampled states rows of metadata_ids which start before purge_before_ts."""
+    return lambda_stmt(
+        lambda: delete(table)
+        .where(table.metadata_id.in_(metadata_ids))
+        .where(table.start_ts < purge_before_ts)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_short_term_downsampled_states_to_purge(
+    purge_before: datetime, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find short term downsampled states to purge."""
+    purge_before_ts = purge_before.timestamp()
+    return lambda_stmt(
+        lambda: select(StatesDownsampledShortTerm.id)
+        .filter(StatesDownsampledShortTerm.start_ts < purge_before_ts)
+        .limit(max_bind_vars)
+    )
+
+
 def find_statistics_runs_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -845,13 +918,23 @@ def find_event_types_to_purge() -> StatementLambdaElement:
 
 
 def find_entity_ids_to_purge() -> StatementLambdaElement:
-    """Find entity_ids to purge."""
+    """Find entity_ids to purge.
+
+    Entity ids which still have downsampled states are kept since the
+    hourly downsampled states outlive the states they were compiled from.
+    """
     return lambda_stmt(
         lambda: select(StatesMeta.metadata_id, StatesMeta.entity_id).where(
             StatesMeta.metadata_id.not_in(
                 select(StatesMeta.metadata_id).join(
-                    used_states_metadata_id := select(
-                        distinct(States.metadata_id).label("used_states_metadata_id")
+                    used_states_metadata_id := union_all(
+                        select(
+                            distinct(States.metadata_id).label(
+                                "used_states_metadata_id"
+                            )
+                        ),
+                        select(distinct(StatesDownsampledShortTerm.metadata_id)),
+                        select(distinct(StatesDownsampled.metadata_id)),
                     ).subquery(),
                     StatesMeta.metadata_id
                     == used_states_metadata_id.c.used_states_metadata_id,
@@ -0,0 +1,326 @@
+"""Disk backed spill queue for the recorder.
+
+When the recorder falls behind, events are appended to segment files on
+disk instead of growing the in-memory queue. Each record in a segment is a
+little endian length prefix followed by the JSON serialized event. Once the
+recorder has caught up, the sealed segments are read back through mmap,
+recorded in order and removed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+from typing import IO, Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".seg"
+SEGMENT_MAX_BYTES = 4 * 1024**2
+
+_HEADER = struct.Struct("<I")
+_ORIGINS = tuple(EventOrigin)
+
+
+def _context_to_list(context: Context) -> list[str | None]:
+    """Serialize a context."""
+    return [context.id, context.user_id, context.parent_id]
+
+
+def _context_from_list(context: list[str | None]) -> Context:
+    """Deserialize a context."""
+    return Context(id=context[0], user_id=context[1], parent_id=context[2])
+
+
+def _state_to_list(state: State | None) -> list[Any] | None:
+    """Serialize a state with everything the recorder needs to write it."""
+    if state is None:
+        return None
+    return [
+        state.entity_id,
+        state.state,
+        state.attributes,
+        state.last_changed_timestamp,
+        state.last_updated_timestamp,
+        state.last_reported_timestamp,
+        _context_to_list(state.context),
+        list(state_info["unrecorded_attributes"])
+        if (state_info := state.state_info)
+        else None,
+    ]
+
+
+def _state_from_list(state: list[Any] | None) -> State | None:
+    """Deserialize a state."""
+    if state is None:
+        return None
+    (
+        entity_id,
+        state_str,
+        attributes,
+        last_changed_ts,
+        last_updated_ts,
+        last_reported_ts,
+        context,
+        unrecorded_attributes,
+    ) = state
+    return State(
+        entity_id,
+        state_str,
+        attributes,
+        last_changed=dt_util.utc_from_timestamp(last_changed_ts),
+        last_reported=dt_util.utc_from_timestamp(last_reported_ts),
+        last_updated=dt_util.utc_from_timestamp(last_updated_ts),
+        context=_context_from_list(context),
+        validate_entity_id=False,
+        state_info={"unrecorded_attributes": frozenset(unrecorded_attributes)}
+        if unrecorded_attributes is not None
+        else None,
+        last_updated_timestamp=last_updated_ts,
+    )
+
+
+def event_to_bytes(event: Event[Any]) -> bytes:
+    """Serialize an event for the spill queue."""
+    data = event.data
+    if event.event_type == EVENT_STATE_CHANGED:
+        data = {
+            "entity_id": data["entity_id"],
+            "old_state": _state_to_list(data["old_state"]),
+            "new_state": _state_to_list(data["new_state"]),
+        }
+    return json_bytes(
+        [
+            event.event_type,
+            data,
+            event.origin.idx,
+            event.time_fired_timestamp,
+            _context_to_list(event.context),
+        ]
+    )
+
+
+def event_from_bytes(raw: bytes) -> Event[Any]:
+    """Deserialize an event from the spill queue."""
+    event_type, data, origin_idx, time_fired_ts, context = json_loads(raw)
+    if event_type == EVENT_STATE_CHANGED:
+        data["old_state"] = _state_from_list(data["old_state"])
+        data["new_state"] = _state_from_list(data["new_state"])
+    return Event(
+        event_type,
+        data,
+        _ORIGINS[origin_idx],
+        time_fired_ts,
+        _context_from_list(context),
+    )
+
+
+def _read_segment(path: str) -> list[Event[Any]]:
+    """Read all complete records from a segment file."""
+    events: list[Event[Any]] = []
+    with open(path, "rb") as file:
+        if not (size := os.fstat(file.fileno()).st_size):
+            return events
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as segment:
+            offset = 0
+            while offset + _HEADER.size <= size:
+                (length,) = _HEADER.unpack_from(segment, offset)
+                start = offset + _HEADER.size
+                if start + length > size:
+                    break
+                offset = start + length
+                try:
+                    events.append(event_from_bytes(segment[start:offset]))
+                except ValueError:
+                    _LOGGER.exception("Skipping unreadable spilled event in %s", path)
+    if offset != size:
+        # The last record was only partly written before a crash
+        _LOGGER.warning("Spill segment %s was truncated at %s bytes", path, offset)
+    return events
+
+
+class _SegmentSeal:
+    """Request to close the segment being written."""
+
+    __slots__ = ("last_segment", "sealed")
+
+    def __init__(self) -> None:
+        """Initialize the seal request."""
+        self.last_segment = -1
+        self.sealed = threading.Event()
+
+
+class SpillQueue:
+    """Append-only segment files holding events waiting to be recorded.
+
+    Events are handed to a writer thread so the event loop never touches
+    the disk. The recorder thread reads the segments back with drain
+    after begin_drain has been called in the event loop.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the spill queue."""
+        self.path = path
+        # Set while new events are routed to disk instead of memory
+        self.active = False
+        # Set while the recorder thread reads back sealed segments
+        self.draining = False
+        self._pending = False
+        self._queue: queue.SimpleQueue[Event[Any] | _SegmentSeal | None] = (
+            queue.SimpleQueue()
+        )
+        self._writer: threading.Thread | None = None
+        self._file: IO[bytes] | None = None
+        self._file_size = 0
+        self._next_segment = 0
+        self._recovered_segment = -1
+        self._seal: _SegmentSeal | None = None
+
+    @property
+    def pending(self) -> bool:
+        """Return if events have been spilled since the last drain."""
+        return self._pending
+
+    @property
+    def has_recovered_segments(self) -> bool:
+        """Return if segments were left over from a previous run."""
+        return self._recovered_segment >= 0
+
+    def open(self) -> None:
+        """Open the spill directory and start the writer thread."""
+        os.makedirs(self.path, exist_ok=True)
+        if segments := self._segments():
+            self._recovered_segment = segments[-1][0]
+            self._next_segment = self._recovered_segment + 1
+        self._writer = threading.Thread(
+            target=self._run_writer, name="RecorderSpill", daemon=True
+        )
+        self._writer.start()
+
+    def close(self) -> None:
+        """Write out the remaining events and stop the writer thread."""
+        if self._writer is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+
+    def put(self, event: Event[Any]) -> None:
+        """Spill an event to disk.
+
+        Must be called from the event loop.
+        """
+        self.active = True
+        self._pending = True
+        self._queue.put_nowait(event)
+
+    def begin_drain(self) -> None:
+        """Route new events to memory again and seal the current segment.
+
+        Must be called from the event loop before the recorder thread
+        calls drain so new events are recorded after the spilled ones.
+        """
+        self.active = False
+        self._pending = False
+        self.draining = True
+        self._seal = _SegmentSeal()
+        self._queue.put_nowait(self._seal)
+
+    def drain(self) -> Iterator[list[Event[Any]]]:
+        """Yield the events of each sealed segment, oldest first.
+
+        A segment is removed when the next one is requested, so the
+        caller must have recorded the events by then.
+        """
+        assert self._seal is not None
+        seal = self._seal
+        seal.sealed.wait()
+        try:
+            yield from self._drain_segments(seal.last_segment)
+        finally:
+            self._seal = None
+            self.draining = False
+
+    def drain_recovered(self) -> Iterator[list[Event[Any]]]:
+        """Yield the events of the segments left over from a previous run."""
+        last_segment = self._recovered_segment
+        self._recovered_segment = -1
+        yield from self._drain_segments(last_segment)
+
+    def _segments(self) -> list[tuple[int, str]]:
+        """Return the segment files in the spill directory in order."""
+        return sorted(
+            (int(name.removesuffix(SEGMENT_SUFFIX)), os.path.join(self.path, name))
+            for name in os.listdir(self.path)
+            if name.endswith(SEGMENT_SUFFIX)
+        )
+
+    def _drain_segments(self, last_segment: int) -> Iterator[list[Event[Any]]]:
+        """Yield the events of the segments up to last_segment and remove them."""
+        for segment, path in self._segments():
+            if segment > last_segment:
+                break
+            yield _read_segment(path)
+            os.unlink(path)
+
+    def _run_writer(self) -> None:
+        """Append the spilled events to the segment files."""
+        queue_ = self._queue
+        while (item := queue_.get()) is not None:
+            if type(item) is Event:
+                self._write(item)
+                if self._file and queue_.empty():
+                    self._file.flush()
+                continue
+            assert isinstance(item, _SegmentSeal)
+            self._close_segment()
+            item.last_segment = self._next_segment - 1
+            item.sealed.set()
+        self._close_segment()
+
+    def _write(self, event: Event[Any]) -> None:
+        """Append an event to the current segment."""
+        try:
+            payload = event_to_bytes(event)
+        except TypeError:
+            _LOGGER.exception("Event is not JSON serializable and was not spilled")
+            return
+        try:
+            if self._file is None:
+                self._file = open(  # noqa: SIM115
+                    os.path.join(
+                        self.path, f"{self._next_segment:010d}{SEGMENT_SUFFIX}"
+                    ),
+                    "ab",
+                )
+                self._next_segment += 1
+            self._file.write(_HEADER.pack(len(payload)))
+            self._file.write(payload)
+        except OSError:
+            _LOGGER.exception("Error writing event to the spill queue")
+            return
+        self._file_size += _HEADER.size + len(payload)
+        if self._file_size >= SEGMENT_MAX_BYTES:
+            self._close_segment()
+
+    def _close_segment(self) -> None:
+        """Close the segment being written."""
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+        except OSError:
+            _LOGGER.exception("Error closing spill segment")
+        self._file = None
+        self._file_size = 0
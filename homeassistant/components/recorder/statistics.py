@@ -11,8 +11,10 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
-from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
+import threading
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypedDict, cast
 
+from lru import LRU
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
@@ -54,6 +56,7 @@ from .const import (
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
+    QueryClass,
     SupportedDialect,
 )
 from .db_schema import (
@@ -156,6 +159,10 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_DURING_PERIOD_CACHE = "recorder_statistics_during_period_cache"
+
+# The number of statistics_during_period results to cache
+STATISTICS_DURING_PERIOD_CACHE_SIZE = 128
 
 
 def mean(values: list[float]) -> float | None:
@@ -199,6 +206,108 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+class _CachedStatistics(NamedTuple):
+    """A cached statistics_during_period result."""
+
+    metadata_ids: frozenset[int]
+    # None if the period has no end
+    end_ts: float | None
+    result: dict[str, list[StatisticsRow]]
+
+
+class StatisticsDuringPeriodCache:
+    """Cache for statistics_during_period results.
+
+    A result is invalidated when statistics for one of its metadata_ids
+    change at or before the end of its period. Changes are collected by
+    the recorder thread with add_pending and applied with invalidate_pending
+    once they are committed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._results: LRU[tuple[Any, ...], _CachedStatistics] = LRU(
+            STATISTICS_DURING_PERIOD_CACHE_SIZE
+        )
+        self._pending: dict[int, float] = {}
+        # Bumped on every invalidation so results read from the
+        # database before the invalidation are not cached
+        self.generation = 0
+
+    def get(self, key: tuple[Any, ...]) -> dict[str, list[StatisticsRow]] | None:
+        """Return a copy of the cached result for the key."""
+        with self._lock:
+            if (cached := self._results.get(key)) is None:
+                return None
+        return _copy_statistics_result(cached.result)
+
+    def set(
+        self,
+        key: tuple[Any, ...],
+        generation: int,
+        metadata_ids: frozenset[int],
+        end_ts: float | None,
+        result: dict[str, list[StatisticsRow]],
+    ) -> None:
+        """Cache a copy of a result read at generation."""
+        cached = _CachedStatistics(
+            metadata_ids, end_ts, _copy_statistics_result(result)
+        )
+        with self._lock:
+            if generation == self.generation:
+                self._results[key] = cached
+
+    def add_pending(self, metadata_ids: Iterable[int], start_ts: float) -> None:
+        """Record that statistics of metadata_ids changed from start_ts.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        pending = self._pending
+        for metadata_id in metadata_ids:
+            if (pending_ts := pending.get(metadata_id)) is None or (
+                start_ts < pending_ts
+            ):
+                pending[metadata_id] = start_ts
+
+    def invalidate_pending(self) -> None:
+        """Drop the results affected by the pending changes.
+
+        This call is not thread-safe and must be called from the
+        recorder thread after the changes have been committed.
+        """
+        if not (pending := self._pending):
+            return
+        self._pending = {}
+        with self._lock:
+            self.generation += 1
+            results = self._results
+            for key, cached in results.items():
+                affected = cached.metadata_ids.intersection(pending)
+                if any(
+                    cached.end_ts is None or cached.end_ts > pending[metadata_id]
+                    for metadata_id in affected
+                ):
+                    del results[key]
+
+    def clear(self) -> None:
+        """Drop all results."""
+        with self._lock:
+            self.generation += 1
+            self._results.clear()
+
+
+def _copy_statistics_result(
+    result: dict[str, list[StatisticsRow]],
+) -> dict[str, list[StatisticsRow]]:
+    """Copy a result so callers may modify the rows."""
+    return {
+        statistic_id: [row.copy() for row in rows]
+        for statistic_id, rows in result.items()
+    }
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -388,12 +497,14 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(session: Session, start: datetime) -> Iterable[int]:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    Returns the metadata_ids of the compiled statistics.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
@@ -443,6 +554,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         Statistics.from_stats_ts(metadata_id, summary_item)
         for metadata_id, summary_item in summary.items()
     )
+    return summary.keys()
 
 
 @retryable_database_job("compile missing statistics")
@@ -483,6 +595,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    get_statistics_during_period_cache(instance.hass).invalidate_pending()
     return True
 
 
@@ -508,6 +621,7 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
         modified_statistic_ids = _compile_statistics(
             instance, session, start, fire_events
         )
+    get_statistics_during_period_cache(instance.hass).invalidate_pending()
 
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
@@ -571,6 +685,7 @@ def _compile_statistics(
 
     new_short_term_stats: list[StatisticsBase] = []
     updated_metadata_ids: set[int] = set()
+    during_period_cache = get_statistics_during_period_cache(instance.hass)
     # Insert collected statistics in the database
     for stats in platform_stats:
         modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
@@ -578,6 +693,8 @@ def _compile_statistics(
         )
         if modified_statistic_id is not None:
             modified_statistic_ids.add(modified_statistic_id)
+            # The metadata applies to all rows of the statistic
+            during_period_cache.add_pending((metadata_id,), 0)
         updated_metadata_ids.add(metadata_id)
         if new_stat := _insert_statistics(
             session,
@@ -598,9 +715,13 @@ def _compile_statistics(
                 continue
             platform_update_issues(instance.hass, session)
 
+    during_period_cache.add_pending(updated_metadata_ids, start.timestamp())
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        during_period_cache.add_pending(
+            _compile_hourly_statistics(session, start),
+            start.replace(minute=0).timestamp(),
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -747,6 +868,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_statistics_during_period_cache(instance.hass).clear()
 
 
 def update_statistics_metadata(
@@ -772,6 +894,7 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    get_statistics_during_period_cache(instance.hass).clear()
 
 
 async def async_list_statistic_ids(
@@ -796,7 +919,8 @@ async def async_list_statistic_ids(
             result = _statistic_by_id_from_metadata(hass, metadata)
             return _flatten_list_statistic_ids_metadata_result(result)
 
-    return await instance.async_add_executor_job(
+    return await instance.async_add_read_executor_job(
+        QueryClass.STATISTICS,
         list_statistic_ids,
         hass,
         statistic_ids,
@@ -1735,35 +1859,7 @@ def _statistics_during_period_with_session(
     if statistic_ids is not None:
         metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
 
-    # Align start_time and end_time with the period
-    if period == "day":
-        start_time = dt_util.as_local(start_time).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        start_time = start_time.replace()
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = end_local.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ) + timedelta(days=1)
-    elif period == "week":
-        start_local = dt_util.as_local(start_time)
-        start_time = start_local.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) - timedelta(days=start_local.weekday())
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = (
-                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
-                - timedelta(days=end_local.weekday())
-                + timedelta(days=7)
-            )
-    elif period == "month":
-        start_time = dt_util.as_local(start_time).replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        if end_time is not None:
-            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    start_time, end_time = _align_time_range_with_period(start_time, end_time, period)
 
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
@@ -1807,6 +1903,43 @@ def _statistics_during_period_with_session(
     return result
 
 
+def _align_time_range_with_period(
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+) -> tuple[datetime, datetime | None]:
+    """Align start_time and end_time with the period."""
+    if period == "day":
+        start_time = dt_util.as_local(start_time).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        start_time = start_time.replace()
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = end_local.replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ) + timedelta(days=1)
+    elif period == "week":
+        start_local = dt_util.as_local(start_time)
+        start_time = start_local.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=start_local.weekday())
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = (
+                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
+                - timedelta(days=end_local.weekday())
+                + timedelta(days=7)
+            )
+    elif period == "month":
+        start_time = dt_util.as_local(start_time).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        if end_time is not None:
+            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    return start_time, end_time
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -1820,9 +1953,43 @@ def statistics_during_period(
 
     If end_time is omitted, returns statistics newer than or equal to start_time.
     If statistic_ids is omitted, returns statistics for all statistics ids.
+
+    Results for a set of statistic_ids are cached until the statistics they
+    cover change.
     """
+    if statistic_ids is None:
+        # The display units depend on the states of all statistics
+        with session_scope(hass=hass, read_only=True) as session:
+            return _statistics_during_period_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                statistic_ids,
+                period,
+                units,
+                types,
+            )
+
+    cache = get_statistics_during_period_cache(hass)
+    statistic_ids_key = frozenset(statistic_ids)
+    cache_key = (
+        statistic_ids_key,
+        period,
+        start_time,
+        end_time,
+        None if units is None else tuple(sorted(units.items())),
+        frozenset(types),
+        dt_util.get_default_time_zone(),
+        # Statistics are converted to the unit of their state
+        # unless units are requested
+        _get_state_units(hass, statistic_ids_key),
+    )
+    if (cached_result := cache.get(cache_key)) is not None:
+        return cached_result
+    generation = cache.generation
     with session_scope(hass=hass, read_only=True) as session:
-        return _statistics_during_period_with_session(
+        result = _statistics_during_period_with_session(
             hass,
             session,
             start_time,
@@ -1832,6 +1999,36 @@ def statistics_during_period(
             units,
             types,
         )
+        metadata = get_instance(hass).statistics_meta_manager.get_many(
+            session, statistic_ids=set(statistic_ids_key)
+        )
+        if len(metadata) != len(statistic_ids_key):
+            # Statistics that do not exist yet have no metadata_id
+            # to invalidate the result with once they are created
+            return result
+        metadata_ids = frozenset(metadata_id for metadata_id, _ in metadata.values())
+    _, aligned_end_time = _align_time_range_with_period(start_time, end_time, period)
+    cache.set(
+        cache_key,
+        generation,
+        metadata_ids,
+        aligned_end_time.timestamp() if aligned_end_time is not None else None,
+        result,
+    )
+    return result
+
+
+def _get_state_units(
+    hass: HomeAssistant, statistic_ids: Iterable[str]
+) -> tuple[tuple[str, str | None], ...]:
+    """Return the unit of the state of each statistic_id which has a state."""
+    return tuple(
+        sorted(
+            (statistic_id, state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+            for statistic_id in statistic_ids
+            if (state := hass.states.get(statistic_id)) is not None
+        )
+    )
 
 
 def _get_last_statistics_stmt(
@@ -2337,14 +2534,19 @@ def _import_statistics_with_session(
     old_metadata_dict = statistics_meta_manager.get_many(
         session, statistic_ids={metadata["statistic_id"]}
     )
-    _, metadata_id = statistics_meta_manager.update_or_add(
+    modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    during_period_cache = get_statistics_during_period_cache(instance.hass)
+    if modified_statistic_id is not None:
+        # The metadata applies to all rows of the statistic
+        during_period_cache.add_pending((metadata_id,), 0)
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        during_period_cache.add_pending((metadata_id,), stat["start"].timestamp())
 
     if table != StatisticsShortTerm:
         return True
@@ -2367,6 +2569,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_STATISTICS_DURING_PERIOD_CACHE)
+def get_statistics_during_period_cache(
+    hass: HomeAssistant,
+) -> StatisticsDuringPeriodCache:
+    """Get the statistics_during_period result cache."""
+    return StatisticsDuringPeriodCache()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2432,9 +2642,9 @@ def import_statistics(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
-            instance, session, metadata, statistics, table
-        )
+        _import_statistics_with_session(instance, session, metadata, statistics, table)
+    get_statistics_during_period_cache(instance.hass).invalidate_pending()
+    return True
 
 
 @retryable_database_job("adjust_statistics")
@@ -2475,6 +2685,11 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+    during_period_cache = get_statistics_during_period_cache(instance.hass)
+    during_period_cache.add_pending(
+        (metadata[statistic_id][0],), start_time.replace(minute=0).timestamp()
+    )
+    during_period_cache.invalidate_pending()
 
     return True
 
@@ -2543,6 +2758,7 @@ def change_statistics_unit(
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
+    get_statistics_during_period_cache(instance.hass).clear()
 
 
 @callback
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Collection, Iterable
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -13,7 +13,7 @@ from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import find_recent_shared_attributes, get_shared_attributes
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -28,6 +28,13 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The cache grows up to this size when too many lookups miss
+MAX_CACHE_SIZE = 16384
+# The share of lookups that may miss before the cache grows and
+# the number of lookups needed before the share is considered
+GROW_MISS_RATIO = 0.1
+GROW_MIN_LOOKUPS = 1000
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -37,6 +44,32 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self.hits = 0
+        self.misses = 0
+        self._window_hits = 0
+        self._window_misses = 0
+
+    @property
+    def cache_info(self) -> dict[str, Any]:
+        """Return the size and hit counters of the cache."""
+        return {
+            "size": len(self._id_map),
+            "max_size": self._id_map.get_size(),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def get_from_cache(self, data: str) -> int | None:
+        """Resolve shared_attrs to the attributes_id without accessing the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (attributes_id := self._id_map.get(data)) is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return attributes_id
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -67,6 +100,49 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def load_recent(self, session: Session) -> None:
+        """Load the attributes of the most recently recorded states into memory.
+
+        The cache is cold after a restart, so it is primed with the
+        attributes that are most likely to be seen again.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_map = self._id_map
+        with session.no_autoflush:
+            for attributes_id, shared_attrs in execute_stmt_lambda_element(
+                session,
+                find_recent_shared_attributes(id_map.get_size()),
+                orm_rows=False,
+            ):
+                id_map[shared_attrs] = attributes_id
+
+    def adapt_lru_size(self) -> None:
+        """Grow the LRU cache when it is full and too many lookups miss.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        hits = self.hits - self._window_hits
+        misses = self.misses - self._window_misses
+        if hits + misses < GROW_MIN_LOOKUPS:
+            return
+        self._window_hits = self.hits
+        self._window_misses = self.misses
+        lru = self._id_map
+        size = lru.get_size()
+        if (
+            size < MAX_CACHE_SIZE
+            and len(lru) >= size
+            and misses > (hits + misses) * GROW_MISS_RATIO
+        ):
+            new_size = min(size * 2, MAX_CACHE_SIZE)
+            _LOGGER.debug(
+                "Growing the state attributes cache from %s to %s", size, new_size
+            )
+            lru.set_size(new_size)
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
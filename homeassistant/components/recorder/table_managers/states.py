@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from ..db_schema import States
 
+# A row waiting for the next bulk insert and the serialized
+# shared attributes that still need to be mapped to an attributes_id
+type PendingStateRow = tuple[dict[str, Any], bytes]
+
 
 class StatesManager:
     """Manage the states table."""
@@ -13,6 +19,8 @@ class StatesManager:
         self._pending: dict[str, States] = {}
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
+        self._pending_rows: dict[str, list[PendingStateRow]] = {}
+        self._pending_rows_last_state_id: dict[str, int] = {}
 
     def pop_pending(self, entity_id: str) -> States | None:
         """Pop a pending state.
@@ -45,6 +53,51 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def get_pending_row(self, entity_id: str) -> dict[str, Any] | None:
+        """Get the most recent pending row for an entity if it can be linked.
+
+        Pending rows are rows waiting for the next bulk insert. A row
+        for a removed entity is never returned since the next state
+        for that entity must not be linked to it.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (rows := self._pending_rows.get(entity_id)) and (row := rows[-1][0])[
+            "state"
+        ] is not None:
+            return row
+        return None
+
+    def add_pending_row(
+        self, entity_id: str, row: dict[str, Any], shared_attrs_bytes: bytes
+    ) -> None:
+        """Add a pending row that will be bulk inserted at the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (rows := self._pending_rows.get(entity_id)) is None:
+            self._pending_rows[entity_id] = [(row, shared_attrs_bytes)]
+        else:
+            rows.append((row, shared_attrs_bytes))
+
+    def get_pending_rows(self) -> dict[str, list[PendingStateRow]]:
+        """Return all pending rows grouped by entity_id in the order they were added.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_rows
+
+    def set_pending_rows_last_state_id(self, entity_id: str, state_id: int) -> None:
+        """Set the state_id of the last inserted pending row for an entity.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_rows_last_state_id[entity_id] = state_id
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -63,7 +116,10 @@ class StatesManager:
         """
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
+        self._last_committed_id.update(self._pending_rows_last_state_id)
         self._pending.clear()
+        self._pending_rows.clear()
+        self._pending_rows_last_state_id.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -74,6 +130,8 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_rows.clear()
+        self._pending_rows_last_state_id.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -93,6 +151,19 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_purged_state_ids_before(self, end_id: int) -> None:
+        """Evict the states with an id below end_id from the committed states.
+
+        Used when a whole partition of the states table has been dropped.
+        """
+        last_committed_ids = self._last_committed_id
+        for entity_id in [
+            entity_id
+            for entity_id, state_id in last_committed_ids.items()
+            if state_id < end_id
+        ]:
+            del last_committed_ids[entity_id]
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
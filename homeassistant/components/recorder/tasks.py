@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
-from . import entity_registry, purge, statistics
+from . import downsample, entity_registry, partition, purge, statistics
 from .const import DOMAIN
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
@@ -117,9 +117,12 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
+        finished = purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        )
+        # Short term statistics may have been purged
+        statistics.get_statistics_during_period_cache(instance.hass).clear()
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -133,6 +136,18 @@ class PurgeTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class ClosePartitionsTask(RecorderTask):
+    """An object to insert into the recorder queue to close partitions."""
+
+    def run(self, instance: Recorder) -> None:
+        """Close the partitions of the states and events tables when due."""
+        assert instance.partition_interval is not None
+        if not partition.close_partitions(instance, instance.partition_interval):
+            # Schedule a new partition task if this one didn't finish
+            instance.queue_task(ClosePartitionsTask())
+
+
 @dataclass(slots=True)
 class PurgeEntitiesTask(RecorderTask):
     """Object to store entity information about purge task."""
@@ -175,6 +190,17 @@ class StatisticsTask(RecorderTask):
         instance.queue_task(StatisticsTask(self.start, self.fire_events))
 
 
+@dataclass(slots=True)
+class DownsampleStatesTask(RecorderTask):
+    """An object to insert into the recorder queue to compile downsampled states."""
+
+    start: datetime
+
+    def run(self, instance: Recorder) -> None:
+        """Run downsample states task."""
+        downsample.compile_downsampled_states(instance, self.start)
+
+
 @dataclass(slots=True)
 class CompileMissingStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run a compile missing statistics."""
@@ -297,6 +323,16 @@ class CommitTask(RecorderTask):
         instance._commit_event_session_or_retry()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class DrainSpillQueueTask(RecorderTask):
+    """Record the events that were spilled to disk."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        assert instance.spill_queue is not None
+        instance._record_spilled_events(instance.spill_queue.drain())  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class AddRecorderPlatformTask(RecorderTask):
     """Add a recorder platform."""
@@ -493,6 +493,24 @@ def async_create_backup_failure_issue(
     )
 
 
+def setup_read_only_connection_for_dialect(
+    dialect_name: str, dbapi_connection: DBAPIConnection
+) -> None:
+    """Execute statements needed to make a connection read only."""
+    if dialect_name == SupportedDialect.SQLITE:
+        execute_on_connection(dbapi_connection, "PRAGMA query_only = ON")
+    elif dialect_name == SupportedDialect.MYSQL:
+        execute_on_connection(dbapi_connection, "SET SESSION TRANSACTION READ ONLY")
+    elif dialect_name == SupportedDialect.POSTGRESQL:
+        execute_on_connection(
+            dbapi_connection, "SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"
+        )
+        # A rollback of the transaction the SET was issued in would revert it
+        dbapi_connection.commit()
+    else:
+        _fail_unsupported_dialect(dialect_name)
+
+
 def setup_connection_for_dialect(
     instance: Recorder,
     dialect_name: str,
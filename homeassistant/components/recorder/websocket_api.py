@@ -34,6 +34,7 @@ from homeassistant.util.unit_conversion import (
     VolumeFlowRateConverter,
 )
 
+from .const import QueryClass
 from .models import StatisticPeriod
 from .statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
@@ -134,7 +135,8 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
+            QueryClass.STATISTICS,
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -202,7 +204,8 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
+            QueryClass.STATISTICS,
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -257,7 +260,8 @@ async def ws_handle_list_statistic_ids(
 ) -> None:
     """Fetch a list of available statistic_id."""
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
+            QueryClass.STATISTICS,
             _ws_get_list_statistic_ids,
             hass,
             msg["id"],
@@ -7,7 +7,6 @@ from collections.abc import Callable, Iterable
 from contextlib import suppress
 import datetime
 from functools import partial
-import itertools
 import logging
 import math
 from typing import Any
@@ -41,6 +40,7 @@ from homeassistant.loader import async_suggest_report_issue
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import json_loads_object
 
 from .const import (
     ATTR_LAST_RESET,
@@ -107,34 +107,36 @@ def _time_weighted_average(
     The average is calculated by weighting the states by duration in seconds between
     state changes.
     Note: there's no interpolation of values between state changes.
+
+    Durations are calculated in integer microseconds from the state timestamps,
+    which gives the same result as subtracting datetimes without creating a
+    datetime for every state.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    old_fstate = 0.0
+    old_start_us: int | None = None
     accumulated = 0.0
+    start_us = round(start.timestamp() * 1_000_000)
+    end_us = round(end.timestamp() * 1_000_000)
 
     for fstate, state in fstates:
         # The recorder will give us the last known state, which may be well
         # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
-        if old_start_time is None:
+        start_time_us = max(round(state.last_updated_timestamp * 1_000_000), start_us)
+        if old_start_us is None:
             # Adjust start time, if there was no last known state
-            start = start_time
+            start_us = start_time_us
         else:
-            duration = start_time - old_start_time
             # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
+            accumulated += old_fstate * ((start_time_us - old_start_us) / 1_000_000)
 
         old_fstate = fstate
-        old_start_time = start_time
+        old_start_us = start_time_us
 
-    if old_fstate is not None:
+    if old_start_us is not None:
         # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+        accumulated += old_fstate * ((end_us - old_start_us) / 1_000_000)
 
-    period_seconds = (end - start).total_seconds()
+    period_seconds = (end_us - start_us) / 1_000_000
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
@@ -146,6 +148,20 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
+def _time_weighted_average_from_aggregate(
+    aggregate: history.TimeWeightedAggregate, end: datetime.datetime
+) -> float:
+    """Calculate a time weighted average from states aggregated in the database.
+
+    This gives the same result as _time_weighted_average for the same states.
+    """
+    end_us = round(end.timestamp() * 1_000_000)
+    period_seconds = (end_us - round(aggregate.first_us)) / 1_000_000
+    if period_seconds == 0:
+        return 0.0
+    return aggregate.weighted_sum / period_seconds
+
+
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
     return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
@@ -402,17 +418,83 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _aggregate_measurements_in_database(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+) -> dict[str, tuple[str | None, history.TimeWeightedAggregate]]:
+    """Aggregate the states of measurement sensors in the database.
+
+    Only sensors with plain decimal states updated at distinct times and a
+    single set of attributes with the unit of previously compiled statistics
+    are aggregated, the states of other sensors need to be normalized in Python.
+    """
+    measurement_statistics = DEFAULT_STATISTICS[SensorStateClass.MEASUREMENT]
+    if not (
+        entity_ids := [
+            state.entity_id
+            for state in sensor_states
+            if wanted_statistics[state.entity_id] == measurement_statistics
+        ]
+    ):
+        return {}
+    units: dict[str, tuple[str | None, history.TimeWeightedAggregate]] = {}
+    for (
+        entity_id,
+        aggregate,
+    ) in history.get_significant_states_time_weighted_aggregates_with_session(
+        hass, session, start, end, entity_ids
+    ).items():
+        if (
+            aggregate.unparsed_states
+            or aggregate.states_without_attributes
+            or aggregate.states_updated_at_same_time
+            or aggregate.attribute_sets != 1
+            or aggregate.attributes is None
+        ):
+            continue
+        try:
+            attributes = json_loads_object(aggregate.attributes)
+        except ValueError:
+            continue
+        units[entity_id] = (attributes.get(ATTR_UNIT_OF_MEASUREMENT), aggregate)
+    if not units:
+        return {}
+    old_metadatas = statistics.get_metadata_with_session(
+        get_instance(hass), session, statistic_ids=set(units)
+    )
+    return {
+        entity_id: (unit, aggregate)
+        for entity_id, (unit, aggregate) in units.items()
+        if entity_id not in old_metadatas
+        or old_metadatas[entity_id][1]["unit_of_measurement"] == unit
+    }
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
     start: datetime.datetime,
     end: datetime.datetime,
+    aggregate_in_database: bool = True,
 ) -> statistics.PlatformCompiledStatistics:
-    """Compile statistics for all entities during start-end."""
+    """Compile statistics for all entities during start-end.
+
+    The states of measurement sensors are aggregated in the database when
+    possible unless aggregate_in_database is False.
+    """
     result: list[StatisticResult] = []
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    aggregated: dict[str, tuple[str | None, history.TimeWeightedAggregate]] = {}
+    if aggregate_in_database:
+        aggregated = _aggregate_measurements_in_database(
+            hass, session, start, end, sensor_states, wanted_statistics
+        )
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
@@ -430,7 +512,7 @@ def compile_statistics(  # noqa: C901
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
+        if "sum" not in wanted_statistics[i.entity_id] and i.entity_id not in aggregated
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -445,6 +527,8 @@ def compile_statistics(  # noqa: C901
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in aggregated:
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -458,12 +542,20 @@ def compile_statistics(  # noqa: C901
     # that are not in the metadata table and we are not working
     # with them anyway.
     old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+        get_instance(hass),
+        session,
+        statistic_ids=set(entities_with_float_states) | set(aggregated),
     )
     to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in aggregated:
+            state_unit = aggregated[entity_id][0]
+            to_process.append(
+                (entity_id, state_unit, _state.attributes[ATTR_STATE_CLASS], [])
+            )
+            continue
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
         statistics_unit, valid_float_states = _normalize_states(
@@ -525,14 +617,23 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+        if entity_id in aggregated:
+            aggregate = aggregated[entity_id][1]
+            stat["max"] = aggregate.max
+            stat["min"] = aggregate.min
+            stat["mean"] = _time_weighted_average_from_aggregate(aggregate, end)
+            result.append({"meta": meta, "stat": stat})
+            continue
+
+        if (
+            "max" in wanted_statistics[entity_id]
+            or "min" in wanted_statistics[entity_id]
+        ):
+            float_values = [fstate for fstate, _ in valid_float_states]
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(float_values)
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(float_values)
 
         if "mean" in wanted_statistics[entity_id]:
             stat["mean"] = _time_weighted_average(valid_float_states, start, end)
@@ -59,15 +59,23 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.setup import (
+    async_get_loaded_integrations,
+    async_get_setup_timeline,
+    async_get_setup_timings,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .entity_subscriptions import async_get_entity_subscription_hub
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
+# Longest frame interval subscribe_entities merges state changes over
+MAX_COALESCE_INTERVAL = 10
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -86,6 +94,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_setup_timeline)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -367,66 +376,69 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
-
-
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_interval"): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_COALESCE_INTERVAL)
+        ),
+        vol.Optional("resumable", default=False): cv.boolean,
+        vol.Optional("since_seq"): cv.positive_int,
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
 def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe entities command."""
+    """Handle subscribe entities command.
+
+    With coalesce_interval, the state changes of that many seconds are
+    merged into one message, which lowers the message rate for slow clients.
+
+    Resumable subscriptions return the current sequence number and every
+    message carries the sequence number of its last state change. A client
+    reconnecting with since_seq receives only the states that changed after
+    it, unless too many states changed and the full states are sent again.
+    """
     entity_ids = set(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
+    since_seq: int | None = msg.get("since_seq")
+    resumable = msg["resumable"] or since_seq is not None
+    msg_id = msg["id"]
+    message_id_as_bytes = str(msg_id).encode()
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
-    msg_id = msg["id"]
-    message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    hub = async_get_entity_subscription_hub(hass)
+    connection.subscriptions[msg_id] = hub.async_subscribe(
+        connection,
+        entity_ids,
+        msg,
+        entity_filter,
+        message_id_as_bytes,
+        msg.get("coalesce_interval"),
+        resumable,
     )
-    connection.send_result(msg_id)
+    if not resumable:
+        connection.send_result(msg_id)
+    else:
+        changes = None
+        if since_seq is not None:
+            changes = hub.async_changes_since(
+                since_seq, connection.user, entity_ids, entity_filter
+            )
+        connection.send_result(msg_id, {"seq": hub.seq, "delta": changes is not None})
+        if changes is not None:
+            connection.send_message(
+                messages.coalesced_state_diff_message(message_id_as_bytes, changes)
+                or messages.event_message(msg_id, {})
+            )
+            return
+
+    states = _async_get_allowed_states(hass, connection)
 
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
@@ -570,6 +582,15 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/setup_timeline"})
+def handle_integration_setup_timeline(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration setup timeline command."""
+    connection.send_result(msg["id"], async_get_setup_timeline(hass))
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -10,7 +10,13 @@ from aiohttp import web
 import voluptuous as vol
 
 from homeassistant.auth.models import RefreshToken, User
-from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.core import (
+    Context,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 from homeassistant.helpers.http import current_request
 from homeassistant.util.json import JsonValueType
@@ -28,6 +34,9 @@ current_connection = ContextVar["ActiveConnection | None"](
 
 type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]], None]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
+type StateChangeSender = Callable[
+    [bytes, Event[EventStateChangedData], int | None], None
+]
 
 
 class ActiveConnection:
@@ -37,11 +46,15 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "send_state_change",
+        "cancel_state_changes",
+        "pending_messages",
         "user",
         "refresh_token_id",
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "binary_messages",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -59,11 +72,18 @@ class ActiveConnection:
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # Replaced by the websocket handler to merge state changes
+        # while the client is behind
+        self.send_state_change: StateChangeSender = self._send_state_change
+        self.cancel_state_changes: Callable[[bytes], None] = self._cancel_state_changes
+        # Replaced by the websocket handler to report its pending messages
+        self.pending_messages: Callable[[], int] = self._pending_messages
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.binary_messages = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
@@ -79,6 +99,9 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.binary_messages = (
+            features.get(const.FEATURE_BINARY_MESSAGES) == const.BINARY_MESSAGES_VERSION
+        )
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -128,6 +151,27 @@ class ActiveConnection:
         """Send a result message."""
         self.send_message(messages.result_message(msg_id, result))
 
+    @callback
+    def _send_state_change(
+        self,
+        message_id_as_bytes: bytes,
+        event: Event[EventStateChangedData],
+        seq: int | None,
+    ) -> None:
+        """Send a state change to an entity subscription."""
+        self.send_message(
+            messages.state_change_message(message_id_as_bytes, event, seq)
+        )
+
+    @callback
+    def _cancel_state_changes(self, message_id_as_bytes: bytes) -> None:
+        """Drop the unsent state changes of an entity subscription."""
+
+    @callback
+    def _pending_messages(self) -> int:
+        """Return the number of messages waiting to be written."""
+        return 0
+
     @callback
     def send_event(self, msg_id: int, event: Any | None = None) -> None:
         """Send a event message."""
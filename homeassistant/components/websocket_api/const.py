@@ -34,6 +34,15 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages after which the state changes of an
+# entity subscription are merged into one message until the client
+# catches up, instead of queuing a message for every state change.
+PENDING_MSG_MERGE_STATE_CHANGES: Final = 256
+
+# Maximum number of entities with merged state changes pending per
+# entity subscription.
+MAX_PENDING_STATE_CHANGES: Final = 65536
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -58,3 +67,8 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_BINARY_MESSAGES = "binary_messages"
+
+# Version of the binary message dictionary clients pass as the value of
+# the binary_messages feature
+BINARY_MESSAGES_VERSION = 1
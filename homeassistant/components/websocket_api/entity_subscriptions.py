@@ -0,0 +1,320 @@
+"""Shared fan-out of state changes to websocket entity subscriptions."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from . import messages
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .connection import ActiveConnection
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ENTITY_SUBSCRIPTIONS: HassKey[EntitySubscriptionHub] = HassKey(
+    f"{DOMAIN}.entity_subscriptions"
+)
+
+# Number of recent state changes kept to resume subscriptions
+RESUME_BUFFER_SIZE = 4096
+
+type _FilterKey = tuple[tuple[str, tuple[str, ...]], ...]
+type _GroupKey = tuple[str, frozenset[str] | None, _FilterKey]
+type _Subscriber = Callable[[Event[EventStateChangedData], int], None]
+type _StateChanges = dict[str, tuple[State | None, State | None]]
+
+
+class _EntitySubscriptionGroup:
+    """Subscriptions sharing the same user and entity selection."""
+
+    __slots__ = ("entity_filter", "entity_ids", "subscribers", "user")
+
+    def __init__(
+        self,
+        user: User,
+        entity_ids: frozenset[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+    ) -> None:
+        """Initialize the group."""
+        self.user = user
+        self.entity_ids = entity_ids
+        self.entity_filter = entity_filter
+        self.subscribers: list[_Subscriber] = []
+
+    @callback
+    def async_wants(self, entity_id: str) -> bool:
+        """Return if the state changes of an entity are forwarded to the group."""
+        if (self.entity_ids and entity_id not in self.entity_ids) or (
+            self.entity_filter and not self.entity_filter(entity_id)
+        ):
+            return False
+        # We have to lookup the permissions again because the user might have
+        # changed since the subscription was created.
+        user = self.user
+        permissions = user.permissions
+        return (
+            user.is_admin
+            or permissions.access_all_entities(POLICY_READ)
+            or permissions.check_entity(entity_id, POLICY_READ)
+        )
+
+
+class _CoalescingSubscriber:
+    """Send the state changes of a frame interval as one message."""
+
+    __slots__ = (
+        "_changes",
+        "_hass",
+        "_interval",
+        "_message_id_as_bytes",
+        "_resumable",
+        "_send_message",
+        "_seq",
+        "_unsub_flush",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[bytes], None],
+        message_id_as_bytes: bytes,
+        interval: float,
+        resumable: bool,
+    ) -> None:
+        """Initialize the subscriber."""
+        self._hass = hass
+        self._send_message = send_message
+        self._message_id_as_bytes = message_id_as_bytes
+        self._interval = interval
+        self._resumable = resumable
+        self._changes: _StateChanges = {}
+        self._seq = 0
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_forward(self, event: Event[EventStateChangedData], seq: int) -> None:
+        """Collect a state change until the end of the frame."""
+        data = event.data
+        entity_id = data["entity_id"]
+        if (change := self._changes.get(entity_id)) is None:
+            # Keep the state the client last saw so the diff spans the frame
+            self._changes[entity_id] = (data["old_state"], data["new_state"])
+        else:
+            self._changes[entity_id] = (change[0], data["new_state"])
+        self._seq = seq
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self._hass, self._interval, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now: Any) -> None:
+        """Send the state changes collected during the frame."""
+        self._unsub_flush = None
+        changes = self._changes
+        self._changes = {}
+        if message := messages.coalesced_state_diff_message(
+            self._message_id_as_bytes,
+            changes,
+            self._seq if self._resumable else None,
+        ):
+            self._send_message(message)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the pending state changes."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._changes.clear()
+
+
+class EntitySubscriptionHub:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state_changed listener serves every connection. Subscriptions
+    are grouped by user and entity selection so the entity selection and
+    the permissions are checked once per group, and the serialized diff
+    is shared by all subscriptions of a state change.
+
+    Once a subscription is resumable, every state change gets a sequence
+    number and the most recent ones are kept, so a reconnecting client
+    only receives what changed since the last sequence number it saw.
+    """
+
+    __slots__ = ("_groups", "_hass", "_recent", "_resumable", "_unsub_listener", "seq")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self._groups: dict[_GroupKey, _EntitySubscriptionGroup] = {}
+        self._unsub_listener: CALLBACK_TYPE | None = None
+        self._resumable = False
+        self._recent: deque[Event[EventStateChangedData]] = deque(
+            maxlen=RESUME_BUFFER_SIZE
+        )
+        # Start from the current time so sequence numbers handed out
+        # before a restart are never mistaken for recent ones
+        self.seq = time.time_ns() // 1000
+
+    @callback
+    def async_subscribe(
+        self,
+        connection: ActiveConnection,
+        entity_ids: set[str] | None,
+        filter_config: dict[str, Any],
+        entity_filter: Callable[[str], bool] | None,
+        message_id_as_bytes: bytes,
+        coalesce_interval: float | None = None,
+        resumable: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to the state changes of the selected entities.
+
+        The messages of resumable subscriptions carry the sequence
+        number of the last state change they contain.
+        """
+        user = connection.user
+        frozen_entity_ids = frozenset(entity_ids) if entity_ids else None
+        key: _GroupKey = (
+            user.id,
+            frozen_entity_ids,
+            _filter_key(filter_config) if entity_filter else (),
+        )
+        if (group := self._groups.get(key)) is None:
+            group = self._groups[key] = _EntitySubscriptionGroup(
+                user, frozen_entity_ids, entity_filter
+            )
+
+        coalescing: _CoalescingSubscriber | None = None
+        subscriber: _Subscriber
+        if coalesce_interval:
+            coalescing = _CoalescingSubscriber(
+                self._hass,
+                connection.send_message,
+                message_id_as_bytes,
+                coalesce_interval,
+                resumable,
+            )
+            subscriber = coalescing.async_forward
+        else:
+
+            @callback
+            def subscriber(event: Event[EventStateChangedData], seq: int) -> None:
+                connection.send_state_change(
+                    message_id_as_bytes, event, seq if resumable else None
+                )
+
+        group.subscribers.append(subscriber)
+        # Once resumable, the state changes are kept even without
+        # subscriptions as the clients are expected to reconnect
+        self._resumable |= resumable
+        if self._unsub_listener is None:
+            self._unsub_listener = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            if coalescing is not None:
+                coalescing.async_cancel()
+            else:
+                connection.cancel_state_changes(message_id_as_bytes)
+            group.subscribers.remove(subscriber)
+            if group.subscribers:
+                return
+            del self._groups[key]
+            if (
+                not self._groups
+                and not self._resumable
+                and self._unsub_listener is not None
+            ):
+                self._unsub_listener()
+                self._unsub_listener = None
+
+        return _async_unsubscribe
+
+    @callback
+    def async_changes_since(
+        self,
+        seq: int,
+        user: User,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+    ) -> _StateChanges | None:
+        """Return the selected state changes after a sequence number.
+
+        Maps the entity_id to the state at seq and the current state.
+        Returns None if the state changes since seq are no longer known.
+        """
+        recent = self._recent
+        if not self._resumable or not self.seq - len(recent) <= seq <= self.seq:
+            return None
+        group = _EntitySubscriptionGroup(
+            user, frozenset(entity_ids) if entity_ids else None, entity_filter
+        )
+        changes: _StateChanges = {}
+        # The most recent state change is at the end of the deque
+        for idx in range(self.seq - seq):
+            data = recent[-idx - 1].data
+            entity_id = data["entity_id"]
+            if (change := changes.get(entity_id)) is None:
+                if group.async_wants(entity_id):
+                    changes[entity_id] = (data["old_state"], data["new_state"])
+            else:
+                changes[entity_id] = (data["old_state"], change[1])
+        return changes
+
+    @callback
+    def _async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state change to the groups that want it."""
+        if self._resumable:
+            self.seq += 1
+            self._recent.append(event)
+        seq = self.seq
+        entity_id = event.data["entity_id"]
+        for group in self._groups.values():
+            if not group.async_wants(entity_id):
+                continue
+            for subscriber in group.subscribers:
+                try:
+                    subscriber(event, seq)
+                except Exception:
+                    _LOGGER.exception("Error forwarding state change to %s", subscriber)
+
+
+def _filter_key(filter_config: dict[str, Any]) -> _FilterKey:
+    """Return a hashable key for an include/exclude filter config."""
+    return tuple(
+        sorted(
+            (f"{section}.{option}", tuple(sorted(values)))
+            for section in ("include", "exclude")
+            for option, values in (filter_config.get(section) or {}).items()
+        )
+    )
+
+
+@callback
+def async_get_entity_subscription_hub(hass: HomeAssistant) -> EntitySubscriptionHub:
+    """Return the entity subscription hub."""
+    if (hub := hass.data.get(DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        hub = hass.data[DATA_ENTITY_SUBSCRIPTIONS] = EntitySubscriptionHub(hass)
+    return hub
@@ -15,7 +15,13 @@ from aiohttp.http_websocket import WebSocketWriter
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.async_ import create_eager_task
@@ -25,7 +31,9 @@ from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    MAX_PENDING_STATE_CHANGES,
     PENDING_MSG_MAX_FORCE_READY,
+    PENDING_MSG_MERGE_STATE_CHANGES,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
@@ -33,7 +41,12 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import (
+    BinaryMessageEncoder,
+    coalesced_state_diff_message,
+    message_to_json_bytes,
+    state_change_message,
+)
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -64,6 +77,19 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+class _PendingStateChanges:
+    """State changes of an entity subscription merged while the client is behind."""
+
+    __slots__ = ("changes", "seq")
+
+    def __init__(self) -> None:
+        """Initialize the pending state changes."""
+        # Maps the entity_id to the state the client last saw
+        # and the current state
+        self.changes: dict[str, tuple[State | None, State | None]] = {}
+        self.seq: int | None = None
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -80,6 +106,7 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_state_changes",
         "_ready_future",
         "_release_ready_queue_size",
     )
@@ -103,6 +130,9 @@ class WebSocketHandler:
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
         self._message_queue: deque[bytes] = deque()
+        # Merged state changes of entity subscriptions that are written
+        # after the queued messages when the client falls behind
+        self._state_changes: dict[bytes, _PendingStateChanges] = {}
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
 
@@ -128,43 +158,65 @@ class WebSocketHandler:
         self,
         connection: ActiveConnection,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
         message_queue = self._message_queue
         logger = self._logger
         wsock = self._wsock
+        hass = self._hass
         loop = self._loop
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        encoder: BinaryMessageEncoder | None = None
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
-                if not message_queue:
+                if not message_queue and not self._state_changes:
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
 
                 if self._closing:
                     return
 
+                if not message_queue:
+                    # State changes are written once all other messages are
+                    self._queue_state_changes()
+                    if not (ready_message_count := len(message_queue)):
+                        continue
+
                 if not can_coalesce:
                     # coalesce may be enabled later in the connection
                     can_coalesce = connection.can_coalesce
 
+                # binary messages may be enabled later in the connection,
+                # they are not used on top of per-message deflate
+                if (
+                    encoder is None
+                    and connection.binary_messages
+                    and not wsock.compress
+                ):
+                    encoder = BinaryMessageEncoder()
+
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
-                    continue
+                else:
+                    message = b"".join((b"[", b",".join(message_queue), b"]"))
+                    message_queue.clear()
+                    if is_debug_log_enabled():
+                        debug("%s: Sending %s", self.description, message)
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
-                if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                if encoder is None:
+                    await send_bytes_text(message)
+                else:
+                    # Frames are encoded one at a time in order since
+                    # the encoder is stateful
+                    await send_bytes_binary(await encoder.async_encode(hass, message))
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -234,6 +286,102 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _send_state_change(
+        self,
+        message_id_as_bytes: bytes,
+        event: Event[EventStateChangedData],
+        seq: int | None,
+    ) -> None:
+        """Queue sending a state change to an entity subscription.
+
+        When the client falls behind, the state changes of a subscription
+        are merged into a single message that is written after all other
+        messages.
+
+        Async friendly.
+        """
+        if self._closing:
+            return
+
+        state_changes = self._state_changes
+        if (
+            not state_changes
+            and len(self._message_queue) < PENDING_MSG_MERGE_STATE_CHANGES
+        ):
+            self._send_message(state_change_message(message_id_as_bytes, event, seq))
+            return
+
+        # Once state changes are merged, all state changes have to be merged
+        # until they are written to keep the diffs of an entity in order
+        if (pending := state_changes.get(message_id_as_bytes)) is None:
+            # Each subscription with merged state changes is written
+            # as one message so it counts as a pending message
+            pending = state_changes[message_id_as_bytes] = _PendingStateChanges()
+            queue_size = len(self._message_queue) + len(state_changes)
+            if queue_size >= MAX_PENDING_MSG:
+                self._logger.error(
+                    (
+                        "%s: Client unable to keep up with pending messages. Reached"
+                        " %s pending messages. The system's load is too high or an"
+                        " integration is misbehaving"
+                    ),
+                    self.description,
+                    MAX_PENDING_MSG,
+                )
+                self._cancel()
+                return
+            if self._release_ready_queue_size == 0:
+                self._release_ready_queue_size = queue_size
+                self._loop.call_soon(self._release_ready_future_or_reschedule)
+
+        data = event.data
+        changes = pending.changes
+        entity_id = data["entity_id"]
+        if (change := changes.get(entity_id)) is not None:
+            # Latest state wins, the diff starts at the state the client saw
+            changes[entity_id] = (change[0], data["new_state"])
+        else:
+            changes[entity_id] = (data["old_state"], data["new_state"])
+        # The message carries the sequence number of its last state change
+        pending.seq = seq
+
+        if len(changes) >= MAX_PENDING_STATE_CHANGES:
+            self._logger.error(
+                (
+                    "%s: Client unable to keep up with pending state changes. Reached"
+                    " %s entities with pending state changes. The system's load is too"
+                    " high or an integration is misbehaving"
+                ),
+                self.description,
+                MAX_PENDING_STATE_CHANGES,
+            )
+            self._cancel()
+
+    @callback
+    def _cancel_state_changes(self, message_id_as_bytes: bytes) -> None:
+        """Drop the merged state changes of an entity subscription."""
+        self._state_changes.pop(message_id_as_bytes, None)
+
+    @callback
+    def _pending_messages(self) -> int:
+        """Return the number of messages waiting to be written."""
+        if (message_queue := self._message_queue) is None:
+            return 0
+        return len(message_queue) + len(self._state_changes)
+
+    @callback
+    def _queue_state_changes(self) -> None:
+        """Queue one message with the merged state changes of each subscription."""
+        state_changes = self._state_changes
+        self._state_changes = {}
+        message_queue = self._message_queue
+        for message_id_as_bytes, pending in state_changes.items():
+            if message := coalesced_state_diff_message(
+                message_id_as_bytes, pending.changes, pending.seq
+            ):
+                message_queue.append(message)
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -245,7 +393,7 @@ class WebSocketHandler:
         immediately so avoid the coalesced messages from growing too large.
         """
         if not (ready_future := self._ready_future) or not (
-            queue_size := len(self._message_queue)
+            queue_size := len(self._message_queue) + len(self._state_changes)
         ):
             self._release_ready_queue_size = 0
             return
@@ -335,6 +483,7 @@ class WebSocketHandler:
             send_frame = writer._send_frame  # noqa: SLF001
 
         send_bytes_text = partial(send_frame, opcode=WSMsgType.TEXT)
+        send_bytes_binary = partial(send_frame, opcode=WSMsgType.BINARY)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -342,7 +491,9 @@ class WebSocketHandler:
         disconnect_warn: str | None = None
 
         try:
-            connection = await self._async_handle_auth_phase(auth, send_bytes_text)
+            connection = await self._async_handle_auth_phase(
+                auth, send_bytes_text, send_bytes_binary
+            )
             self._async_increase_writer_limit(writer)
             await self._async_websocket_command_phase(connection, send_bytes_text)
         except asyncio.CancelledError:
@@ -377,6 +528,7 @@ class WebSocketHandler:
         self,
         auth: AuthPhase,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> ActiveConnection:
         """Handle the auth phase of the websocket connection."""
         await send_bytes_text(AUTH_REQUIRED_MESSAGE)
@@ -407,7 +559,12 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
-        self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
+        connection.send_state_change = self._send_state_change
+        connection.cancel_state_changes = self._cancel_state_changes
+        connection.pending_messages = self._pending_messages
+        self._writer_task = create_eager_task(
+            self._writer(connection, send_bytes_text, send_bytes_binary)
+        )
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 from functools import lru_cache
 import logging
 from typing import Any, Final
+import zlib
 
 import voluptuous as vol
 
@@ -15,7 +16,13 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import (
+    CompressedState,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+)
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -44,6 +51,46 @@ ENTITY_EVENT_ADD = "a"
 ENTITY_EVENT_REMOVE = "r"
 ENTITY_EVENT_CHANGE = "c"
 
+# Strings priming the deflate stream of binary messages. Clients
+# negotiating version 1 of the binary_messages feature prime their
+# inflate stream with the same bytes. Deflate finds matches at the end
+# of the dictionary cheapest, so the most frequent strings come last.
+BINARY_MESSAGE_DICTIONARY: Final = b"".join(
+    (
+        b'"supported_color_modes":["',
+        b'"entity_picture":"',
+        b'"attribution":"',
+        b'"restored":true',
+        b'"supported_features":',
+        b'"color_mode":"',
+        b'"brightness":',
+        b'"state_class":"measurement"',
+        b'"device_class":"',
+        b'"unit_of_measurement":"',
+        b'"icon":"mdi:',
+        b'"friendly_name":"',
+        b'"unavailable"',
+        b'"unknown"',
+        b'"off"',
+        b'"on"',
+        b'"parent_id":null,"user_id":null',
+        b'{"id":',
+        b',"type":"result","success":true,"result":',
+        b'{"type":"event","event":{"a":{',
+        b'{"type":"event","event":{"c":{',
+        b'":{"+":{"lu":',
+        b'"s":"',
+        b'"a":{',
+        b'"c":"',
+        b'"lc":',
+        b'"lu":',
+    )
+)
+BINARY_MESSAGE_COMPRESSION_LEVEL: Final = 6
+# Larger messages are compressed in the executor to avoid blocking the
+# event loop, this is the limit aiohttp uses for per-message deflate
+BINARY_MESSAGE_MAX_SYNC_SIZE: Final = 5 * 1024
+
 BASE_ERROR_MESSAGE = {
     "type": const.TYPE_RESULT,
     "success": False,
@@ -162,6 +209,41 @@ def cached_state_diff_message(
     )
 
 
+def sequenced_state_diff_message(
+    message_id_as_bytes: bytes,
+    seq_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+) -> bytes:
+    """Return an event message with the sequence number of the state change.
+
+    The serialized diff is shared with cached_state_diff_message.
+    """
+    return b"".join(
+        (
+            _partial_cached_state_diff_message(event)[:-1],
+            b',"seq":',
+            seq_as_bytes,
+            b',"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
+
+
+def state_change_message(
+    message_id_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+    seq: int | None,
+) -> bytes:
+    """Return an event message for a state change of an entity subscription.
+
+    The sequence number of the state change is added if seq is passed.
+    """
+    if seq is None:
+        return cached_state_diff_message(message_id_as_bytes, event)
+    return sequenced_state_diff_message(message_id_as_bytes, str(seq).encode(), event)
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
@@ -199,6 +281,13 @@ def _state_diff_event(
         return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
     if (old_state := event.data["old_state"]) is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the diff between two states of the same entity."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -235,7 +324,46 @@ def _state_diff_event(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
+
+
+def coalesced_state_diff_message(
+    message_id_as_bytes: bytes,
+    changes: dict[str, tuple[State | None, State | None]],
+    seq: int | None = None,
+) -> bytes | None:
+    """Return one event message for the changes of many entities.
+
+    changes maps the entity_id to the state the client last saw
+    and the current state. The sequence number of the last change
+    is added if seq is passed. Returns None if nothing changed for
+    the client.
+    """
+    added: dict[str, CompressedState] = {}
+    changed: dict[str, dict[str, dict[str, Any]]] = {}
+    removed: list[str] = []
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            if old_state is not None:
+                removed.append(entity_id)
+        elif old_state is None:
+            added[entity_id] = new_state.as_compressed_state
+        else:
+            changed[entity_id] = _state_diff(old_state, new_state)
+    event: dict[str, Any] = {}
+    if added:
+        event[ENTITY_EVENT_ADD] = added
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        event[ENTITY_EVENT_REMOVE] = removed
+    if not event:
+        return None
+    message: dict[str, Any] = {"type": "event", "event": event}
+    if seq is not None:
+        message["seq"] = seq
+    partial = _message_to_json_bytes_or_none(message) or INVALID_JSON_PARTIAL_MESSAGE
+    return b"".join((partial[:-1], b',"id":', message_id_as_bytes, b"}"))
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
@@ -259,3 +387,40 @@ def message_to_json_bytes(message: dict[str, Any]) -> bytes:
             message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
         )
     )
+
+
+class BinaryMessageEncoder:
+    """Encode messages of a connection for binary frames.
+
+    All messages of a connection are compressed as a single raw deflate
+    stream primed with BINARY_MESSAGE_DICTIONARY and flushed at the end
+    of every frame, so entity_ids and attribute keys sent once are
+    referenced instead of repeated in later messages.
+    """
+
+    __slots__ = ("_compressor",)
+
+    def __init__(self) -> None:
+        """Initialize the encoder."""
+        self._compressor = zlib.compressobj(
+            BINARY_MESSAGE_COMPRESSION_LEVEL,
+            zlib.DEFLATED,
+            -zlib.MAX_WBITS,
+            zdict=BINARY_MESSAGE_DICTIONARY,
+        )
+
+    def encode(self, message: bytes) -> bytes:
+        """Encode a JSON message for a binary frame."""
+        compressor = self._compressor
+        return compressor.compress(message) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    async def async_encode(self, hass: HomeAssistant, message: bytes) -> bytes:
+        """Encode a JSON message for a binary frame without blocking the loop.
+
+        Messages larger than BINARY_MESSAGE_MAX_SYNC_SIZE are compressed in
+        the executor. The compressor is stateful so the next message must
+        not be encoded before the returned coroutine is done.
+        """
+        if len(message) <= BINARY_MESSAGE_MAX_SYNC_SIZE:
+            return self.encode(message)
+        return await hass.async_add_executor_job(self.encode, message)
@@ -25,12 +25,14 @@ import enum
 import functools
 import inspect
 import logging
+from operator import attrgetter
 import os
 import pathlib
 import re
 import threading
 import time
 from time import monotonic
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -102,6 +104,7 @@ from .util.async_ import (
     cancelling,
     create_eager_task,
     get_scheduled_timer_handles,
+    get_timer_wheel,
     run_callback_threadsafe,
     shutdown_run_callback_threadsafe,
 )
@@ -360,6 +363,23 @@ class HassJob[**_P, _R_co]:
         """Return the job type."""
         return get_hassjob_callable_job_type(self.target)
 
+    @under_cached_property
+    def origin(self) -> str:
+        """Return where the target of the job is defined."""
+        target: Any = self.target
+        while isinstance(target, functools.partial):
+            target = target.func
+        # Unwrap bound methods
+        target = getattr(target, "__func__", target)
+        if (code := getattr(target, "__code__", None)) is None:
+            # Callable object
+            target = type(target)
+            return f"{target.__module__}.{target.__qualname__}"
+        return (
+            f"{target.__module__}.{target.__qualname__}"
+            f" ({code.co_filename}:{code.co_firstlineno})"
+        )
+
     @property
     def cancel_on_shutdown(self) -> bool | None:
         """Return if the job should be cancelled on shutdown."""
@@ -370,6 +390,76 @@ class HassJob[**_P, _R_co]:
         return f"<Job {self.name} {self.job_type} {self.target}>"
 
 
+@dataclass(slots=True)
+class HassJobStats:
+    """Time spent running the jobs of one origin in the event loop."""
+
+    origin: str
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+
+class HassJobProfiler:
+    """Record the time callback jobs spend in the event loop.
+
+    Install it with async_set_job_profiler. Jobs are grouped by origin
+    and jobs taking longer than slow_threshold are logged.
+    """
+
+    __slots__ = ("slow_threshold", "_stats")
+
+    def __init__(self, slow_threshold: float) -> None:
+        """Initialize the profiler."""
+        self.slow_threshold = slow_threshold
+        self._stats: dict[str, HassJobStats] = {}
+
+    def run(self, hassjob: HassJob[..., Any], args: tuple[Any, ...]) -> None:
+        """Run a callback job and record the time it took."""
+        start = monotonic()
+        try:
+            hassjob.target(*args)
+        finally:
+            duration = monotonic() - start
+            origin = hassjob.origin
+            if (stats := self._stats.get(origin)) is None:
+                stats = self._stats[origin] = HassJobStats(origin)
+            stats.count += 1
+            stats.total_time += duration
+            stats.max_time = max(stats.max_time, duration)
+            if duration > self.slow_threshold:
+                _LOGGER.warning(
+                    "Callback %s (%s) took %.3f seconds", hassjob.name, origin, duration
+                )
+
+    def top_jobs(self, count: int) -> list[HassJobStats]:
+        """Return the jobs that spent the most time in the event loop."""
+        jobs = sorted(self._stats.values(), key=attrgetter("total_time"), reverse=True)
+        return jobs[:count]
+
+    def clear(self) -> None:
+        """Forget the recorded time."""
+        self._stats.clear()
+
+
+# Kept at module level so the callback hot path only pays for a global
+# lookup and mocked HomeAssistant instances never run jobs through it
+_job_profiler: HassJobProfiler | None = None
+
+
+@callback
+def async_get_job_profiler() -> HassJobProfiler | None:
+    """Return the installed job profiler."""
+    return _job_profiler
+
+
+@callback
+def async_set_job_profiler(job_profiler: HassJobProfiler | None) -> None:
+    """Install or remove the profiler that times callback jobs."""
+    global _job_profiler  # noqa: PLW0603
+    _job_profiler = job_profiler
+
+
 @dataclass(frozen=True)
 class HassJobWithArgs:
     """Container for a HassJob and arguments."""
@@ -434,6 +524,8 @@ class HomeAssistant:
         # This is a dictionary that any component can store any data on.
         self.data = HassDict()
         self.loop = asyncio.get_running_loop()
+        # Coalesces time tracker timers firing in the same tick
+        self.timer_wheel = get_timer_wheel(self.loop)
         self._tasks: set[asyncio.Future[Any]] = set()
         self._background_tasks: set[asyncio.Future[Any]] = set()
         self.bus = EventBus(self)
@@ -937,7 +1029,10 @@ class HomeAssistant:
         if hassjob.job_type is HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., _R], hassjob)
-            hassjob.target(*args)
+            if _job_profiler is None:
+                hassjob.target(*args)
+            else:
+                _job_profiler.run(hassjob, args)
             return None
 
         return self._async_add_hass_job(hassjob, *args, background=background)
@@ -1460,7 +1555,13 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1569,10 @@ class EventBus:
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
+        # event_type -> key_field -> key -> listeners
+        self._keyed_listeners: dict[
+            EventType[Any] | str, dict[str, dict[str, list[_FilterableJobType[Any]]]]
+        ] = {}
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
         self._async_logging_changed()
@@ -1484,7 +1589,14 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len(jobs)
+                for listeners_by_key in keyed_listeners.values()
+                for jobs in listeners_by_key.values()
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1555,6 +1667,15 @@ class EventBus:
         else:
             match_all_listeners = EMPTY_LIST
 
+        if event_data is not None and (
+            keyed_listeners := self._keyed_listeners.get(event_type)
+        ):
+            for key_field, listeners_by_key in keyed_listeners.items():
+                if type(key := event_data.get(key_field)) is str and (
+                    keyed_jobs := listeners_by_key.get(key)
+                ):
+                    listeners = listeners + keyed_jobs
+
         event: Event[_DataT] | None = None
         for job, event_filter in listeners + match_all_listeners:
             if event_filter is not None:
@@ -1654,6 +1775,70 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        key_field: str,
+        key: str,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type where event_data[key_field] is key.
+
+        This is equivalent to listening with an event_filter comparing
+        event_data[key_field] to key, but the listeners are found with
+        a dict lookup when the event is fired instead of calling every
+        filter, which matters for event types with many listeners that
+        are each interested in a single entity_id, device_id or domain.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners require an event type")
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen {event_type} {key_field}={key}"),
+            None,
+        )
+        self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            key_field, {}
+        ).setdefault(key, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener,
+            event_type,
+            key_field,
+            key,
+            filterable_job,
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        key_field: str,
+        key: str,
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            listeners_by_key = keyed_listeners[key_field]
+            listeners_by_key[key].remove(filterable_job)
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+            return
+        # delete empty containers so firing does not look them up
+        if not listeners_by_key[key]:
+            del listeners_by_key[key]
+            if not listeners_by_key:
+                del keyed_listeners[key_field]
+                if not keyed_listeners:
+                    del self._keyed_listeners[event_type]
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1743,6 +1928,47 @@ class EventBus:
             )
 
 
+# Attribute values that cannot be mutated through the attributes
+_SCALAR_ATTRIBUTE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+class ScalarAttributes(ReadOnlyDict[str, Any]):
+    """Read only state attributes with only scalar values.
+
+    The attributes are serialized once when a state with them is first
+    serialized and the JSON is reused by the following states of the
+    entity as long as the attributes do not change.
+    """
+
+    __slots__ = ("_fragment",)
+
+    _fragment: json_fragment
+
+    @property
+    def fragment(self) -> json_fragment:
+        """Return a JSON fragment of the attributes."""
+        try:
+            return self._fragment
+        except AttributeError:
+            self._fragment = json_fragment(json_bytes(self))
+            return self._fragment
+
+
+def _scalar_attributes_or_as_is(
+    attributes: Mapping[str, Any] | None,
+) -> Mapping[str, Any] | None:
+    """Return attributes with only scalar values as ScalarAttributes.
+
+    All other attributes are returned as is.
+    """
+    if not attributes:
+        return attributes
+    for value in attributes.values():
+        if type(value) not in _SCALAR_ATTRIBUTE_TYPES:
+            return attributes
+    return ScalarAttributes(attributes)
+
+
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
 
@@ -1809,10 +2035,13 @@ class State:
 
         self.entity_id = entity_id
         self.state = state
-        # State only creates and expects a ReadOnlyDict so
-        # there is no need to check for subclassing with
+        # State only creates and expects a ReadOnlyDict or ScalarAttributes
+        # so there is no need to check for subclassing with
         # isinstance here so we can use the faster type check.
-        if type(attributes) is not ReadOnlyDict:
+        if (
+            type(attributes) is not ReadOnlyDict
+            and type(attributes) is not ScalarAttributes
+        ):
             self.attributes = ReadOnlyDict(attributes or {})
         else:
             self.attributes = attributes
@@ -1913,6 +2142,8 @@ class State:
     @under_cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
+        if type(attributes := self.attributes) is ScalarAttributes:
+            return json_bytes({**self._as_dict, "attributes": attributes.fragment})
         return json_bytes(self._as_dict)
 
     @under_cached_property
@@ -1956,7 +2187,13 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        compressed_state: Mapping[str, Any] = self.as_compressed_state
+        if type(attributes := self.attributes) is ScalarAttributes:
+            compressed_state = {
+                **compressed_state,
+                COMPRESSED_STATE_ATTRIBUTES: attributes.fragment,
+            }
+        return json_bytes({self.entity_id: compressed_state})[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2022,17 +2259,49 @@ class State:
         )
 
 
+@dataclass(slots=True, frozen=True)
+class StatesSnapshot:
+    """Immutable view of all states at a version of the state machine."""
+
+    version: int
+    states: Mapping[str, State]
+
+
+@dataclass(slots=True, frozen=True)
+class StatesDelta:
+    """States that changed or were removed since a version."""
+
+    version: int
+    changed: list[State]
+    removed: list[str]
+
+
+# Number of removed entity_ids to remember for deltas before
+# they are dropped and older versions require a new snapshot.
+MAX_REMOVED_ENTITY_IDS = 1024
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    Every change increments the version so consumers can ask
+    for a snapshot and then only process what changed after it.
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self.version = 0
+        # entity_id -> version of its last change, ordered by version
+        self._changed_versions: dict[str, int] = {}
+        self._removed_count = 0
+        # Deltas are not available for versions before this one
+        self._oldest_delta_version = 0
+        self._snapshot = StatesSnapshot(0, MappingProxyType({}))
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2040,14 +2309,71 @@ class States(UserDict[str, State]):
 
     def __setitem__(self, key: str, entry: State) -> None:
         """Add an item."""
+        if key not in self.data and key in self._changed_versions:
+            # A removed entity_id is added again
+            self._removed_count -= 1
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
+        self._async_mark_changed(key)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
         super().__delitem__(key)
+        self._async_mark_changed(key)
+        self._removed_count += 1
+        if self._removed_count > MAX_REMOVED_ENTITY_IDS:
+            self._async_forget_removed()
+
+    def _async_mark_changed(self, key: str) -> None:
+        """Move the entity_id to the end of the changed versions."""
+        self.version += 1
+        changed_versions = self._changed_versions
+        changed_versions.pop(key, None)
+        changed_versions[key] = self.version
+
+    def _async_forget_removed(self) -> None:
+        """Forget removed entity_ids, older deltas are no longer available."""
+        data = self.data
+        self._changed_versions = {
+            entity_id: version
+            for entity_id, version in self._changed_versions.items()
+            if entity_id in data
+        }
+        self._removed_count = 0
+        self._oldest_delta_version = self.version
+
+    def snapshot(self) -> StatesSnapshot:
+        """Return an immutable view of the states at the current version.
+
+        The states are copied at most once per version.
+        """
+        if self._snapshot.version != self.version:
+            self._snapshot = StatesSnapshot(
+                self.version, MappingProxyType(self.data.copy())
+            )
+        return self._snapshot
+
+    def changed_since(self, version: int) -> StatesDelta | None:
+        """Return the states changed or removed after version.
+
+        Returns None if the changes are no longer known and a new
+        snapshot has to be taken instead.
+        """
+        if version < self._oldest_delta_version or version > self.version:
+            return None
+        data = self.data
+        changed: list[State] = []
+        removed: list[str] = []
+        for entity_id, changed_version in reversed(self._changed_versions.items()):
+            if changed_version <= version:
+                break
+            if (state := data.get(entity_id)) is None:
+                removed.append(entity_id)
+            else:
+                changed.append(state)
+        return StatesDelta(self.version, changed, removed)
 
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
@@ -2067,7 +2393,13 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2148,6 +2480,28 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_snapshot(self) -> StatesSnapshot:
+        """Return an immutable view of all states and their version.
+
+        Pass the version to async_changed_since later to get only the
+        states that changed after the snapshot.
+
+        This method must be run in the event loop.
+        """
+        return self._states.snapshot()
+
+    @callback
+    def async_changed_since(self, version: int) -> StatesDelta | None:
+        """Return the states changed or removed after version.
+
+        Returns None if the changes since version are no longer known,
+        in which case async_snapshot must be used instead.
+
+        This method must be run in the event loop.
+        """
+        return self._states.changed_since(version)
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2283,6 +2637,39 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the states of multiple entities, add entities if they do not exist.
+
+        States is an iterable of (entity_id, new_state, attributes) tuples.
+
+        All states are written with the same timestamp so listeners can tell
+        they were updated together. Each state gets its own context unless
+        a context is passed and fires its own state_changed event, like
+        async_set.
+
+        This method must be run in the event loop.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        async_set_internal = self.async_set_internal
+        for entity_id, new_state, attributes in states:
+            async_set_internal(
+                entity_id.lower(),
+                str(new_state),
+                attributes or {},
+                force_update,
+                context,
+                None,
+                timestamp,
+            )
+
     @callback
     def async_set_internal(
         self,
@@ -2317,7 +2704,11 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            # Callers often pass the attributes of the old state
+            # back, in that case the identity check avoids comparing
+            # every attribute.
+            old_attributes = old_state.attributes
+            same_attr = old_attributes is attributes or old_attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
@@ -2358,6 +2749,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        elif type(attributes) is not ScalarAttributes:
+            attributes = _scalar_attributes_or_as_is(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
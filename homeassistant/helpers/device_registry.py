@@ -624,11 +624,19 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         data = self.data
         return [data[key] for key in self._area_id_index.get(area_id, ())]
 
+    def get_device_ids_for_area_id(self, area_id: str) -> list[str]:
+        """Get device ids for area."""
+        return list(self._area_id_index.get(area_id, ()))
+
     def get_devices_for_label(self, label: str) -> list[DeviceEntry]:
         """Get devices for label."""
         data = self.data
         return [data[key] for key in self._labels_index.get(label, ())]
 
+    def get_device_ids_for_label(self, label: str) -> list[str]:
+        """Get device ids for label."""
+        return list(self._labels_index.get(label, ()))
+
     def get_devices_for_config_entry_id(
         self, config_entry_id: str
     ) -> list[DeviceEntry]:
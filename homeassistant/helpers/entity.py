@@ -196,6 +196,21 @@ def get_unit_of_measurement(hass: HomeAssistant, entity_id: str) -> str | None:
     return entry.unit_of_measurement
 
 
+@callback
+def async_write_ha_states(hass: HomeAssistant, entities: Iterable[Entity]) -> None:
+    """Write the states of multiple entities to the state machine.
+
+    The states are written with the same timestamp, like
+    StateMachine.async_set_many. Each entity keeps its own context and
+    every state fires its own state_changed event.
+    """
+    if hass.loop_thread_id != threading.get_ident():
+        report_non_thread_safe_operation("async_write_ha_states")
+    timestamp = timer()
+    for entity in entities:
+        entity._async_write_ha_state_in_batch(timestamp)  # noqa: SLF001
+
+
 ENTITY_CATEGORIES_SCHEMA: Final = vol.Coerce(EntityCategory)
 
 
@@ -496,6 +511,9 @@ class Entity(
     _context: Context | None = None
     _context_set: float | None = None
 
+    # Timestamp shared by a batch of writes, see async_write_ha_states
+    _write_batch_timestamp: float | None = None
+
     # If entity is added to an entity platform
     _platform_state = EntityPlatformState.NOT_ADDED
 
@@ -1004,6 +1022,17 @@ class Entity(
             report_non_thread_safe_operation("async_write_ha_state")
         self._async_write_ha_state()
 
+    @callback
+    def _async_write_ha_state_in_batch(self, timestamp: float) -> None:
+        """Write the state to the state machine as part of a batch."""
+        if not self.hass or not self._verified_state_writable:
+            self._async_verify_state_writable()
+        self._write_batch_timestamp = timestamp
+        try:
+            self._async_write_ha_state()
+        finally:
+            self._write_batch_timestamp = None
+
     def _stringify_state(self, available: bool) -> str:
         """Convert state to string."""
         if not available:
@@ -1205,6 +1234,9 @@ class Entity(
             self._context = None
             self._context_set = None
 
+        if (batch_timestamp := self._write_batch_timestamp) is not None:
+            time_now = batch_timestamp
+
         try:
             hass.states.async_set_internal(
                 entity_id,
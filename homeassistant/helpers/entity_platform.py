@@ -18,6 +18,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     CALLBACK_TYPE,
     DOMAIN as HOMEASSISTANT_DOMAIN,
+    Context,
     CoreState,
     HomeAssistant,
     ServiceCall,
@@ -152,6 +153,10 @@ class EntityPlatform:
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
+        # Handlers serving an entity service method for many entities at once
+        self._batch_service_handlers: dict[
+            str, Callable[[list[Entity], dict[str, Any]], Awaitable[None]]
+        ] = {}
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -1011,6 +1016,48 @@ class EntityPlatform:
             supports_response=supports_response,
         )
 
+    @callback
+    def async_register_batch_service_handler(
+        self,
+        func: str,
+        handler: Callable[[list[Entity], dict[str, Any]], Awaitable[None]],
+    ) -> CALLBACK_TYPE:
+        """Register a handler serving an entity service method for many entities.
+
+        When a service call targets more than one entity of this platform,
+        the handler is called once with all of them and the service data
+        instead of calling the entity method func on each entity. This
+        allows sending a single group or multicast command.
+        """
+        self._batch_service_handlers[func] = handler
+
+        @callback
+        def _async_remove() -> None:
+            del self._batch_service_handlers[func]
+
+        return _async_remove
+
+    @callback
+    def async_supports_batch_service_call(self, func: str) -> bool:
+        """Return if a batch handler is registered for an entity service method."""
+        return func in self._batch_service_handlers
+
+    async def async_handle_batch_service_call(
+        self,
+        func: str,
+        entities: list[Entity],
+        data: dict[str, Any],
+        context: Context,
+    ) -> None:
+        """Call the batch handler for an entity service method."""
+        for entity in entities:
+            entity.async_set_context(context)
+        if self.parallel_updates:
+            async with self.parallel_updates:
+                await self._batch_service_handlers[func](entities, data)
+        else:
+            await self._batch_service_handlers[func](entities, data)
+
     async def _async_update_entity_states(self) -> None:
         """Update the states of all the polling entities.
 
@@ -623,6 +623,19 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             if not (entry := data[key]).disabled_by or include_disabled_entities
         ]
 
+    def get_entity_ids_for_device_id(
+        self, device_id: str, include_disabled_entities: bool = False
+    ) -> list[str]:
+        """Get entity ids for device."""
+        if include_disabled_entities:
+            return list(self._device_id_index.get(device_id, ()))
+        data = self.data
+        return [
+            key
+            for key in self._device_id_index.get(device_id, ())
+            if not data[key].disabled_by
+        ]
+
     def get_entries_for_config_entry_id(
         self, config_entry_id: str
     ) -> list[RegistryEntry]:
@@ -637,11 +650,19 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         data = self.data
         return [data[key] for key in self._area_id_index.get(area_id, ())]
 
+    def get_entity_ids_for_area_id(self, area_id: str) -> list[str]:
+        """Get entity ids for area."""
+        return list(self._area_id_index.get(area_id, ()))
+
     def get_entries_for_label(self, label: str) -> list[RegistryEntry]:
         """Get entries for label."""
         data = self.data
         return [data[key] for key in self._labels_index.get(label, ())]
 
+    def get_entity_ids_for_label(self, label: str) -> list[str]:
+        """Get entity ids for label."""
+        return list(self._labels_index.get(label, ()))
+
 
 def _validate_item(
     hass: HomeAssistant,
@@ -1491,9 +1491,9 @@ class _TrackPointUTCTime:
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        loop = self.hass.loop
-        self._cancel_callback = loop.call_at(
-            loop.time() + self.expected_fire_timestamp - time.time(), self
+        hass = self.hass
+        self._cancel_callback = hass.timer_wheel.call_at(
+            hass.loop.time() + self.expected_fire_timestamp - time.time(), self
         )
 
     @callback
@@ -1512,8 +1512,7 @@ class _TrackPointUTCTime:
         # time.
         if (delta := (self.expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
-            loop = self.hass.loop
-            self._cancel_callback = loop.call_at(loop.time() + delta, self)
+            self._cancel_callback = self.hass.timer_wheel.call_later(delta, self)
             return
 
         self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
@@ -1639,10 +1638,8 @@ class _TrackTimeInterval:
         """Schedule the timer."""
         if TYPE_CHECKING:
             assert self._track_job is not None
-        hass = self.hass
-        loop = hass.loop
-        self._timer_handle = loop.call_at(
-            loop.time() + self.seconds, self._interval_listener, self._track_job
+        self._timer_handle = self.hass.timer_wheel.call_later(
+            self.seconds, self._interval_listener, self._track_job
         )
 
     @callback
@@ -1964,11 +1961,19 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
 
     if info.filter(entity_id):
-        return True
+        # Skip the re-render if only parts of the state the
+        # template did not read have changed
+        return (
+            old_state is None
+            or new_state is None
+            or info.filter_state_change(old_state, new_state)
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
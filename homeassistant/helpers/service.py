@@ -68,6 +68,7 @@ from .typing import ConfigType, TemplateVarsType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
     from .entity import Entity
+    from .entity_platform import EntityPlatform
 
 CONF_SERVICE_ENTITY_ID = "entity_id"
 
@@ -1003,6 +1004,13 @@ async def entity_service_call(
             await entity.async_update_ha_state(True)
         return {entity.entity_id: single_response} if return_response else None
 
+    call_entities = entities
+    batch_calls: list[Coroutine[Any, Any, None]] = []
+    if isinstance(func, str) and not return_response:
+        call_entities, batch_calls = _async_batch_entity_service_calls(
+            func, entities, cast(dict[str, Any], data), call.context
+        )
+
     # Use asyncio.gather here to ensure the returned results
     # are in the same order as the entities list
     results: list[ServiceResponse | BaseException] = await asyncio.gather(
@@ -1010,16 +1018,18 @@ async def entity_service_call(
             entity.async_request_call(
                 _handle_entity_call(hass, entity, func, data, call.context)
             )
-            for entity in entities
+            for entity in call_entities
         ],
+        *batch_calls,
         return_exceptions=True,
     )
 
-    response_data: EntityServiceResponse = {}
-    for entity, result in zip(entities, results, strict=False):
+    for result in results:
         if isinstance(result, BaseException):
             raise result from None
-        response_data[entity.entity_id] = result
+    response_data: EntityServiceResponse = dict(
+        zip((entity.entity_id for entity in call_entities), results, strict=False)
+    )
 
     tasks: list[asyncio.Task[None]] = []
 
@@ -1041,6 +1051,38 @@ async def entity_service_call(
     return response_data if return_response and response_data else None
 
 
+@callback
+def _async_batch_entity_service_calls(
+    func: str, entities: list[Entity], data: dict[str, Any], context: Context
+) -> tuple[list[Entity], list[Coroutine[Any, Any, None]]]:
+    """Group entities of platforms with a batch handler for an entity method.
+
+    Returns the entities the method must still be called on and the
+    batch calls serving the other entities.
+    """
+    platform_entities: dict[EntityPlatform, list[Entity]] = {}
+    call_entities: list[Entity] = []
+    for entity in entities:
+        if (
+            platform := entity.platform
+        ) is not None and platform.async_supports_batch_service_call(func):
+            platform_entities.setdefault(platform, []).append(entity)
+        else:
+            call_entities.append(entity)
+
+    batch_calls: list[Coroutine[Any, Any, None]] = []
+    for platform, batch_entities in platform_entities.items():
+        if len(batch_entities) == 1:
+            call_entities.extend(batch_entities)
+            continue
+        batch_calls.append(
+            platform.async_handle_batch_service_call(
+                func, batch_entities, data, context
+            )
+        )
+    return call_entities, batch_calls
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -29,6 +29,7 @@ import weakref
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2.meta import find_undeclared_variables
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -150,6 +151,14 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+#
+# COMPILED_TEMPLATE_CACHE_SIZE is the number of recently used compiled
+# templates each environment keeps alive. Without it the compiled code is
+# only held weakly and a template that is created, rendered and discarded
+# repeatedly (e.g. in a script or the websocket render_template command)
+# is compiled again every time.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 512
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
@@ -340,6 +349,10 @@ def _false(arg: str) -> bool:
     return False
 
 
+def _true_state_change(old_state: State, new_state: State) -> bool:
+    return True
+
+
 @lru_cache(maxsize=EVAL_CACHE_SIZE)
 def _cached_parse_result(render_result: str) -> Any:
     """Parse a result and cache the result."""
@@ -386,6 +399,11 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "state_value",
+        "state_attributes",
+        "state_attribute_names",
+        "state_metadata",
+        "filter_state_change",
     )
 
     def __init__(self, template: Template) -> None:
@@ -404,6 +422,12 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
+        # The parts of the states that were read while rendering
+        self.state_value = False
+        self.state_attributes = False
+        self.state_attribute_names: collections.abc.Set[str] = set()
+        self.state_metadata = False
+        self.filter_state_change: Callable[[State, State], bool] = _true_state_change
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -416,6 +440,10 @@ class RenderInfo:
             f" entities={self.entities}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
+            f" state_value={self.state_value}"
+            f" state_attributes={self.state_attributes}"
+            f" state_attribute_names={self.state_attribute_names}"
+            f" state_metadata={self.state_metadata}"
             f" exception={self.exception}"
             f" is_static={self.is_static}"
             ">"
@@ -444,6 +472,26 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def _filter_state_value_and_attributes(
+        self, old_state: State, new_state: State
+    ) -> bool:
+        """Template should re-render if a part of the state it read changed.
+
+        Only when the state metadata was not read.
+        """
+        if self.state_value and old_state.state != new_state.state:
+            return True
+        old_attributes = old_state.attributes
+        new_attributes = new_state.attributes
+        if old_attributes is new_attributes:
+            return False
+        if self.state_attributes:
+            return old_attributes != new_attributes
+        return any(
+            old_attributes.get(name, _SENTINEL) != new_attributes.get(name, _SENTINEL)
+            for name in self.state_attribute_names
+        )
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -459,6 +507,7 @@ class RenderInfo:
         self.entities = frozenset(self.entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
+        self.state_attribute_names = frozenset(self.state_attribute_names)
 
     def _freeze(self) -> None:
         self._freeze_sets()
@@ -472,6 +521,9 @@ class RenderInfo:
         if self.exception:
             return
 
+        if not self.state_metadata and not self.has_time:
+            self.filter_state_change = self._filter_state_value_and_attributes
+
         if not self.all_states_lifecycle:
             if self.domains_lifecycle:
                 self.filter_lifecycle = self._filter_lifecycle_domains
@@ -505,6 +557,7 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_pure",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -539,6 +592,7 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._pure = False
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -566,7 +620,7 @@ class Template:
         if self.is_static or self._compiled_code is not None:
             return
 
-        if compiled := self._env.template_cache.get(self.template):
+        if compiled := self._env.async_get_compiled(self.template):
             self._compiled_code = compiled
             return
 
@@ -625,9 +679,20 @@ class Template:
 
         compiled = self._compiled or self._ensure_compiled(limited, strict, log_fn)
 
-        if variables is not None:
-            kwargs.update(variables)
+        if self._pure:
+            render_result = self._async_render_pure(compiled)
+        else:
+            if variables is not None:
+                kwargs.update(variables)
+            render_result = self._async_render_compiled(compiled, **kwargs)
+
+        if not parse_result or self.hass and self.hass.config.legacy_templates:
+            return render_result
 
+        return self._parse_result(render_result)
+
+    def _async_render_compiled(self, compiled: jinja2.Template, **kwargs: Any) -> str:
+        """Render the compiled template and check the size of the output."""
         try:
             render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
@@ -638,12 +703,20 @@ class Template:
                 f"Template output exceeded maximum size of {MAX_TEMPLATE_OUTPUT} characters"
             )
 
-        render_result = render_result.strip()
+        return render_result.strip()
 
-        if not parse_result or self.hass and self.hass.config.legacy_templates:
-            return render_result
+    def _async_render_pure(self, compiled: jinja2.Template) -> str:
+        """Render a pure template, reusing the output of an earlier render.
 
-        return self._parse_result(render_result)
+        A pure template does not reference any variable and only uses
+        deterministic filters and tests, so its output never changes.
+        """
+        assert self._compiled_code is not None
+        pure_render_cache = self._env.pure_render_cache
+        if (render_result := pure_render_cache.get(self._compiled_code)) is None:
+            render_result = self._async_render_compiled(compiled)
+            pure_render_cache[self._compiled_code] = render_result
+        return render_result
 
     def _parse_result(self, render_result: str) -> Any:
         """Parse the result."""
@@ -850,6 +923,7 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        self._pure = self._compiled_code in env.pure_template_code
 
         return self._compiled
 
@@ -1040,19 +1114,46 @@ class TemplateStateBase(State):
         self._entity_id = entity_id
         self._cache: dict[str, Any] = {}
 
-    def _collect_state(self) -> None:
-        if self._collect and (render_info := _render_info.get()):
+    # States from iterating a domain or all states are not collected
+    # as entities, but the parts of the state that are read still are
+    # so a change to a part that was never read does not re-render.
+
+    def _collect_entity(self) -> RenderInfo | None:
+        if (render_info := _render_info.get()) is not None and self._collect:
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+        return render_info
+
+    def _collect_state(self) -> None:
+        if render_info := self._collect_entity():
+            render_info.state_metadata = True
+
+    def _collect_state_value(self) -> None:
+        if render_info := self._collect_entity():
+            render_info.state_value = True
+
+    def _collect_attributes(self) -> None:
+        if render_info := self._collect_entity():
+            render_info.state_attributes = True
+
+    def _get_attribute(self, name: str) -> Any:
+        """Return a single attribute and only collect that attribute."""
+        if render_info := self._collect_entity():
+            render_info.state_attribute_names.add(name)  # type: ignore[attr-defined]
+        return self._state.attributes.get(name)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
+        if item == "state":
+            # _collect_state_value inlined here for performance
+            if (render_info := _render_info.get()) is not None:
+                if self._collect:
+                    render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                render_info.state_value = True
+            return self._state.state
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
-            return getattr(self._state, item)
+            return getattr(self, item)
         if item == "entity_id":
             return self._entity_id
         if item == "state_with_unit":
@@ -1070,13 +1171,13 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.state
 
     @property
     def attributes(self) -> ReadOnlyDict[str, Any]:  # type: ignore[override]
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_attributes()
         return self._state.attributes
 
     @property
@@ -1106,19 +1207,19 @@ class TemplateStateBase(State):
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_entity()
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_entity()
         return self._state.object_id
 
     @property
     def name(self) -> str:  # type: ignore[override]
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_attributes()
         return self._state.name
 
     @property
@@ -1135,7 +1236,9 @@ class TemplateStateBase(State):
             async_rounded_state,
         )
 
-        self._collect_state()
+        self._collect_state_value()
+        if with_unit:
+            self._collect_attributes()
         if rounded and self._state.domain == SENSOR_DOMAIN:
             state = async_rounded_state(self._hass, self._entity_id, self._state)
         else:
@@ -1163,6 +1266,7 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        self._collect_state()
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -1334,8 +1438,7 @@ def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
 def device_entities(hass: HomeAssistant, _device_id: str) -> Iterable[str]:
     """Get entity ids for entities tied to a device."""
     entity_reg = entity_registry.async_get(hass)
-    entries = entity_registry.async_entries_for_device(entity_reg, _device_id)
-    return [entry.entity_id for entry in entries]
+    return entity_reg.entities.get_entity_ids_for_device_id(_device_id)
 
 
 def integration_entities(hass: HomeAssistant, entry_name: str) -> Iterable[str]:
@@ -1603,19 +1706,16 @@ def area_entities(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
         _area_id = area_id_or_name
     if _area_id is None:
         return []
-    ent_reg = entity_registry.async_get(hass)
-    entity_ids = [
-        entry.entity_id
-        for entry in entity_registry.async_entries_for_area(ent_reg, _area_id)
-    ]
+    entities = entity_registry.async_get(hass).entities
+    entity_ids = entities.get_entity_ids_for_area_id(_area_id)
     dev_reg = device_registry.async_get(hass)
     # We also need to add entities tied to a device in the area that don't themselves
     # have an area specified since they inherit the area from the device.
     entity_ids.extend(
         [
             entity.entity_id
-            for device in device_registry.async_entries_for_area(dev_reg, _area_id)
-            for entity in entity_registry.async_entries_for_device(ent_reg, device.id)
+            for device_id in dev_reg.devices.get_device_ids_for_area_id(_area_id)
+            for entity in entities.get_entries_for_device_id(device_id)
             if entity.area_id is None
         ]
     )
@@ -1634,8 +1734,7 @@ def area_devices(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
     if _area_id is None:
         return []
     dev_reg = device_registry.async_get(hass)
-    entries = device_registry.async_entries_for_area(dev_reg, _area_id)
-    return [entry.id for entry in entries]
+    return dev_reg.devices.get_device_ids_for_area_id(_area_id)
 
 
 def labels(hass: HomeAssistant, lookup_value: Any = None) -> Iterable[str | None]:
@@ -1711,8 +1810,7 @@ def label_devices(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
     if (_label_id := _label_id_or_name(hass, label_id_or_name)) is None:
         return []
     dev_reg = device_registry.async_get(hass)
-    entries = device_registry.async_entries_for_label(dev_reg, _label_id)
-    return [entry.id for entry in entries]
+    return dev_reg.devices.get_device_ids_for_label(_label_id)
 
 
 def label_entities(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
@@ -1720,8 +1818,7 @@ def label_entities(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
     if (_label_id := _label_id_or_name(hass, label_id_or_name)) is None:
         return []
     ent_reg = entity_registry.async_get(hass)
-    entries = entity_registry.async_entries_for_label(ent_reg, _label_id)
-    return [entry.entity_id for entry in entries]
+    return ent_reg.entities.get_entity_ids_for_label(_label_id)
 
 
 def closest(hass, *args):
@@ -1875,7 +1972,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._get_attribute(name)  # noqa: SLF001
     return None
 
 
@@ -2839,6 +2936,182 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+# Filters and tests whose result only depends on their arguments. Filters
+# that look up other filters or tests by name (map, select, ...), read the
+# clock, timezone or hass, or are random are left out on purpose.
+_PURE_FILTERS = frozenset(
+    {
+        "abs",
+        "acos",
+        "add",
+        "asin",
+        "atan",
+        "atan2",
+        "average",
+        "base64_decode",
+        "base64_encode",
+        "batch",
+        "bitwise_and",
+        "bitwise_or",
+        "bitwise_xor",
+        "bool",
+        "capitalize",
+        "center",
+        "contains",
+        "cos",
+        "count",
+        "d",
+        "default",
+        "dictsort",
+        "e",
+        "escape",
+        "filesizeformat",
+        "first",
+        "float",
+        "forceescape",
+        "format",
+        "from_json",
+        "groupby",
+        "iif",
+        "indent",
+        "int",
+        "is_defined",
+        "is_number",
+        "items",
+        "join",
+        "last",
+        "length",
+        "list",
+        "log",
+        "lower",
+        "max",
+        "median",
+        "min",
+        "multiply",
+        "ord",
+        "ordinal",
+        "pack",
+        "regex_findall",
+        "regex_findall_index",
+        "regex_match",
+        "regex_replace",
+        "regex_search",
+        "replace",
+        "reverse",
+        "round",
+        "safe",
+        "sin",
+        "slice",
+        "slugify",
+        "sort",
+        "sqrt",
+        "statistical_mode",
+        "string",
+        "striptags",
+        "sum",
+        "tan",
+        "title",
+        "to_json",
+        "tojson",
+        "trim",
+        "truncate",
+        "unique",
+        "unpack",
+        "upper",
+        "urlencode",
+        "version",
+        "wordcount",
+        "wordwrap",
+    }
+)
+_PURE_TESTS = frozenset(
+    {
+        "!=",
+        "<",
+        "<=",
+        "==",
+        ">",
+        ">=",
+        "boolean",
+        "contains",
+        "datetime",
+        "defined",
+        "divisibleby",
+        "eq",
+        "equalto",
+        "escaped",
+        "even",
+        "false",
+        "float",
+        "ge",
+        "greaterthan",
+        "gt",
+        "in",
+        "integer",
+        "is_number",
+        "iterable",
+        "le",
+        "lessthan",
+        "list",
+        "lower",
+        "lt",
+        "mapping",
+        "match",
+        "ne",
+        "none",
+        "number",
+        "odd",
+        "sameas",
+        "search",
+        "sequence",
+        "set",
+        "string",
+        "string_like",
+        "true",
+        "tuple",
+        "undefined",
+        "upper",
+    }
+)
+
+
+def _is_pure_template(ast: jinja2.nodes.Template) -> bool:
+    """Return if a parsed template always renders the same output.
+
+    A template is pure when it does not reference any variable, global or
+    function, does not import other templates and only uses filters and
+    tests which are deterministic.
+    """
+    if find_undeclared_variables(ast):
+        return False
+    # find_undeclared_variables does not report names which resolve to
+    # environment globals such as states, now or is_state.
+    env_globals = ast.environment.globals
+    for node in ast.find_all(
+        (
+            jinja2.nodes.Name,
+            jinja2.nodes.Filter,
+            jinja2.nodes.Test,
+            jinja2.nodes.Extends,
+            jinja2.nodes.FromImport,
+            jinja2.nodes.Import,
+            jinja2.nodes.Include,
+        )
+    ):
+        if isinstance(node, jinja2.nodes.Name):
+            if node.ctx == "load" and node.name in env_globals:
+                return False
+        elif isinstance(node, jinja2.nodes.Filter):
+            if node.name not in _PURE_FILTERS:
+                return False
+        elif isinstance(node, jinja2.nodes.Test):
+            if node.name not in _PURE_TESTS:
+                return False
+        else:
+            return False
+    return True
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2855,6 +3128,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
+        self.compiled_cache: LRU[str, CodeType] = LRU(COMPILED_TEMPLATE_CACHE_SIZE)
+        self.pure_template_code: weakref.WeakSet[CodeType] = weakref.WeakSet()
+        self.pure_render_cache: weakref.WeakKeyDictionary[CodeType, str] = (
+            weakref.WeakKeyDictionary()
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3209,6 +3487,18 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         compiled = super().compile(source)
         self.template_cache[source] = compiled
+        if isinstance(source, str):
+            self.compiled_cache[source] = compiled
+            if _is_pure_template(self.parse(source)):
+                self.pure_template_code.add(compiled)
+        return compiled
+
+    def async_get_compiled(self, source: str) -> CodeType | None:
+        """Return the cached compiled code for a template source."""
+        if (compiled := self.compiled_cache.get(source)) is not None:
+            return compiled
+        if (compiled := self.template_cache.get(source)) is not None:
+            self.compiled_cache[source] = compiled
         return compiled
 
 
@@ -7,9 +7,12 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
+from typing import Any
 
-from homeassistant import core
+from homeassistant import config_entries, core, loader
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
@@ -116,6 +119,94 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+async def _fire_events_with_listeners(hass, listen):
+    """Fire events with a growing number of listeners for other keys."""
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+    total = 0.0
+
+    for listener_count in (1, 10, 100, 1000):
+        count = 0
+
+        @core.callback
+        def listener(_):
+            """Handle event."""
+            nonlocal count
+            count += 1
+
+        unsubs = [
+            listen(event_name, f"light.kitchen_{idx}", listener)
+            for idx in range(listener_count)
+        ]
+        event_data = {"entity_id": "light.kitchen_0"}
+
+        start = timer()
+        for _ in range(events_to_fire):
+            hass.bus.async_fire(event_name, event_data)
+        await hass.async_block_till_done()
+        runtime = timer() - start
+
+        assert count == events_to_fire
+        print(f"{listener_count} listeners: {runtime}s")
+        total += runtime
+        for unsub in unsubs:
+            unsub()
+
+    return total
+
+
+@benchmark
+async def fire_events_with_filtered_listeners(hass):
+    """Fire events with many listeners each filtering on an entity_id."""
+
+    def listen(event_name, entity_id, listener):
+        @core.callback
+        def event_filter(event_data):
+            """Filter event."""
+            return event_data["entity_id"] == entity_id
+
+        return hass.bus.async_listen(event_name, listener, event_filter=event_filter)
+
+    return await _fire_events_with_listeners(hass, listen)
+
+
+@benchmark
+async def fire_events_with_keyed_listeners(hass):
+    """Fire events with many listeners each keyed on an entity_id."""
+
+    def listen(event_name, entity_id, listener):
+        return hass.bus.async_listen_keyed(event_name, "entity_id", entity_id, listener)
+
+    return await _fire_events_with_listeners(hass, listen)
+
+
+@benchmark
+async def set_states(hass):
+    """Set the state of 1000 entities one at a time."""
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(1000)]
+
+    start = timer()
+    for value in range(100):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, str(value))
+
+    return timer() - start
+
+
+@benchmark
+async def set_many_states(hass):
+    """Set the state of 1000 entities in one batch."""
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(1000)]
+
+    start = timer()
+    for value in range(100):
+        hass.states.async_set_many(
+            (entity_id, str(value), None) for entity_id in entity_ids
+        )
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -308,3 +399,372 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def websocket_binary_messages(hass):
+    """Encode the subscribe_entities messages of 5000 sensors as binary messages."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api import messages
+
+    attributes = {
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+    }
+    for idx in range(5000):
+        hass.states.async_set(
+            f"sensor.power_{idx}", "0", {**attributes, "friendly_name": f"Power {idx}"}
+        )
+    states = hass.states.async_all()
+    init_message = b"".join(
+        (
+            b'{"id":1,"type":"event","event":{"a":{',
+            b",".join(state.as_compressed_state_json for state in states),
+            b"}}}",
+        )
+    )
+    diff_messages = []
+
+    @core.callback
+    def listener(event):
+        """Serialize the state diff."""
+        diff_messages.append(messages.cached_state_diff_message(b"1", event))
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    for idx, state in enumerate(states):
+        hass.states.async_set(state.entity_id, str(idx), state.attributes)
+    await hass.async_block_till_done()
+    json_messages = [init_message, *diff_messages]
+
+    longest_block = 0.0
+    running = True
+
+    async def _measure_blocking() -> None:
+        """Track the longest time the event loop did not run this task."""
+        nonlocal longest_block
+        last = timer()
+        while running:
+            await asyncio.sleep(0)
+            now = timer()
+            longest_block = max(longest_block, now - last)
+            last = now
+
+    async def _send_messages(in_executor: bool) -> tuple[float, float, list[bytes]]:
+        """Encode the messages like the websocket writer, yielding after each."""
+        nonlocal longest_block, running
+        longest_block = 0.0
+        running = True
+        measure_task = hass.async_create_task(_measure_blocking())
+        await asyncio.sleep(0)
+        encoder = messages.BinaryMessageEncoder()
+        binary_messages = []
+        start = timer()
+        for message in json_messages:
+            if in_executor:
+                binary_messages.append(await encoder.async_encode(hass, message))
+            else:
+                binary_messages.append(encoder.encode(message))
+            await asyncio.sleep(0)
+        runtime = timer() - start
+        running = False
+        await measure_task
+        return runtime, longest_block, binary_messages
+
+    loop_runtime, loop_block, binary_messages = await _send_messages(False)
+    runtime, block, executor_binary_messages = await _send_messages(True)
+    assert executor_binary_messages == binary_messages
+    print(
+        f"JSON: {sum(map(len, json_messages))} bytes,"
+        f" binary: {sum(map(len, binary_messages))} bytes"
+    )
+    print(
+        f"Event loop blocked for at most {loop_block * 1000:.2f}ms"
+        f" encoding on the loop ({loop_runtime:.3f}s) and"
+        f" {block * 1000:.2f}ms encoding large messages in the executor"
+        f" ({runtime:.3f}s)"
+    )
+    return runtime
+
+
+@benchmark
+async def render_registry_templates(hass):
+    """Render a template using area and label entities 10k times.
+
+    The registries hold 1000 entities spread over 10 areas and one label.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+        label_registry as lr,
+        template,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await asyncio.gather(
+            ar.async_load(hass),
+            dr.async_load(hass),
+            er.async_load(hass),
+            fr.async_load(hass),
+            lr.async_load(hass),
+        )
+        area_reg = ar.async_get(hass)
+        entity_reg = er.async_get(hass)
+        label = lr.async_get(hass).async_create("Bench")
+        areas = [area_reg.async_create(f"Area {idx}") for idx in range(10)]
+        for idx in range(1000):
+            entry = entity_reg.async_get_or_create("sensor", "benchmark", str(idx))
+            entity_reg.async_update_entity(
+                entry.entity_id, area_id=areas[idx % 10].id, labels={label.label_id}
+            )
+            hass.states.async_set(entry.entity_id, str(idx % 2))
+
+        tpl = template.Template(
+            "{{ area_entities('Area 0') | select('is_state', '0') | list | count }}"
+            " {{ label_entities('Bench') | select('is_state', '1') | list | count }}",
+            hass,
+        )
+
+        start = timer()
+        for _ in range(10**4):
+            tpl.async_render_to_info()
+        runtime = timer() - start
+        await hass.async_stop()
+        return runtime
+
+
+async def _entity_service_calls(hass, batch):
+    """Call an entity service method on 200 entities of one platform."""
+    # pylint: disable-next=import-outside-toplevel
+    from datetime import timedelta
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import entity, entity_platform, service
+
+    class BenchmarkEntity(entity.Entity):
+        """Entity counting turn off calls."""
+
+        _attr_should_poll = False
+        turned_off = 0
+
+        async def async_turn_off(self, **kwargs):
+            """Turn the entity off."""
+            self.turned_off += 1
+
+    platform = entity_platform.EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="light",
+        platform_name="benchmark",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    entities = {}
+    for idx in range(200):
+        ent = BenchmarkEntity()
+        ent.hass = hass
+        ent.platform = platform
+        ent.entity_id = f"light.benchmark_{idx}"
+        entities[ent.entity_id] = ent
+
+    if batch:
+
+        async def _turn_off_all(batch_entities, data):
+            for ent in batch_entities:
+                ent.turned_off += 1
+
+        platform.async_register_batch_service_handler("async_turn_off", _turn_off_all)
+
+    call = core.ServiceCall("light", "turn_off", {"entity_id": "all"})
+    start = timer()
+    for _ in range(10**3):
+        await service.entity_service_call(hass, entities, "async_turn_off", call)
+    runtime = timer() - start
+    assert all(ent.turned_off == 10**3 for ent in entities.values())
+    return runtime
+
+
+@benchmark
+async def entity_service_call(hass):
+    """Call an entity service method on each entity."""
+    return await _entity_service_calls(hass, False)
+
+
+@benchmark
+async def entity_service_call_batch(hass):
+    """Call an entity service method through a platform batch handler."""
+    return await _entity_service_calls(hass, True)
+
+
+async def _record_state_changes(hass, bulk_insert_states):
+    """Record 100k state changes of 300 power monitor entities.
+
+    The database defaults to a temporary SQLite file; set
+    BENCHMARK_RECORDER_DB_URL to benchmark another dialect.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import recorder as recorder_helper
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.setup import async_setup_component
+
+    events_to_record = 10**5
+    entity_count = 300
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        db_url = os.environ.get(
+            "BENCHMARK_RECORDER_DB_URL", f"sqlite:///{tmp_dir}/benchmark.db"
+        )
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        recorder_helper.async_initialize_recorder(hass)
+        assert await async_setup_component(
+            hass,
+            recorder.DOMAIN,
+            {
+                recorder.DOMAIN: {
+                    recorder.CONF_DB_URL: db_url,
+                    recorder.CONF_BULK_INSERT_STATES: bulk_insert_states,
+                }
+            },
+        )
+        await hass.async_start()
+        instance = recorder.get_instance(hass)
+        await instance.async_block_till_done()
+        attributes = {"unit_of_measurement": "W", "device_class": "power"}
+
+        start = timer()
+
+        for idx in range(events_to_record):
+            hass.states.async_set(
+                f"sensor.power_{idx % entity_count}", str(idx), attributes
+            )
+        await instance.async_block_till_done()
+
+        runtime = timer() - start
+        print(
+            f"Recorded {events_to_record / runtime:.0f} events/second"
+            f" using {instance.dialect_name}"
+        )
+        await hass.async_stop()
+        return runtime
+
+
+@benchmark
+async def record_state_changes(hass):
+    """Record 100k state changes with the ORM write path."""
+    return await _record_state_changes(hass, False)
+
+
+@benchmark
+async def record_state_changes_bulk_insert(hass):
+    """Record 100k state changes with the bulk insert write path."""
+    return await _record_state_changes(hass, True)
+
+
+@benchmark
+async def compile_sensor_statistics(hass):
+    """Compile 5-minute statistics for 3000 sensors with 10 changes each.
+
+    The statistics are compiled with and without aggregating the measurements
+    in the database and the results must be identical. The states change on
+    whole seconds to integer values so the sums are exact in any order.
+
+    The database defaults to a temporary SQLite file; set
+    BENCHMARK_RECORDER_DB_URL to benchmark another dialect.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.util import session_scope
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor import recorder as sensor_recorder
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import recorder as recorder_helper
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.setup import async_setup_component
+
+    entity_count = 3000
+    changes_per_entity = 10
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        db_url = os.environ.get(
+            "BENCHMARK_RECORDER_DB_URL", f"sqlite:///{tmp_dir}/benchmark.db"
+        )
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        recorder_helper.async_initialize_recorder(hass)
+        assert await async_setup_component(
+            hass, recorder.DOMAIN, {recorder.DOMAIN: {recorder.CONF_DB_URL: db_url}}
+        )
+        await hass.async_start()
+        instance = recorder.get_instance(hass)
+        await instance.async_block_till_done()
+        start = statistics.get_start_time() + StatisticsShortTerm.duration
+        end = start + StatisticsShortTerm.duration
+        measurement = {
+            "unit_of_measurement": "W",
+            "device_class": "power",
+            "state_class": "measurement",
+        }
+        total_increasing = {
+            "unit_of_measurement": "kWh",
+            "device_class": "energy",
+            "state_class": "total_increasing",
+        }
+        for change in range(changes_per_entity):
+            timestamp = start.timestamp() + change * 29
+            for idx in range(entity_count):
+                hass.states.async_set(
+                    f"sensor.sensor_{idx}",
+                    str(change + idx),
+                    measurement if idx % 2 else total_increasing,
+                    timestamp=timestamp,
+                )
+        await instance.async_block_till_done()
+
+        def _compile_statistics(
+            aggregate_in_database: bool,
+        ) -> tuple[float, list[Any]]:
+            with session_scope(session=instance.get_session()) as session:
+                start_time = timer()
+                compiled = sensor_recorder.compile_statistics(
+                    hass, session, start, end, aggregate_in_database
+                )
+                runtime = timer() - start_time
+            assert len(compiled.platform_stats) == entity_count
+            return runtime, compiled.platform_stats
+
+        python_runtime, in_python = await instance.async_add_executor_job(
+            _compile_statistics, False
+        )
+        runtime, in_database = await instance.async_add_executor_job(
+            _compile_statistics, True
+        )
+        assert in_database == in_python
+        print(
+            f"Compiled in {python_runtime:.3f}s in Python and in {runtime:.3f}s"
+            f" aggregating in the database using {instance.dialect_name}"
+        )
+        await hass.async_stop()
+        return runtime
@@ -72,6 +72,12 @@ DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# DATA_SETUP_TIMELINE is a list, indicating when each setup phase
+# started and how long it took during startup.
+DATA_SETUP_TIMELINE: HassKey[
+    list[tuple[str, str | None, SetupPhases, float, float]]
+] = HassKey("setup_timeline")
+
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -87,6 +93,16 @@ SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
 
+class SetupTimelineEntry(TypedDict):
+    """A setup phase on the startup timeline."""
+
+    domain: str
+    group: str | None
+    phase: SetupPhases
+    start: float
+    seconds: float
+
+
 class EventComponentLoaded(TypedDict):
     """EventComponentLoaded data."""
 
@@ -730,6 +746,14 @@ def _setup_times(
     return defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
 
 
+@singleton.singleton(DATA_SETUP_TIMELINE)
+def _setup_timeline(
+    hass: core.HomeAssistant,
+) -> list[tuple[str, str | None, SetupPhases, float, float]]:
+    """Return the setup timeline list."""
+    return []
+
+
 @contextlib.contextmanager
 def async_start_setup(
     hass: core.HomeAssistant,
@@ -772,6 +796,7 @@ def async_start_setup(
     finally:
         time_taken = time.monotonic() - started
         del setup_started[current]
+        _setup_timeline(hass).append((integration, group, phase, started, time_taken))
         group_setup_times = _setup_times(hass)[integration][group]
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
@@ -816,6 +841,27 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
     return domain_timings
 
 
+@callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> list[SetupTimelineEntry]:
+    """Return the setup phases of the startup in the order they finished.
+
+    The start of each phase is in seconds since the first phase started.
+    """
+    if not (timeline := _setup_timeline(hass)):
+        return []
+    first_start = min(started for _, _, _, started, _ in timeline)
+    return [
+        {
+            "domain": domain,
+            "group": group,
+            "phase": phase,
+            "start": started - first_start,
+            "seconds": time_taken,
+        }
+        for domain, group, phase, started, time_taken in timeline
+    ]
+
+
 @callback
 def async_get_domain_setup_times(
     hass: core.HomeAssistant, domain: str
@@ -11,15 +11,21 @@ from asyncio import (
     gather,
     get_running_loop,
 )
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
 import concurrent.futures
 import logging
+import math
 import threading
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
 _SHUTDOWN_RUN_CALLBACK_THREADSAFE = "_shutdown_run_callback_threadsafe"
+_TIMER_WHEEL = "_timer_wheel"
+
+# Timers on the timer wheel firing within the same slot of this many
+# seconds share a single event loop timer
+TIMER_WHEEL_RESOLUTION = 0.05
 
 
 def create_eager_task[_T](
@@ -135,6 +141,168 @@ def shutdown_run_callback_threadsafe(loop: AbstractEventLoop) -> None:
 
 
 def get_scheduled_timer_handles(loop: AbstractEventLoop) -> list[TimerHandle]:
-    """Return a list of scheduled TimerHandles."""
+    """Return a list of scheduled TimerHandles.
+
+    Timers scheduled on the timer wheel of the loop are returned instead
+    of the loop timers that run their slots.
+    """
     handles: list[TimerHandle] = loop._scheduled  # type: ignore[attr-defined] # noqa: SLF001
-    return handles
+    if (wheel := getattr(loop, _TIMER_WHEEL, None)) is None:
+        return handles
+    slot_handle_ids = {id(handle) for handle in wheel.slot_handles()}
+    return [
+        *(handle for handle in handles if id(handle) not in slot_handle_ids),
+        *wheel.handles(),
+    ]
+
+
+class TimerWheelHandle(TimerHandle):
+    """Handle of a callback scheduled on a timer wheel."""
+
+    __slots__ = ("_slot", "_wheel")
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        slot: int,
+        when: float,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        """Initialize the handle."""
+        super().__init__(when, callback, args, wheel.loop)
+        self._wheel = wheel
+        self._slot = slot
+
+    # Handles are tracked in dicts, so they must compare by identity
+    # instead of by when, callback and args like a TimerHandle
+    __hash__ = object.__hash__
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by identity."""
+        return self is other
+
+    def cancel(self) -> None:
+        """Cancel the callback and remove it from the timer wheel."""
+        if not self._cancelled:
+            self._wheel._async_remove(self)  # noqa: SLF001
+        super().cancel()
+
+
+class _TimerWheelSlot:
+    """Run the timers of a timer wheel slot from a single loop timer."""
+
+    __slots__ = ("_slot", "_wheel")
+
+    def __init__(self, wheel: TimerWheel, slot: int) -> None:
+        """Initialize the slot."""
+        self._wheel = wheel
+        self._slot = slot
+
+    def __call__(self) -> None:
+        """Run the timers of the slot."""
+        self._wheel._async_run_slot(self._slot)  # noqa: SLF001
+
+    def __repr__(self) -> str:
+        """Return the timers of the slot so they show up in the loop timer."""
+        timers = self._wheel._slots.get(self._slot, {})  # noqa: SLF001
+        return f"<TimerWheelSlot {', '.join(repr(handle) for handle in timers)}>"
+
+
+class TimerWheel:
+    """Coalesce timers firing in the same tick into a single loop timer.
+
+    Timers are hashed into slots of TIMER_WHEEL_RESOLUTION seconds. Each
+    slot with pending timers owns one loop timer at the end of the slot,
+    so timers never fire early and at most one resolution late. Scheduling
+    and cancelling are O(1) and the loop heap only holds one timer per
+    pending slot instead of one per timer.
+    """
+
+    __slots__ = ("loop", "_resolution", "_slot_handles", "_slots")
+
+    def __init__(
+        self, loop: AbstractEventLoop, resolution: float = TIMER_WHEEL_RESOLUTION
+    ) -> None:
+        """Initialize the timer wheel."""
+        self.loop = loop
+        self._resolution = resolution
+        self._slots: dict[int, dict[TimerWheelHandle, None]] = {}
+        self._slot_handles: dict[int, TimerHandle] = {}
+
+    def _async_get_slot(self, when: float) -> tuple[int, dict[TimerWheelHandle, None]]:
+        """Return the slot for a loop time and its timers."""
+        slot = math.ceil(when / self._resolution)
+        if (timers := self._slots.get(slot)) is None:
+            timers = self._slots[slot] = {}
+            self._slot_handles[slot] = self.loop.call_at(
+                slot * self._resolution, _TimerWheelSlot(self, slot)
+            )
+        return slot, timers
+
+    def call_at(
+        self, when: float, callback: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Schedule a callback to run at or shortly after a loop time."""
+        slot, timers = self._async_get_slot(when)
+        handle = TimerWheelHandle(self, slot, when, callback, args)
+        timers[handle] = None
+        return handle
+
+    def call_later(
+        self, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Schedule a callback to run at or shortly after a delay."""
+        return self.call_at(self.loop.time() + delay, callback, *args)
+
+    def call_at_many(
+        self,
+        when: float,
+        callbacks: Iterable[tuple[Callable[..., Any], tuple[Any, ...]]],
+    ) -> list[TimerWheelHandle]:
+        """Schedule callbacks with their arguments to run at the same loop time."""
+        slot, timers = self._async_get_slot(when)
+        handles = [
+            TimerWheelHandle(self, slot, when, callback, args)
+            for callback, args in callbacks
+        ]
+        timers.update(dict.fromkeys(handles))
+        if not timers:
+            del self._slots[slot]
+            self._slot_handles.pop(slot).cancel()
+        return handles
+
+    def handles(self) -> list[TimerWheelHandle]:
+        """Return the pending timers."""
+        return [handle for timers in self._slots.values() for handle in timers]
+
+    def slot_handles(self) -> Iterable[TimerHandle]:
+        """Return the loop timers running the slots."""
+        return self._slot_handles.values()
+
+    def _async_remove(self, handle: TimerWheelHandle) -> None:
+        """Remove a cancelled timer from its slot."""
+        slot = handle._slot  # noqa: SLF001
+        if (timers := self._slots.get(slot)) is None or handle not in timers:
+            # The slot already ran
+            return
+        del timers[handle]
+        if not timers:
+            del self._slots[slot]
+            self._slot_handles.pop(slot).cancel()
+
+    def _async_run_slot(self, slot: int) -> None:
+        """Run the timers of a slot."""
+        del self._slot_handles[slot]
+        for handle in list(self._slots.pop(slot)):
+            # A timer may cancel another timer in the same slot
+            if not handle.cancelled():
+                handle._run()  # noqa: SLF001
+
+
+def get_timer_wheel(loop: AbstractEventLoop) -> TimerWheel:
+    """Return the timer wheel of an event loop."""
+    if (wheel := getattr(loop, _TIMER_WHEEL, None)) is None:
+        wheel = TimerWheel(loop)
+        setattr(loop, _TIMER_WHEEL, wheel)
+    return wheel
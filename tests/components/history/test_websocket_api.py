@@ -2,14 +2,18 @@
 
 import asyncio
 from datetime import timedelta
+import threading
+from typing import Any
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder.tasks import DownsampleStatesTask
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -232,6 +236,301 @@ async def test_history_during_period_impossible_conditions(
     assert response["result"] == {}
 
 
+async def test_history_during_period_columnar_chunks(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period streams columnar chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "2", "3", "4", "5"):
+        hass.states.async_set("sensor.one", state, attributes={"any": state})
+        await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.two", "on")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "chunk_size": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["result"] is None
+
+    chunks = []
+    while True:
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        if response["event"].get("complete"):
+            break
+        chunks.append(response["event"])
+
+    assert [(chunk["entity_id"], chunk["s"]) for chunk in chunks] == [
+        ("sensor.one", ["1", "2"]),
+        ("sensor.one", ["3", "4"]),
+        ("sensor.one", ["5"]),
+        ("sensor.two", ["on"]),
+    ]
+    timestamps = [ts for chunk in chunks[:3] for ts in chunk["lu"]]
+    assert all(isinstance(ts, float) for ts in timestamps)
+    assert timestamps == sorted(timestamps)
+
+    future = dt_util.utcnow() + timedelta(hours=10)
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": future.isoformat(),
+            "entity_ids": ["sensor.one"],
+            "chunk_size": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 2
+    assert response["result"] is None
+    response = await client.receive_json()
+    assert response["id"] == 2
+    assert response["event"] == {"complete": True}
+
+
+async def test_history_during_period_columnar_chunks_backpressure(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test columnar chunks are not read while the client is behind."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3", "4", "5"):
+        hass.states.async_set("sensor.one", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    stream_columnar = websocket_api._ws_stream_significant_states_columnar
+    finished = threading.Event()
+
+    def _stream_columnar(*args: Any) -> None:
+        try:
+            stream_columnar(*args)
+        finally:
+            finished.set()
+
+    client = await hass_ws_client()
+    with (
+        patch.object(
+            websocket_api,
+            "_ws_stream_significant_states_columnar",
+            _stream_columnar,
+        ),
+        # Every chunk leaves the client behind
+        patch.object(websocket_api, "MAX_PENDING_COLUMNAR_CHUNKS", 0),
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "significant_changes_only": False,
+                "chunk_size": 1,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["s"] == ["1"]
+        with pytest.raises(TimeoutError):
+            await client.receive_json(timeout=0.2)
+        assert not finished.is_set()
+
+        # Closing the connection stops the stream
+        await client.close()
+        assert await hass.async_add_executor_job(finished.wait, 5)
+
+
+async def test_history_during_period_columnar_chunks_unsubscribe(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test an unsubscribed columnar stream is not marked complete."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.one", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    stream_columnar = websocket_api._ws_stream_significant_states_columnar
+    finished = threading.Event()
+
+    def _stream_columnar(*args: Any) -> bool:
+        try:
+            return stream_columnar(*args)
+        finally:
+            finished.set()
+
+    client = await hass_ws_client()
+    with (
+        patch.object(
+            websocket_api,
+            "_ws_stream_significant_states_columnar",
+            _stream_columnar,
+        ),
+        patch.object(websocket_api, "MAX_PENDING_COLUMNAR_CHUNKS", 0),
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "significant_changes_only": False,
+                "chunk_size": 1,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["s"] == ["1"]
+
+        await client.send_json(
+            {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+        )
+        response = await client.receive_json()
+        assert response["id"] == 2
+        assert response["success"]
+        assert await hass.async_add_executor_job(finished.wait, 5)
+        await hass.async_block_till_done()
+
+        with pytest.raises(TimeoutError):
+            await client.receive_json(timeout=0.2)
+
+
+async def test_history_during_period_columnar_chunks_timeout(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a columnar stream ends with an error when the client stays behind."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.one", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with (
+        patch.object(websocket_api, "MAX_PENDING_COLUMNAR_CHUNKS", 0),
+        patch.object(websocket_api, "MAX_COLUMNAR_CHUNK_PAUSE", 0),
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "significant_changes_only": False,
+                "chunk_size": 1,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["s"] == ["1"]
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert not response["success"]
+        assert response["error"]["code"] == "timeout"
+
+        with pytest.raises(TimeoutError):
+            await client.receive_json(timeout=0.2)
+
+
+async def test_history_during_period_max_points(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test history_during_period serves numeric entities from downsampled states."""
+    now = dt_util.utcnow()
+    start = now.replace(minute=now.minute - now.minute % 5, second=0, microsecond=0)
+    start += timedelta(minutes=5)
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    freezer.move_to(start + timedelta(seconds=1))
+    hass.states.async_set("binary_sensor.door", "on")
+    for minute in range(0, 15, 5):
+        freezer.move_to(start + timedelta(minutes=minute, seconds=1))
+        hass.states.async_set("sensor.power", str(minute + 1))
+        freezer.move_to(start + timedelta(minutes=minute, seconds=2))
+        hass.states.async_set("sensor.power", str(-(minute + 1)))
+    await async_wait_recording_done(hass)
+    for minute in range(0, 15, 5):
+        get_instance(hass).queue_task(
+            DownsampleStatesTask(start + timedelta(minutes=minute))
+        )
+    await async_recorder_block_till_done(hass)
+    freezer.move_to(start + timedelta(minutes=15))
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power", "binary_sensor.door"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 3,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    start_ts = start.timestamp()
+    assert response["result"] == {
+        "sensor.power": [
+            {"s": "-1", "lu": start_ts, "min": -1.0, "max": 1.0},
+            {"s": "-6", "lu": start_ts + 300, "min": -6.0, "max": 6.0},
+            {"s": "-11", "lu": start_ts + 600, "min": -11.0, "max": 11.0},
+        ],
+        "binary_sensor.door": [{"s": "on", "lu": start_ts + 1}],
+    }
+
+    # Finer resolutions than the downsampled states are served from the states
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 1000,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]["sensor.power"]) == 6
+
+
 @pytest.mark.parametrize(
     "time_zone", ["UTC", "Europe/Berlin", "America/Chicago", "US/Hawaii"]
 )
@@ -22,11 +22,13 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NAME,
+    ATTR_SERVICE,
     ATTR_UNIT_OF_MEASUREMENT,
     CONF_DOMAINS,
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
     STATE_OFF,
@@ -292,6 +294,182 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_paginated(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events returns the same events in pages."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("light.kitchen", state)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.kitchen"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected) == 5
+
+    events: list[dict[str, Any]] = []
+    cursor: float | None = None
+    for _ in range(len(expected) * 2):
+        page_request = {
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.kitchen"],
+            "limit": 2,
+        }
+        if cursor is not None:
+            page_request["cursor"] = cursor
+        await client.send_json_auto_id(page_request)
+        response = await client.receive_json()
+        assert response["success"]
+        events.extend(response["result"]["events"])
+        if (cursor := response["result"]["next_cursor"]) is None:
+            break
+
+    assert events == expected
+
+    await client.send_json_auto_id(
+        {
+            "type": "logbook/get_events",
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "limit": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"events": [], "next_cursor": None}
+
+
+async def test_get_events_paginated_shared_timestamp(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test pages split rows of events and states that share one timestamp."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+
+    with freeze_time(now):
+        for state in (STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF):
+            hass.states.async_set("light.kitchen", state)
+            hass.bus.async_fire(
+                logbook.EVENT_LOGBOOK_ENTRY,
+                {logbook.ATTR_NAME: "Alarm", logbook.ATTR_MESSAGE: state},
+            )
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "logbook/get_events",
+            "start_time": (now - timedelta(seconds=1)).isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected) == 12
+    assert len({event["when"] for event in expected}) == 1
+
+    for limit in (1, 2, 5):
+        events: list[dict[str, Any]] = []
+        cursor: list[Any] | None = None
+        for _ in range(len(expected) + 1):
+            page_request = {
+                "type": "logbook/get_events",
+                "start_time": (now - timedelta(seconds=1)).isoformat(),
+                "limit": limit,
+            }
+            if cursor is not None:
+                page_request["cursor"] = cursor
+            await client.send_json_auto_id(page_request)
+            response = await client.receive_json()
+            assert response["success"]
+            assert len(response["result"]["events"]) <= limit
+            events.extend(response["result"]["events"])
+            if (cursor := response["result"]["next_cursor"]) is None:
+                break
+
+        assert sorted(events, key=repr) == sorted(expected, key=repr)
+        assert len(events) == len(expected)
+
+
+async def test_get_events_paginated_context_from_previous_page(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a page is augmented with a context that started on a previous page."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    await async_wait_recording_done(hass)
+
+    start = dt_util.utcnow()
+    context = core.Context(id="01GTDGKBCH00GW0X276W5TEDDD")
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_on"},
+        context=context,
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {"type": "logbook/get_events", "start_time": start.isoformat(), "limit": 1}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    # The service call only links the context
+    assert response["result"]["events"] == []
+    cursor = response["result"]["next_cursor"]
+    assert cursor is not None
+
+    await client.send_json_auto_id(
+        {
+            "type": "logbook/get_events",
+            "start_time": start.isoformat(),
+            "limit": 1,
+            "cursor": cursor,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    (event,) = response["result"]["events"]
+    assert event["entity_id"] == "light.kitchen"
+    assert event["state"] == STATE_ON
+    assert event["context_domain"] == "light"
+    assert event["context_service"] == "turn_on"
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -15,6 +15,7 @@ import pytest
 from homeassistant.components.profiler import (
     _LRU_CACHE_WRAPPER_OBJECT,
     _SQLALCHEMY_LRU_OBJECT,
+    CONF_COUNT,
     CONF_ENABLED,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
@@ -24,19 +25,22 @@ from homeassistant.components.profiler import (
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
     SERVICE_SET_ASYNCIO_DEBUG,
+    SERVICE_SET_SLOW_CALLBACK_THRESHOLD,
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_TOP_JOBS,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, async_get_job_profiler, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -446,3 +450,61 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_top_jobs(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test we can log and fetch the jobs that spent the most time in the loop."""
+    client = await hass_ws_client(hass)
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_TOP_JOBS)
+    assert hass.services.has_service(DOMAIN, SERVICE_SET_SLOW_CALLBACK_THRESHOLD)
+    assert async_get_job_profiler() is not None
+
+    @callback
+    def _busy_listener(event):
+        """Show up in the top jobs."""
+
+    hass.bus.async_listen("profiler_test_event", _busy_listener)
+    for _ in range(3):
+        hass.bus.async_fire("profiler_test_event")
+
+    await client.send_json_auto_id({"type": "profiler/top_jobs", CONF_COUNT: 1000})
+    response = await client.receive_json()
+    assert response["success"]
+    (busy_job,) = (
+        job for job in response["result"] if "_busy_listener" in job["origin"]
+    )
+    assert busy_job["count"] == 3
+    assert busy_job["max_time"] <= busy_job["total_time"]
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_TOP_JOBS, {CONF_COUNT: 1000}, blocking=True
+    )
+    assert "_busy_listener" in caplog.text
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SET_SLOW_CALLBACK_THRESHOLD, {CONF_SECONDS: 0}, blocking=True
+    )
+    assert async_get_job_profiler().slow_threshold == 0
+    caplog.clear()
+    hass.bus.async_fire("profiler_test_event")
+    assert f"({busy_job['origin']}) took" in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert async_get_job_profiler() is None
+
+    await client.send_json_auto_id({"type": "profiler/top_jobs"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_loaded"
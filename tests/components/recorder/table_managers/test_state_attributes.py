@@ -0,0 +1,75 @@
+"""The tests for the Recorder state attributes manager."""
+
+from __future__ import annotations
+
+from lru import LRU
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.table_managers import state_attributes
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+async def test_load_recent_primes_cache(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the cache is primed with the attributes of the latest states."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "kWh"})
+    await async_wait_recording_done(hass)
+
+    manager = instance.state_attributes_manager
+    manager._id_map.clear()
+    hits, misses = manager.hits, manager.misses
+    assert manager.get_from_cache('{"unit_of_measurement":"W"}') is None
+
+    def _load_recent() -> None:
+        with session_scope(session=instance.get_session()) as session:
+            manager.load_recent(session)
+
+    await instance.async_add_executor_job(_load_recent)
+    assert manager.get_from_cache('{"unit_of_measurement":"W"}') is not None
+    assert manager.get_from_cache('{"unit_of_measurement":"kWh"}') is not None
+    cache_info = manager.cache_info
+    assert cache_info["hits"] == hits + 2
+    assert cache_info["misses"] == misses + 1
+    assert cache_info["size"] >= 2
+
+
+async def test_adapt_lru_size(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the cache grows when it is full and too many lookups miss."""
+    instance = await async_setup_recorder_instance(hass)
+    manager = instance.state_attributes_manager
+    manager._id_map = LRU(2)
+    manager._id_map["a"] = 1
+    manager._id_map["b"] = 2
+
+    # Not enough lookups to judge the hit rate
+    manager.misses += state_attributes.GROW_MIN_LOOKUPS - 1
+    manager.adapt_lru_size()
+    assert manager._id_map.get_size() == 2
+
+    manager.misses += 1
+    manager.adapt_lru_size()
+    assert manager._id_map.get_size() == 4
+
+    # The cache is not full
+    manager.misses += state_attributes.GROW_MIN_LOOKUPS
+    manager.adapt_lru_size()
+    assert manager._id_map.get_size() == 4
+
+    # Most lookups hit
+    manager._id_map["c"] = 3
+    manager._id_map["d"] = 4
+    manager.hits += state_attributes.GROW_MIN_LOOKUPS
+    manager.adapt_lru_size()
+    assert manager._id_map.get_size() == 4
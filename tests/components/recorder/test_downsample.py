@@ -0,0 +1,179 @@
+"""The tests for the recorder downsampled states tier."""
+
+from datetime import datetime, timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from sqlalchemy import select
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import (
+    StatesDownsampled,
+    StatesDownsampledShortTerm,
+    StatesMeta,
+)
+from homeassistant.components.recorder.downsample import get_downsampled_states
+from homeassistant.components.recorder.tasks import DownsampleStatesTask
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.recorder import get_instance
+import homeassistant.util.dt as dt_util
+
+from .common import async_recorder_block_till_done, async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+HOUR_START = datetime(2024, 1, 1, 10, tzinfo=dt_util.UTC)
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+async def _async_record_states(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    states: list[tuple[timedelta, str, str]],
+) -> None:
+    """Record states at offsets from HOUR_START."""
+    for offset, entity_id, state in states:
+        freezer.move_to(HOUR_START + offset)
+        hass.states.async_set(entity_id, state)
+    await async_wait_recording_done(hass)
+
+
+async def _async_downsample(hass: HomeAssistant, *starts: datetime) -> None:
+    """Compile the downsampled states for five minute periods."""
+    instance = get_instance(hass)
+    for start in starts:
+        instance.queue_task(DownsampleStatesTask(start))
+    await async_recorder_block_till_done(hass)
+
+
+def _downsampled_rows(
+    hass: HomeAssistant, table: type[StatesDownsampled | StatesDownsampledShortTerm]
+) -> list[tuple[str, float, float, float, str]]:
+    """Return all downsampled rows of a table."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return [
+            tuple(row)
+            for row in session.execute(
+                select(
+                    StatesMeta.entity_id,
+                    table.start_ts,
+                    table.min,
+                    table.max,
+                    table.last,
+                )
+                .join(StatesMeta, StatesMeta.metadata_id == table.metadata_id)
+                .order_by(StatesMeta.entity_id, table.start_ts)
+            )
+        ]
+
+
+async def test_compile_downsampled_states(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test compiling the five minute and hourly downsampled states."""
+    await _async_record_states(
+        hass,
+        freezer,
+        [
+            (timedelta(minutes=50, seconds=10), "sensor.temperature", "1"),
+            (timedelta(minutes=50, seconds=10), "binary_sensor.door", "on"),
+            (timedelta(minutes=51), "sensor.temperature", "5"),
+            (timedelta(minutes=52), "sensor.temperature", "unavailable"),
+            (timedelta(minutes=53), "sensor.temperature", "3"),
+            (timedelta(minutes=55, seconds=30), "sensor.temperature", "7"),
+            (timedelta(minutes=56), "binary_sensor.door", "off"),
+            (timedelta(minutes=57), "sensor.temperature", "2.00"),
+        ],
+    )
+    period_1 = HOUR_START + timedelta(minutes=50)
+    period_2 = HOUR_START + timedelta(minutes=55)
+
+    await _async_downsample(hass, period_1)
+    assert _downsampled_rows(hass, StatesDownsampledShortTerm) == [
+        ("sensor.temperature", period_1.timestamp(), 1.0, 5.0, "3"),
+    ]
+    assert _downsampled_rows(hass, StatesDownsampled) == []
+
+    # The last period of the hour also rolls up the hour
+    await _async_downsample(hass, period_2)
+    assert _downsampled_rows(hass, StatesDownsampledShortTerm) == [
+        ("sensor.temperature", period_1.timestamp(), 1.0, 5.0, "3"),
+        ("sensor.temperature", period_2.timestamp(), 2.0, 7.0, "2.00"),
+    ]
+    assert _downsampled_rows(hass, StatesDownsampled) == [
+        ("sensor.temperature", HOUR_START.timestamp(), 1.0, 7.0, "2.00"),
+    ]
+
+    # Compiling the same periods again does not add rows
+    await _async_downsample(hass, period_1, period_2)
+    assert len(_downsampled_rows(hass, StatesDownsampledShortTerm)) == 2
+    assert len(_downsampled_rows(hass, StatesDownsampled)) == 1
+
+
+async def test_get_downsampled_states(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test fetching downsampled states with a limited number of points."""
+    states: list[tuple[timedelta, str, str]] = []
+    for minute in range(0, 120, 5):
+        states.append(
+            (timedelta(minutes=minute, seconds=1), "sensor.power", str(minute))
+        )
+        states.append(
+            (timedelta(minutes=minute, seconds=2), "sensor.power", str(-minute))
+        )
+    states.append((timedelta(minutes=1), "binary_sensor.door", "on"))
+    await _async_record_states(hass, freezer, states)
+    await _async_downsample(
+        hass, *(HOUR_START + timedelta(minutes=minute) for minute in range(0, 90, 5))
+    )
+    start_ts = HOUR_START.timestamp()
+
+    # Finer than the five minute tier
+    assert (
+        get_downsampled_states(
+            hass,
+            HOUR_START,
+            HOUR_START + timedelta(hours=2),
+            ["sensor.power"],
+            1000,
+        )
+        is None
+    )
+
+    # 30 minute buckets are served from the five minute tier
+    assert get_downsampled_states(
+        hass,
+        HOUR_START,
+        HOUR_START + timedelta(hours=2),
+        ["sensor.power", "binary_sensor.door", "sensor.unknown"],
+        4,
+    ) == {
+        "sensor.power": [
+            {"s": "-25", "lu": start_ts, "min": -25.0, "max": 25.0},
+            {"s": "-55", "lu": start_ts + 1800, "min": -55.0, "max": 55.0},
+            {"s": "-85", "lu": start_ts + 3600, "min": -85.0, "max": 85.0},
+        ]
+    }
+
+    # 1 hour buckets are served from the hourly tier, the hour which
+    # has not been rolled up yet is served from the five minute tier
+    assert get_downsampled_states(
+        hass,
+        HOUR_START,
+        HOUR_START + timedelta(hours=2),
+        ["sensor.power"],
+        2,
+    ) == {
+        "sensor.power": [
+            {"s": "-55", "lu": start_ts, "min": -55.0, "max": 55.0},
+            {"s": "-85", "lu": start_ts + 3600, "min": -85.0, "max": 85.0},
+        ]
+    }
@@ -512,6 +512,45 @@ async def test_get_significant_states_minimal_response(
     )
 
 
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+async def test_get_significant_states_columnar_chunks(
+    hass: HomeAssistant, chunk_size: int
+) -> None:
+    """Test columnar chunks match the compressed significant states."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids=list(states),
+        no_attributes=True,
+        compressed_state_format=True,
+    )
+    expected: dict[str, list[tuple[float, str]]] = {}
+    for entity_id, entity_states in hist.items():
+        expected[entity_id] = []
+        for state in entity_states:
+            if not expected[entity_id] or expected[entity_id][-1][1] != state["s"]:
+                expected[entity_id].append((state["lu"], state["s"]))
+
+    columns: dict[str, list[tuple[float, str]]] = {}
+    for (
+        entity_id,
+        timestamps,
+        chunk_states,
+    ) in history.get_significant_states_columnar_chunks(
+        hass, zero, four, list(states), True, True, chunk_size
+    ):
+        assert len(timestamps) == len(chunk_states) <= chunk_size
+        columns.setdefault(entity_id, []).extend(
+            zip(timestamps, chunk_states, strict=True)
+        )
+
+    assert columns == expected
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 async def test_get_significant_states_with_initial(
     time_zone, hass: HomeAssistant
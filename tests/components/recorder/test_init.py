@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Generator
 from datetime import datetime, timedelta
+import queue
 import sqlite3
 import sys
 import threading
@@ -23,8 +24,10 @@ from homeassistant.components.recorder import (
     CONF_AUTO_REPACK,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
+    CONF_DB_READ_POOL,
     CONF_DB_RETRY_WAIT,
     CONF_DB_URL,
+    CONF_PARTITION_INTERVAL,
     CONFIG_SCHEMA,
     DOMAIN,
     Recorder,
@@ -34,9 +37,12 @@ from homeassistant.components.recorder import (
     statistics,
 )
 from homeassistant.components.recorder.const import (
+    DB_READ_WORKER_PREFIX,
+    DB_WORKER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
+    QueryClass,
     SupportedDialect,
 )
 from homeassistant.components.recorder.db_schema import (
@@ -50,6 +56,7 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
     StatisticsRuns,
 )
+from homeassistant.components.recorder.executor import QueryClassQueue
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
@@ -136,6 +143,11 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        bulk_insert_states=False,
+        downsample_states=False,
+        db_read_pool=False,
+        partition_interval=None,
+        spill_path=None,
     )
 
 
@@ -231,6 +243,89 @@ async def test_shutdown_closes_connections(
         assert instance.get_session()
 
 
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.parametrize("recorder_config", [{CONF_DB_READ_POOL: True}])
+async def test_read_pool(
+    hass: HomeAssistant, setup_recorder: None, recorder_db_url: str
+) -> None:
+    """Test read only queries run on the read only pool."""
+    if not recorder_db_url.startswith("sqlite://"):
+        pytest.skip("Read only connections are only checked with SQLite")
+    instance = recorder.get_instance(hass)
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+
+    def _read_states() -> tuple[str, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return threading.current_thread().name, session.query(States).count()
+
+    def _write_event() -> None:
+        with session_scope(hass=hass) as session:
+            session.add(EventTypes(event_type="read_only"))
+
+    thread_name, count = await instance.async_add_read_executor_job(
+        QueryClass.HISTORY, _read_states
+    )
+    assert thread_name.startswith(DB_READ_WORKER_PREFIX)
+    assert count == 1
+
+    with pytest.raises(OperationalError, match="readonly"):
+        await instance.async_add_read_executor_job(QueryClass.LOGBOOK, _write_event)
+
+    read_pool = instance.read_pool_info
+    assert read_pool is not None
+    assert read_pool["active"] is True
+    assert read_pool["workers"] >= 2
+    assert read_pool["queues"][QueryClass.HISTORY]["served"] == 1
+    assert read_pool["queues"][QueryClass.LOGBOOK]["served"] == 1
+    assert read_pool["queues"][QueryClass.STATISTICS]["served"] == 0
+    assert read_pool["queues"][QueryClass.HISTORY]["pending"] == 0
+
+
+async def test_read_pool_disabled(hass: HomeAssistant, setup_recorder: None) -> None:
+    """Test read only queries run on the database executor without a read pool."""
+    instance = recorder.get_instance(hass)
+    assert instance.read_pool_info is None
+
+    thread_name = await instance.async_add_read_executor_job(
+        QueryClass.HISTORY, lambda: threading.current_thread().name
+    )
+    assert thread_name.startswith(DB_WORKER_PREFIX)
+
+
+def test_query_class_queue_round_robin() -> None:
+    """Test the read only pool serves the query classes in turn."""
+    work_queue = QueryClassQueue()
+    for query_class in (
+        QueryClass.LOGBOOK,
+        QueryClass.LOGBOOK,
+        QueryClass.LOGBOOK,
+        QueryClass.HISTORY,
+        QueryClass.STATISTICS,
+    ):
+        work_queue.put(Mock(fn=Mock(query_class=query_class)))
+
+    served = [work_queue.get_nowait().fn.query_class for _ in range(5)]
+    assert served == [
+        QueryClass.HISTORY,
+        QueryClass.LOGBOOK,
+        QueryClass.STATISTICS,
+        QueryClass.LOGBOOK,
+        QueryClass.LOGBOOK,
+    ]
+    with pytest.raises(queue.Empty):
+        work_queue.get_nowait()
+
+    work_queue.put(Mock(fn=Mock(query_class=QueryClass.ENERGY)))
+    work_queue.put(None)
+    assert work_queue.get_nowait() is None
+    assert work_queue.get_nowait().fn.query_class is QueryClass.ENERGY
+
+    stats = work_queue.stats_as_dict()
+    assert stats[QueryClass.LOGBOOK]["served"] == 3
+    assert stats[QueryClass.LOGBOOK]["pending"] == 0
+
+
 async def test_state_gets_saved_when_set_before_start_event(
     hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
 ) -> None:
@@ -1016,6 +1111,11 @@ async def test_defaults_set(hass: HomeAssistant) -> None:
     assert recorder_config["auto_purge"]
     assert recorder_config["auto_repack"]
     assert recorder_config["purge_keep_days"] == 10
+    assert not recorder_config["bulk_insert_states"]
+    assert not recorder_config["downsample_states"]
+    assert not recorder_config["db_read_pool"]
+    assert CONF_PARTITION_INTERVAL not in recorder_config
+    assert not recorder_config["spill_to_disk"]
 
 
 async def run_tasks_at_time(hass: HomeAssistant, test_time: datetime) -> None:
@@ -1468,6 +1568,70 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("executemany_returning", [True, False])
+async def test_saving_states_bulk_insert(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    executemany_returning: bool,
+) -> None:
+    """Test saving states with bulk insert links old states and attributes."""
+    instance = await async_setup_recorder_instance(hass, {"bulk_insert_states": True})
+    assert instance.bulk_insert_states is True
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    with patch.object(
+        instance.engine.dialect,
+        "insert_executemany_returning_sort_by_parameter_order",
+        executemany_returning,
+    ):
+        hass.states.async_set("test.one", "s1", attributes)
+        hass.states.async_set("test.two", "s2", attributes)
+        hass.states.async_set("test.one", "s3", attributes)
+        hass.states.async_set("test.one", "s4", {"other": 1})
+        await async_wait_recording_done(hass)
+        hass.states.async_set("test.one", "s5", attributes)
+        hass.states.async_set("test.two", "s6", attributes)
+        hass.states.async_remove("test.two")
+        hass.states.async_set("test.two", "s7", attributes)
+        hass.states.async_remove("test.never_existed")
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .order_by(States.state_id)
+        )
+        assert len(states) == 8
+        assert len(list(session.query(StateAttributes))) == 3
+        states_meta = list(session.query(StatesMeta.entity_id))
+        assert {meta.entity_id for meta in states_meta} == {"test.one", "test.two"}
+
+    states_by_state = {state.state: state for state in states}
+    assert states_by_state["s1"].entity_id == "test.one"
+    assert states_by_state["s2"].entity_id == "test.two"
+    assert states_by_state["s1"].old_state_id is None
+    assert states_by_state["s2"].old_state_id is None
+    assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+    assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+    assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+    assert states_by_state["s6"].old_state_id == states_by_state["s2"].state_id
+    assert states_by_state[None].old_state_id == states_by_state["s6"].state_id
+    assert states_by_state["s7"].old_state_id is None
+    assert json_loads(states_by_state["s1"].shared_attrs) == attributes
+    assert json_loads(states_by_state["s4"].shared_attrs) == {"other": 1}
+    assert states_by_state["s1"].shared_attrs == states_by_state["s5"].shared_attrs
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
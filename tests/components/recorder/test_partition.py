@@ -0,0 +1,188 @@
+"""The tests for partitioning the recorder states and events tables."""
+
+from datetime import timedelta
+import logging
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from sqlalchemy import inspect
+
+from homeassistant.components.recorder import (
+    CONF_PARTITION_INTERVAL,
+    Recorder,
+    migration,
+)
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    RecorderPartitions,
+    StateAttributes,
+    States,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.tasks import ClosePartitionsTask
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_recorder_block_till_done, async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+async def _async_close_partitions(hass: HomeAssistant, recorder: Recorder) -> None:
+    """Run the partition task."""
+    recorder.queue_task(ClosePartitionsTask())
+    await async_recorder_block_till_done(hass)
+
+
+async def _async_record(hass: HomeAssistant, value: str) -> None:
+    """Record a state change and an event."""
+    hass.states.async_set("sensor.test", value, {"value": value})
+    hass.bus.async_fire("test_event", {"value": value})
+    await async_wait_recording_done(hass)
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_PARTITION_INTERVAL: "daily"}])
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_partitioning_not_supported(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the tables are not partitioned and purged by rows with SQLite."""
+    await _async_record(hass, "1")
+    await _async_close_partitions(hass, recorder_mock)
+
+    assert "only supported with MySQL, MariaDB and PostgreSQL" in caplog.text
+    with session_scope(hass=hass) as session:
+        assert session.query(RecorderPartitions).count() == 0
+
+    # The warning is only logged once
+    caplog.clear()
+    caplog.set_level(logging.WARNING)
+    await _async_close_partitions(hass, recorder_mock)
+    assert "only supported with MySQL, MariaDB and PostgreSQL" not in caplog.text
+
+    purge_before = dt_util.utcnow() + timedelta(seconds=1)
+    assert purge_old_data(recorder_mock, purge_before, repack=False) is True
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 0
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_PARTITION_INTERVAL: "daily"}])
+@pytest.mark.skip_on_db_engine(["sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_purge_drops_partitions(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test purging drops the expired partitions."""
+    start = dt_util.utcnow()
+    # The schema migration partitioned the tables
+    with session_scope(hass=hass) as session:
+        assert session.query(RecorderPartitions).count() == 2
+    await _async_record(hass, "1")
+
+    # The partitions are not closed again before the interval has passed
+    freezer.move_to(start + timedelta(hours=12))
+    await _async_record(hass, "2")
+    await _async_close_partitions(hass, recorder_mock)
+    with session_scope(hass=hass) as session:
+        assert session.query(RecorderPartitions).count() == 2
+
+    freezer.move_to(start + timedelta(days=1))
+    await _async_close_partitions(hass, recorder_mock)
+    await _async_record(hass, "3")
+    freezer.move_to(start + timedelta(days=2))
+    await _async_close_partitions(hass, recorder_mock)
+    await _async_record(hass, "4")
+    with session_scope(hass=hass) as session:
+        assert session.query(RecorderPartitions).count() == 6
+
+    # The partitions closed at the start and after a day have expired, rows
+    # of the third partitions older than purge_before are kept until they expire
+    purge_before = start + timedelta(days=1, hours=12)
+    assert purge_old_data(recorder_mock, purge_before, repack=False) is True
+
+    with session_scope(hass=hass) as session:
+        assert session.query(RecorderPartitions).count() == 2
+        assert sorted(state.state for state in session.query(States)) == ["3", "4"]
+        assert session.query(States).filter(States.old_state_id.is_not(None)).count()
+        assert (
+            session.query(States)
+            .filter(States.old_state_id.is_not(None))
+            .filter(~States.old_state_id.in_(session.query(States.state_id)))
+            .count()
+            == 0
+        )
+        assert session.query(StateAttributes).count() == 2
+        assert session.query(Events).count() == 2
+        assert session.query(EventData).count() == 2
+
+    # New rows are still written after dropping partitions
+    await _async_record(hass, "5")
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 3
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_PARTITION_INTERVAL: "daily"}])
+@pytest.mark.skip_on_db_engine(["sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_unpartition_tables(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the tables can be converted back to unpartitioned tables."""
+    await _async_record(hass, "1")
+    freezer.tick(timedelta(days=1))
+    await _async_close_partitions(hass, recorder_mock)
+    await _async_record(hass, "2")
+    assert (
+        await recorder_mock.async_add_executor_job(
+            migration._find_partitioning_errors,
+            recorder_mock,
+            recorder_mock.get_session,
+        )
+        == set()
+    )
+
+    await recorder_mock.async_add_executor_job(
+        migration._unpartition_tables,
+        recorder_mock.engine,
+        recorder_mock.get_session,
+    )
+
+    # The tables are no longer partitioned as configured
+    assert await recorder_mock.async_add_executor_job(
+        migration._find_partitioning_errors,
+        recorder_mock,
+        recorder_mock.get_session,
+    ) == {"states.partitioning", "events.partitioning"}
+    with session_scope(hass=hass) as session:
+        assert session.query(RecorderPartitions).count() == 0
+        assert sorted(state.state for state in session.query(States)) == ["1", "2"]
+        assert session.query(Events).count() == 2
+
+    def _foreign_key_columns() -> set[str]:
+        inspector = inspect(recorder_mock.engine)
+        return {
+            column
+            for foreign_key in inspector.get_foreign_keys("states")
+            for column in foreign_key["constrained_columns"]
+        }
+
+    assert {"old_state_id", "attributes_id", "metadata_id"} <= (
+        await recorder_mock.async_add_executor_job(_foreign_key_columns)
+    )
+
+    # New rows are still written to the unpartitioned tables
+    await _async_record(hass, "3")
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 3
@@ -20,12 +20,14 @@ from homeassistant.components.recorder.db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    StatesDownsampled,
+    StatesDownsampledShortTerm,
     StatesMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import purge_entity_data, purge_old_data
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -1570,6 +1572,102 @@ async def _add_test_statistics(hass: HomeAssistant):
             )
 
 
+async def test_purge_short_term_downsampled_states(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test only the five minute downsampled states are purged."""
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    with session_scope(hass=hass) as session:
+        for timestamp in (eleven_days_ago, utcnow):
+            session.add(
+                StatesDownsampledShortTerm(
+                    start_ts=timestamp.timestamp(), min=1.0, max=2.0, last=1.5
+                )
+            )
+            session.add(
+                StatesDownsampled(
+                    start_ts=timestamp.timestamp(), min=1.0, max=2.0, last=1.5
+                )
+            )
+
+    purge_before = utcnow - timedelta(days=10)
+    finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert not finished
+    finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert finished
+
+    with session_scope(hass=hass) as session:
+        short_term = session.query(StatesDownsampledShortTerm)
+        assert short_term.count() == 1
+        assert short_term.one().start_ts == utcnow.timestamp()
+        assert session.query(StatesDownsampled).count() == 2
+
+
+async def test_purge_keeps_hourly_downsampled_states(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test purging states keeps the hourly downsampled states of an entity."""
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    def _insert_states() -> int:
+        with session_scope(hass=hass) as session:
+            states_meta = StatesMeta(entity_id="sensor.downsampled")
+            session.add(states_meta)
+            session.flush()
+            session.add(
+                States(
+                    metadata_id=states_meta.metadata_id,
+                    state="1.5",
+                    last_updated_ts=eleven_days_ago.timestamp(),
+                )
+            )
+            session.add(
+                StatesDownsampled(
+                    metadata_id=states_meta.metadata_id,
+                    start_ts=eleven_days_ago.timestamp(),
+                    min=1.0,
+                    max=2.0,
+                    last="1.5",
+                )
+            )
+            return states_meta.metadata_id
+
+    metadata_id = await recorder_mock.async_add_executor_job(_insert_states)
+
+    finished = purge_old_data(
+        recorder_mock, utcnow - timedelta(days=10), repack=False
+    )
+    assert finished
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 0
+        assert (
+            session.query(StatesMeta)
+            .filter(StatesMeta.metadata_id == metadata_id)
+            .count()
+            == 1
+        )
+        assert session.query(StatesDownsampled).count() == 1
+
+    # Purging the entity removes its downsampled states and then its metadata
+    finished = purge_entity_data(
+        recorder_mock, lambda entity_id: entity_id == "sensor.downsampled", utcnow
+    )
+    assert finished
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StatesDownsampled).count() == 0
+        assert (
+            session.query(StatesMeta)
+            .filter(StatesMeta.metadata_id == metadata_id)
+            .count()
+            == 0
+        )
+
+
 async def _add_test_recorder_runs(hass: HomeAssistant):
     """Add a few recorder_runs for testing."""
     utcnow = dt_util.utcnow()
@@ -0,0 +1,176 @@
+"""The tests for the recorder spill queue."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import CONF_SPILL_TO_DISK
+from homeassistant.components.recorder.db_schema import States, StatesMeta
+from homeassistant.components.recorder.spill import (
+    SEGMENT_SUFFIX,
+    SpillQueue,
+    event_from_bytes,
+    event_to_bytes,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.common import async_fire_time_changed
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+def _state_changed_event(value: str) -> Event:
+    """Return a state changed event."""
+    context = Context(user_id="abc")
+    new_state = State(
+        "sensor.test",
+        value,
+        {"unit_of_measurement": "W"},
+        context=context,
+        state_info={"unrecorded_attributes": frozenset({"secret"})},
+    )
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.test", "old_state": None, "new_state": new_state},
+        EventOrigin.local,
+        new_state.last_updated_timestamp,
+        context,
+    )
+
+
+def _recorded_states(hass: HomeAssistant) -> list[str]:
+    """Return the recorded states of sensor.test."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return [
+            state.state
+            for state in session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "sensor.test")
+            .order_by(States.state_id)
+        ]
+
+
+def test_event_round_trip() -> None:
+    """Test events are restored from the spill queue unchanged."""
+    event = _state_changed_event("1")
+    restored = event_from_bytes(event_to_bytes(event))
+    assert restored.event_type == event.event_type
+    assert restored.time_fired_timestamp == event.time_fired_timestamp
+    assert restored.context == event.context
+    assert restored.data["old_state"] is None
+    new_state = restored.data["new_state"]
+    assert new_state.as_dict() == event.data["new_state"].as_dict()
+    assert new_state.last_updated_timestamp == (
+        event.data["new_state"].last_updated_timestamp
+    )
+    assert new_state.state_info == {"unrecorded_attributes": frozenset({"secret"})}
+
+    event = Event("test_event", {"value": 1}, EventOrigin.remote)
+    restored = event_from_bytes(event_to_bytes(event))
+    assert restored.data == {"value": 1}
+    assert restored.origin is EventOrigin.remote
+
+
+def test_spill_queue_drain(tmp_path: Path) -> None:
+    """Test spilled events are read back in order and the segments removed."""
+    spill_queue = SpillQueue(str(tmp_path))
+    spill_queue.open()
+    for value in range(5):
+        spill_queue.put(_state_changed_event(str(value)))
+    assert spill_queue.active
+    assert spill_queue.pending
+
+    spill_queue.begin_drain()
+    assert not spill_queue.active
+    assert spill_queue.draining
+    events = [event for segment in spill_queue.drain() for event in segment]
+    assert [event.data["new_state"].state for event in events] == [
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+    ]
+    assert not spill_queue.draining
+    assert not list(tmp_path.glob(f"*{SEGMENT_SUFFIX}"))
+    spill_queue.close()
+
+
+def test_spill_queue_recovers_segments(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test segments left over from a previous run are read back."""
+    spill_queue = SpillQueue(str(tmp_path))
+    spill_queue.open()
+    spill_queue.put(_state_changed_event("1"))
+    spill_queue.put(_state_changed_event("2"))
+    spill_queue.close()
+
+    # Simulate a crash while the last record was written
+    (segment,) = tmp_path.glob(f"*{SEGMENT_SUFFIX}")
+    segment.write_bytes(segment.read_bytes()[:-3])
+
+    spill_queue = SpillQueue(str(tmp_path))
+    spill_queue.open()
+    assert spill_queue.has_recovered_segments
+    events = [event for segment in spill_queue.drain_recovered() for event in segment]
+    assert [event.data["new_state"].state for event in events] == ["1"]
+    assert "was truncated" in caplog.text
+    assert not spill_queue.has_recovered_segments
+    spill_queue.close()
+
+
+async def test_events_spilled_and_recorded(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    tmp_path: Path,
+) -> None:
+    """Test events are spilled while the recorder is behind and recorded later."""
+    with (
+        patch.object(recorder, "SPILL_DIR", str(tmp_path)),
+        patch.object(recorder.core, "SPILL_QUEUE_BACKLOG", 0),
+    ):
+        instance = await async_setup_recorder_instance(hass, {CONF_SPILL_TO_DISK: True})
+        assert instance.spill_queue is not None
+        for value in ("1", "2", "3"):
+            hass.states.async_set("sensor.test", value)
+        hass.bus.async_fire("test_event")
+        await async_wait_recording_done(hass)
+
+        assert instance.spill_queue.pending
+        assert await instance.async_add_executor_job(_recorded_states, hass) == []
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + recorder.core.SPILL_CHECK_INTERVAL
+        )
+        await async_wait_recording_done(hass)
+
+    assert not instance.spill_queue.pending
+    assert await instance.async_add_executor_job(_recorded_states, hass) == [
+        "1",
+        "2",
+        "3",
+    ]
+    assert not list(tmp_path.glob(f"*{SEGMENT_SUFFIX}"))
+
+
+async def test_spill_queue_disabled_by_default(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test events are kept in memory unless spilling is enabled."""
+    instance = await async_setup_recorder_instance(hass)
+    assert instance.spill_queue is None
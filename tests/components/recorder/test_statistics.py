@@ -1844,6 +1844,84 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+async def test_statistics_during_period_cache(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test statistics_during_period results are cached until they change."""
+    zero = dt_util.utcnow()
+    period1 = zero.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    period2 = period1 + timedelta(hours=1)
+    statistic_id = "test:total_energy_import"
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": statistic_id,
+        "unit_of_measurement": "kWh",
+    }
+    statistics_during_period_with_session = (
+        statistics._statistics_during_period_with_session
+    )
+
+    def _sums(stats: dict[str, list[dict[str, Any]]]) -> list[float]:
+        return [row["sum"] for row in stats[statistic_id]]
+
+    async_add_external_statistics(
+        hass, external_metadata, ({"start": period1, "state": 0, "sum": 2},)
+    )
+    await async_wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, statistic_ids={statistic_id})
+    assert _sums(stats) == [2]
+    until_period2 = statistics_during_period(
+        hass, zero, end_time=period2, statistic_ids={statistic_id}
+    )
+    assert _sums(until_period2) == [2]
+
+    # Results are served from the cache and modifying them is safe
+    stats[statistic_id].clear()
+    with patch.object(
+        statistics,
+        "_statistics_during_period_with_session",
+        wraps=statistics_during_period_with_session,
+    ) as mock_query:
+        stats = statistics_during_period(hass, zero, statistic_ids={statistic_id})
+        assert _sums(stats) == [2]
+        assert mock_query.call_count == 0
+
+    # Importing statistics only invalidates results overlapping the import
+    async_add_external_statistics(
+        hass, external_metadata, ({"start": period2, "state": 1, "sum": 3},)
+    )
+    await async_wait_recording_done(hass)
+    with patch.object(
+        statistics,
+        "_statistics_during_period_with_session",
+        wraps=statistics_during_period_with_session,
+    ) as mock_query:
+        assert (
+            statistics_during_period(
+                hass, zero, end_time=period2, statistic_ids={statistic_id}
+            )
+            == until_period2
+        )
+        assert mock_query.call_count == 0
+        stats = statistics_during_period(hass, zero, statistic_ids={statistic_id})
+        assert _sums(stats) == [2, 3]
+        assert mock_query.call_count == 1
+
+    # Adjusting statistics invalidates results after the adjustment
+    recorder_mock.async_adjust_statistics(statistic_id, period1, 10, "kWh")
+    await async_wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, statistic_ids={statistic_id})
+    assert _sums(stats) == [12, 13]
+
+    # Clearing statistics drops all results
+    recorder_mock.async_clear_statistics([statistic_id])
+    await async_wait_recording_done(hass)
+    assert statistics_during_period(hass, zero, statistic_ids={statistic_id}) == {}
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -2533,15 +2533,51 @@ async def test_recorder_info(
     response = await client.receive_json()
     assert response["success"]
     assert response["result"] == {
+        "attributes_cache": ANY,
         "backlog": 0,
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "read_pool": None,
         "recording": True,
         "thread_running": True,
     }
 
 
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.parametrize("recorder_config", [{recorder.CONF_DB_READ_POOL: True}])
+async def test_recorder_info_read_pool(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting recorder status with the read only pool."""
+    client = await hass_ws_client()
+
+    await client.send_json_auto_id(
+        {
+            "type": "recorder/statistics_during_period",
+            "start_time": dt_util.utcnow().isoformat(),
+            "statistic_ids": ["sensor.test"],
+            "period": "hour",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    await client.send_json_auto_id({"type": "recorder/info"})
+    response = await client.receive_json()
+    assert response["success"]
+    read_pool = response["result"]["read_pool"]
+    assert read_pool["active"] is True
+    assert read_pool["workers"] >= 2
+    assert read_pool["queues"]["statistics"] == {
+        "pending": 0,
+        "served": 1,
+        "wait_time_avg": ANY,
+        "wait_time_max": ANY,
+    }
+    assert read_pool["queues"]["history"]["served"] == 0
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
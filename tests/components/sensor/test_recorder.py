@@ -27,6 +27,7 @@ from homeassistant.components.recorder.db_schema import (
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
+    StatisticResult,
     process_timestamp,
 )
 from homeassistant.components.recorder.statistics import (
@@ -35,7 +36,12 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
@@ -2294,6 +2300,89 @@ async def test_compile_hourly_statistics_unchanged(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_statistics_aggregated_in_database(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test measurements aggregated in the database match the Python path."""
+    start = get_start_time(dt_util.utcnow()) + timedelta(minutes=15)
+    end = start + timedelta(minutes=5)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    watt_attributes = {**POWER_SENSOR_ATTRIBUTES, "unit_of_measurement": "W"}
+    changes = [
+        (timedelta(minutes=-1), "sensor.aggregated", "10", POWER_SENSOR_ATTRIBUTES),
+        (timedelta(seconds=7), "sensor.aggregated", "12.25", POWER_SENSOR_ATTRIBUTES),
+        (timedelta(seconds=61), "sensor.aggregated", "-3", POWER_SENSOR_ATTRIBUTES),
+        (timedelta(seconds=133), "sensor.aggregated", "7.1", POWER_SENSOR_ATTRIBUTES),
+        (timedelta(seconds=5), "sensor.unavailable", "5", POWER_SENSOR_ATTRIBUTES),
+        (
+            timedelta(seconds=50),
+            "sensor.unavailable",
+            STATE_UNAVAILABLE,
+            POWER_SENSOR_ATTRIBUTES,
+        ),
+        (timedelta(seconds=70), "sensor.unavailable", "15", POWER_SENSOR_ATTRIBUTES),
+        (timedelta(seconds=10), "sensor.exponent", "1e3", POWER_SENSOR_ATTRIBUTES),
+        (timedelta(seconds=20), "sensor.exponent", "2", POWER_SENSOR_ATTRIBUTES),
+        (timedelta(seconds=30), "sensor.unit_change", "1", POWER_SENSOR_ATTRIBUTES),
+        (timedelta(seconds=90), "sensor.unit_change", "1500", watt_attributes),
+    ]
+    for offset, entity_id, state, attributes in sorted(
+        changes, key=lambda change: change[0]
+    ):
+        freezer.move_to(start + offset)
+        hass.states.async_set(entity_id, state, attributes)
+    await async_wait_recording_done(hass)
+
+    aggregated: set[str] = set()
+
+    def _aggregate(*args: Any) -> dict[str, Any]:
+        result = aggregate_measurements(*args)
+        aggregated.update(result)
+        return result
+
+    def _compile(
+        start: datetime, end: datetime
+    ) -> tuple[list[StatisticResult], list[StatisticResult]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            in_database = sensor_recorder.compile_statistics(hass, session, start, end)
+            in_python = sensor_recorder.compile_statistics(
+                hass, session, start, end, False
+            )
+        return in_database.platform_stats, in_python.platform_stats
+
+    aggregate_measurements = sensor_recorder._aggregate_measurements_in_database
+    with patch(
+        "homeassistant.components.sensor.recorder._aggregate_measurements_in_database",
+        side_effect=_aggregate,
+    ):
+        in_database, in_python = await hass.async_add_executor_job(_compile, start, end)
+        # States in scientific notation and unit changes are handled in Python
+        assert aggregated == {"sensor.aggregated", "sensor.unavailable"}
+        assert in_database == in_python
+        assert len(in_database) == 4
+
+        # Only the states at the start of the next period are left
+        aggregated.clear()
+        in_database, in_python = await hass.async_add_executor_job(
+            _compile, end, end + timedelta(minutes=5)
+        )
+        assert aggregated == {
+            "sensor.aggregated",
+            "sensor.unavailable",
+            "sensor.exponent",
+            "sensor.unit_change",
+        }
+        assert in_database == in_python
+        assert [result["stat"]["mean"] for result in in_database] == [
+            7.1,
+            15.0,
+            2.0,
+            1500.0,
+        ]
+
+
 async def test_compile_hourly_statistics_partially_unavailable(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -18,8 +19,11 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
+from homeassistant.components.websocket_api.entity_subscriptions import (
+    async_get_entity_subscription_hub,
+)
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -27,6 +31,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +39,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1310,6 +1316,156 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_shares_listener(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test entity subscriptions share a single state changed listener."""
+    hass.states.async_set("light.permitted", "off")
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    for msg_id in (7, 8):
+        await websocket_client.send_json(
+            {
+                "id": msg_id,
+                "type": "subscribe_entities",
+                "entity_ids": ["light.permitted"],
+            }
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == "event"
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("light.permitted", "on")
+    received = {}
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        received[msg["id"]] = msg["event"]
+    assert received[7] == received[8]
+    assert received[7]["c"]["light.permitted"]["+"]["s"] == "on"
+
+    for msg_id, subscription in ((9, 7), (10, 8)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
+async def test_subscribe_entities_coalesce_interval(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test state changes within the coalesce interval are sent as one message."""
+    hass.states.async_set("light.kitchen", "off", {"brightness": 10})
+    hass.states.async_set("light.hallway", "off")
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_interval": 0.1}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.kitchen", "light.hallway"}
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 20})
+    hass.states.async_remove("light.hallway")
+    hass.states.async_set("light.porch", "on")
+    hass.states.async_set("light.temporary", "on")
+    hass.states.async_remove("light.temporary")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.porch": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {
+            "light.kitchen": {
+                "+": {"a": {"brightness": 20}, "c": ANY, "lc": ANY, "s": "on"}
+            }
+        },
+        "r": ["light.hallway"],
+    }
+
+
+async def test_subscribe_entities_resume(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test a resumed subscription only receives what changed since its seq."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.old", "on")
+    with patch(
+        "homeassistant.components.websocket_api.entity_subscriptions.RESUME_BUFFER_SIZE",
+        2,
+    ):
+        await websocket_client.send_json(
+            {"id": 7, "type": "subscribe_entities", "resumable": True}
+        )
+        msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["delta"] is False
+    start_seq = msg["result"]["seq"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.kitchen", "light.old"}
+
+    hass.states.async_set("light.kitchen", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["seq"] == start_seq + 1
+    assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "on"
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_remove("light.old")
+
+    await websocket_client.send_json(
+        {"id": 9, "type": "subscribe_entities", "since_seq": start_seq + 1}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {"seq": start_seq + 3, "delta": True}
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["event"] == {
+        "c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "off"}}},
+        "r": ["light.old"],
+    }
+
+    # The changes since start_seq are no longer kept
+    await websocket_client.send_json(
+        {"id": 10, "type": "subscribe_entities", "since_seq": start_seq}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {"seq": start_seq + 3, "delta": False}
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 10
+    assert set(msg["event"]["a"]) == {"light.kitchen"}
+
+
+async def test_subscribe_entities_subscriber_error(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing subscriber does not stop the other subscribers."""
+    hub = async_get_entity_subscription_hub(hass)
+    failing = Mock(user=Mock(is_admin=True))
+    failing.send_state_change.side_effect = ValueError("broken")
+    working = Mock(user=failing.user)
+    hub.async_subscribe(failing, None, {}, None, b"1")
+    hub.async_subscribe(working, None, {}, None, b"2")
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert failing.send_state_change.call_count == 1
+    assert working.send_state_change.call_count == 1
+    assert "Error forwarding state change" in caplog.text
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2563,6 +2719,43 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_setup_timeline(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test integration/setup_timeline."""
+    timeline = [
+        {
+            "domain": "august",
+            "group": None,
+            "phase": "setup",
+            "start": 0.0,
+            "seconds": 12.5,
+        },
+        {
+            "domain": "august",
+            "group": "123",
+            "phase": "platform_setup",
+            "start": 1.5,
+            "seconds": 2.0,
+        },
+    ]
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_setup_timeline",
+        return_value=timeline,
+    ):
+        await websocket_client.send_json(
+            {"id": 7, "type": "integration/setup_timeline"}
+        )
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == timeline
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import WSMsgType, WSServerHandshakeError, web
 import pytest
@@ -12,11 +13,13 @@ from homeassistant.components.websocket_api import (
     async_register_command,
     const,
     http,
+    messages,
     websocket_command,
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -451,6 +454,159 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_state_changes_merged_when_behind(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test state changes of a subscription are merged while the client is behind."""
+    hass.states.async_set("light.kitchen", "off", {"brightness": 10})
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_entities", "resumable": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    start_seq = msg["result"]["seq"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.kitchen"]["s"] == "off"
+
+    with patch(
+        "homeassistant.components.websocket_api.http.PENDING_MSG_MERGE_STATE_CHANGES",
+        0,
+    ):
+        hass.states.async_set("light.kitchen", "on", {"brightness": 20})
+        hass.states.async_set("light.hallway", "on")
+        hass.states.async_set("light.kitchen", "off", {"color": "red"})
+        hass.states.async_set("light.porch", "on")
+        hass.states.async_remove("light.porch")
+        msg = await websocket_client.receive_json()
+
+    # All state changes are sent as one message with the last sequence number
+    assert msg["id"] == 5
+    assert msg["seq"] == start_seq + 5
+    assert set(msg["event"]) == {"a", "c"}
+    diff = msg["event"]["c"]["light.kitchen"]
+    assert "s" not in diff["+"]
+    assert diff["+"]["a"] == {"color": "red"}
+    assert diff["-"] == {"a": ["brightness"]}
+    assert msg["event"]["a"]["light.hallway"]["s"] == "on"
+
+    # Once caught up, every state change is sent again
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["seq"] == start_seq + 6
+    assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "on"
+    msg = await websocket_client.receive_json()
+    assert msg["seq"] == start_seq + 7
+    assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "off"
+
+
+async def test_merged_state_changes_dropped_on_unsubscribe(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test merged state changes are not sent after unsubscribing."""
+
+    @callback
+    @websocket_command({"type": "set_state_and_unsubscribe"})
+    def set_state_and_unsubscribe(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        hass.states.async_set("light.kitchen", "on")
+        connection.subscriptions.pop(5)()
+        connection.send_result(msg["id"])
+
+    async_register_command(hass, set_state_and_unsubscribe)
+
+    await websocket_client.send_json({"id": 5, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {}}
+
+    with patch(
+        "homeassistant.components.websocket_api.http.PENDING_MSG_MERGE_STATE_CHANGES",
+        0,
+    ):
+        await websocket_client.send_json({"id": 6, "type": "set_state_and_unsubscribe"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 6
+    assert msg["success"]
+    await websocket_client.send_json({"id": 7, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "pong"
+
+
+async def test_enable_binary_messages(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test messages are sent as a deflate stream in binary frames."""
+    decompressor = zlib.decompressobj(
+        -zlib.MAX_WBITS, zdict=messages.BINARY_MESSAGE_DICTIONARY
+    )
+
+    async def _receive_json() -> dict[str, Any]:
+        msg = await websocket_client.receive()
+        assert msg.type is WSMsgType.BINARY
+        return json_loads(decompressor.decompress(msg.data))
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_BINARY_MESSAGES: const.BINARY_MESSAGES_VERSION},
+        }
+    )
+    msg = await _receive_json()
+    assert msg["id"] == 1
+    assert msg["success"] is True
+
+    hass.states.async_set("light.kitchen", "off", {"friendly_name": "Kitchen"})
+    await websocket_client.send_json({"id": 2, "type": "subscribe_entities"})
+    msg = await _receive_json()
+    assert msg["id"] == 2
+    assert msg["success"] is True
+    msg = await _receive_json()
+    assert msg["event"]["a"]["light.kitchen"]["s"] == "off"
+
+    hass.states.async_set("light.kitchen", "on", {"friendly_name": "Kitchen"})
+    msg = await _receive_json()
+    assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "on"
+
+    # Large messages are compressed in the executor in order with the others
+    large_name = "Kitchen " * 1000
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as add_executor_job:
+        hass.states.async_set("light.kitchen", "off", {"friendly_name": large_name})
+        msg = await _receive_json()
+        assert msg["event"]["c"]["light.kitchen"]["+"]["a"] == {
+            "friendly_name": large_name
+        }
+        assert add_executor_job.call_count == 1
+
+        hass.states.async_set("light.kitchen", "on", {"friendly_name": large_name})
+        msg = await _receive_json()
+        assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "on"
+        assert add_executor_job.call_count == 1
+
+
+async def test_binary_messages_unknown_version(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test messages stay text frames for an unknown dictionary version."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_BINARY_MESSAGES: 99},
+        }
+    )
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.TEXT
+    assert json_loads(msg.data)["success"] is True
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -903,6 +903,29 @@ async def test_float_conversion(hass: HomeAssistant) -> None:
     assert state.state == "3.6"
 
 
+async def test_async_write_ha_states(hass: HomeAssistant) -> None:
+    """Test writing the states of multiple entities in one batch."""
+    entities = []
+    for idx in range(3):
+        ent = entity.Entity()
+        ent.hass = hass
+        ent.entity_id = f"hello.world_{idx}"
+        ent._attr_state = str(idx)
+        entities.append(ent)
+    context = Context()
+    entities[0].async_set_context(context)
+
+    entity.async_write_ha_states(hass, entities)
+
+    states = [hass.states.get(ent.entity_id) for ent in entities]
+    assert [state.state for state in states] == ["0", "1", "2"]
+    assert len({state.last_updated for state in states}) == 1
+    # Each entity keeps its own context
+    assert states[0].context is context
+    assert len({state.context.id for state in states}) == 3
+    assert all(ent._write_batch_timestamp is None for ent in entities)
+
+
 async def test_attribution_attribute(hass: HomeAssistant) -> None:
     """Test attribution attribute."""
     mock_entity = entity.Entity()
@@ -1496,6 +1496,13 @@ async def test_disabled_entities_excluded_from_entity_list(
         device_entry.id, include_disabled_entities=True
     ) == [entry1, entry2]
 
+    assert ent_reg.entities.get_entity_ids_for_device_id(device_entry.id) == [
+        entry1.entity_id
+    ]
+    assert ent_reg.entities.get_entity_ids_for_device_id(
+        device_entry.id, include_disabled_entities=True
+    ) == [entry1.entity_id, entry2.entity_id]
+
 
 async def test_entity_max_length_exceeded(entity_registry: er.EntityRegistry) -> None:
     """Test that an exception is raised when the max character length is exceeded."""
@@ -1976,6 +1983,12 @@ async def test_entries_for_label(entity_registry: er.EntityRegistry) -> None:
     assert not er.async_entries_for_label(entity_registry, "unknown")
     assert not er.async_entries_for_label(entity_registry, "")
 
+    assert entity_registry.entities.get_entity_ids_for_label("label1") == [
+        label_1.entity_id,
+        label_1_and_2.entity_id,
+    ]
+    assert not entity_registry.entities.get_entity_ids_for_label("unknown")
+
 
 async def test_removing_categories(entity_registry: er.EntityRegistry) -> None:
     """Make sure we can clear categories."""
@@ -2251,6 +2251,56 @@ async def test_track_template_result_iterator(hass: HomeAssistant) -> None:
     assert filter_runs == ["", "sensor.new"]
 
 
+async def test_track_template_result_skips_unread_state_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates only re-render when a part of a state they read changes."""
+    hass.states.async_set("sensor.one", "on", {"unit": "W"})
+    hass.states.async_set("sensor.two", "off", {"unit": "W"})
+    template_count = Template(
+        "{{ states.sensor | selectattr('state', 'eq', 'on') | list | count }}", hass
+    )
+    template_attr = Template("{{ state_attr('sensor.one', 'unit') }}", hass)
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.extend(update.result for update in updates)
+
+    async_track_template_result(
+        hass,
+        [TrackTemplate(template_count, None, 0), TrackTemplate(template_attr, None)],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+    count_renders = template_count._renders
+    attr_renders = template_attr._renders
+
+    hass.states.async_set("sensor.two", "off", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert template_count._renders == count_renders
+    assert template_attr._renders == attr_renders
+
+    hass.states.async_set("sensor.one", "on", {"unit": "kW", "other": 1})
+    await hass.async_block_till_done()
+    assert template_count._renders == count_renders
+    assert template_attr._renders > attr_renders
+    assert refresh_runs == ["kW"]
+    attr_renders = template_attr._renders
+
+    hass.states.async_set("sensor.one", "on", {"unit": "kW", "other": 2})
+    await hass.async_block_till_done()
+    assert template_attr._renders == attr_renders
+
+    hass.states.async_set("sensor.two", "on", {"unit": "kW"})
+    await hass.async_block_till_done()
+    assert template_count._renders > count_renders
+    assert refresh_runs == ["kW", 2]
+
+
 async def test_track_template_result_errors(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
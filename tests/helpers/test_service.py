@@ -47,6 +47,7 @@ from homeassistant.util.yaml.loader import parse_yaml
 
 from tests.common import (
     MockEntity,
+    MockEntityPlatform,
     MockModule,
     MockUser,
     async_mock_service,
@@ -1297,6 +1298,63 @@ async def test_call_with_required_features(hass: HomeAssistant, mock_entities) -
     assert test_service_mock.call_count == 0
 
 
+async def test_call_with_batch_service_handler(
+    hass: HomeAssistant, mock_entities
+) -> None:
+    """Test a platform batch handler is called once for all its entities."""
+    platform = MockEntityPlatform(hass)
+    batch_calls = []
+
+    async def handle_batch(entities, data):
+        batch_calls.append(([entity.entity_id for entity in entities], data))
+
+    remove_handler = platform.async_register_batch_service_handler(
+        "async_turn_off", handle_batch
+    )
+    assert platform.async_supports_batch_service_call("async_turn_off")
+    for entity in mock_entities.values():
+        entity.async_turn_off = AsyncMock(return_value=None)
+    mock_entities["light.kitchen"].platform = platform
+    mock_entities["light.living_room"].platform = platform
+
+    await service.entity_service_call(
+        hass,
+        mock_entities,
+        "async_turn_off",
+        ServiceCall(
+            "test_domain", "test_service", {"entity_id": "all", "transition": 1}
+        ),
+    )
+
+    assert batch_calls == [(["light.kitchen", "light.living_room"], {"transition": 1})]
+    assert mock_entities["light.kitchen"].async_turn_off.call_count == 0
+    assert mock_entities["light.living_room"].async_turn_off.call_count == 0
+    mock_entities["light.bedroom"].async_turn_off.assert_called_once_with(transition=1)
+    mock_entities["light.bathroom"].async_turn_off.assert_called_once_with(transition=1)
+
+    # A single entity of the platform is called directly
+    batch_calls.clear()
+    await service.entity_service_call(
+        hass,
+        mock_entities,
+        "async_turn_off",
+        ServiceCall("test_domain", "test_service", {"entity_id": "light.kitchen"}),
+    )
+    assert batch_calls == []
+    mock_entities["light.kitchen"].async_turn_off.assert_called_once_with()
+
+    remove_handler()
+    assert not platform.async_supports_batch_service_call("async_turn_off")
+    await service.entity_service_call(
+        hass,
+        mock_entities,
+        "async_turn_off",
+        ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
+    )
+    assert batch_calls == []
+    assert mock_entities["light.living_room"].async_turn_off.call_count == 1
+
+
 async def test_call_with_both_required_features(
     hass: HomeAssistant, mock_entities
 ) -> None:
@@ -131,6 +131,49 @@ async def test_template_render_missing_hass(hass: HomeAssistant) -> None:
         template_obj.async_render_to_info()
 
 
+async def test_template_render_info_state_parts(hass: HomeAssistant) -> None:
+    """Test the parts of the states read while rendering are collected."""
+    hass.states.async_set("sensor.test", "1", {"unit": "W", "other": 1})
+    old_state = hass.states.get("sensor.test")
+    hass.states.async_set("sensor.test", "1", {"unit": "W", "other": 2})
+    attribute_changed = hass.states.get("sensor.test")
+    hass.states.async_set("sensor.test", "2", {"unit": "W", "other": 2})
+    state_changed = hass.states.get("sensor.test")
+
+    info = render_to_info(hass, "{{ states('sensor.test') }}")
+    assert info.state_value
+    assert not info.state_attributes
+    assert not info.filter_state_change(old_state, attribute_changed)
+    assert info.filter_state_change(attribute_changed, state_changed)
+
+    info = render_to_info(hass, "{{ state_attr('sensor.test', 'unit') }}")
+    assert not info.state_value
+    assert info.state_attribute_names == {"unit"}
+    assert not info.filter_state_change(old_state, attribute_changed)
+    assert not info.filter_state_change(attribute_changed, state_changed)
+
+    info = render_to_info(hass, "{{ states.sensor.test.attributes.other }}")
+    assert info.state_attributes
+    assert info.filter_state_change(old_state, attribute_changed)
+    assert not info.filter_state_change(attribute_changed, state_changed)
+
+    info = render_to_info(hass, "{{ states.sensor | list | count }}")
+    assert info.domains == {"sensor"}
+    assert not info.filter_state_change(attribute_changed, state_changed)
+
+    info = render_to_info(hass, "{{ states.sensor.test.last_updated }}")
+    assert info.state_metadata
+    assert info.filter_state_change(old_state, attribute_changed)
+
+    info = render_to_info(hass, "{{ states.sensor.test.last_changed }}")
+    assert info.state_metadata
+    assert info.filter_state_change(old_state, attribute_changed)
+
+    info = render_to_info(hass, "{{ states.sensor.test }}")
+    assert info.state_metadata
+    assert info.filter_state_change(old_state, attribute_changed)
+
+
 async def test_template_render_info_collision(hass: HomeAssistant) -> None:
     """Test template render info collision.
 
@@ -5167,9 +5210,61 @@ async def test_cache_garbage_collection() -> None:
     del tpl
     assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
+    # Recently compiled templates are kept alive by the size-bounded cache
+    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    template._NO_HASS_ENV.compiled_cache.clear()
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_cache_size_bounded(hass: HomeAssistant) -> None:
+    """Test the compiled template cache only keeps recent templates alive."""
+    with patch.object(template, "COMPILED_TEMPLATE_CACHE_SIZE", 2):
+        env = template.TemplateEnvironment(hass)
+
+    for value in range(3):
+        env.compile(f"{{{{ {value} }}}}")
+
+    assert env.async_get_compiled("{{ 0 }}") is None
+    assert env.async_get_compiled("{{ 1 }}") is not None
+    assert env.async_get_compiled("{{ 2 }}") is not None
+
+
+async def test_pure_template_rendered_once(hass: HomeAssistant) -> None:
+    """Test templates which always render the same output are rendered once."""
+    hass.states.async_set("sensor.test", "1")
+    pure = template.Template("{% set x = [3, 1, 2] %}{{ x | sort | join(',') }}", hass)
+    impure_templates = [
+        template.Template("{{ states('sensor.test') }}", hass),
+        template.Template("{{ states.sensor.test.state == '1' }}", hass),
+        template.Template("{{ [1, 2] | random }}", hass),
+        template.Template("{{ now() }}", hass),
+        template.Template("{{ value }}", hass),
+        template.Template("{{ [1] | map('string') | first }}", hass),
+        template.Template("{% import 'test.jinja' as test %}", hass),
+    ]
+
+    with patch.object(
+        template, "_render_with_context", wraps=template._render_with_context
+    ) as render_mock:
+        assert pure.async_render(parse_result=False) == "1,2,3"
+        assert pure.async_render(parse_result=False) == "1,2,3"
+        assert (
+            template.Template(pure.template, hass).async_render(parse_result=False)
+            == "1,2,3"
+        )
+        assert render_mock.call_count == 1
+
+        for tpl in impure_templates:
+            tpl.ensure_valid()
+            tpl._ensure_compiled()
+            assert not tpl._pure
+
+    error = template.Template("{{ 1 / 0 }}", hass)
+    for _ in range(2):
+        with pytest.raises(TemplateError):
+            error.async_render()
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -587,6 +587,77 @@ async def test_setup_after_deps_not_present(hass: HomeAssistant) -> None:
     assert order == ["root", "second_dep"]
 
 
+def test_critical_path_times() -> None:
+    """Test the critical path includes the domains waiting on a domain."""
+    integrations = {
+        "root": Mock(dependencies=[], after_dependencies=[]),
+        "first_dep": Mock(dependencies=["root"], after_dependencies=[]),
+        "second_dep": Mock(dependencies=[], after_dependencies=["first_dep"]),
+        "other": Mock(dependencies=["not_set_up"], after_dependencies=["root"]),
+        "loop_a": Mock(dependencies=[], after_dependencies=["loop_b"]),
+        "loop_b": Mock(dependencies=[], after_dependencies=["loop_a"]),
+    }
+    path_times = bootstrap._async_get_critical_path_times(
+        set(integrations),
+        integrations,
+        {"root": 1.0, "first_dep": 2.0, "second_dep": 3.0, "other": 0.5},
+    )
+    assert path_times["second_dep"] == pytest.approx(3.0)
+    assert path_times["first_dep"] == pytest.approx(5.0)
+    assert path_times["root"] == pytest.approx(6.0)
+    assert path_times["other"] == pytest.approx(0.5)
+    # Domains waiting on each other are only counted once
+    assert max(path_times["loop_a"], path_times["loop_b"]) == pytest.approx(
+        2 * bootstrap.DEFAULT_SETUP_TIME
+    )
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_order_follows_critical_path(hass: HomeAssistant) -> None:
+    """Test the domains delaying the most other domains are set up first."""
+    order = []
+
+    async def _mock_setup_component(
+        hass: HomeAssistant, domain: str, config: ConfigType
+    ) -> bool:
+        order.append(domain)
+        return True
+
+    with patch(
+        "homeassistant.bootstrap.async_setup_component",
+        side_effect=_mock_setup_component,
+    ):
+        await bootstrap.async_setup_multi_components(
+            hass,
+            {"fast", "slow", "sensor"},
+            {},
+            {"fast": 0.1, "slow": 5.0},
+        )
+
+    assert order == ["sensor", "slow", "fast"]
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_times_saved(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the setup times are averaged with the last start and saved."""
+    hass.set_state(CoreState.not_running)
+    hass_storage[bootstrap.SETUP_TIMES_STORAGE_KEY] = {
+        "version": bootstrap.SETUP_TIMES_STORAGE_VERSION,
+        "key": bootstrap.SETUP_TIMES_STORAGE_KEY,
+        "data": {"root": 1000.0, "removed": 2.0},
+    }
+    mock_integration(hass, MockModule(domain="root"))
+
+    await bootstrap._async_set_up_integrations(hass, {"root": {}})
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    setup_times = hass_storage[bootstrap.SETUP_TIMES_STORAGE_KEY]["data"]
+    assert setup_times["removed"] == 2.0
+    assert 500.0 <= setup_times["root"] < 1000.0
+
+
 @pytest.fixture
 def mock_is_virtual_env() -> Generator[Mock]:
     """Mock is_virtual_env."""
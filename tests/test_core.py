@@ -64,6 +64,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -1169,6 +1170,47 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test keyed listeners only receive events for their key."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub_1 = hass.bus.async_listen_keyed("test", "entity_id", "light.one", listener)
+    unsub_2 = hass.bus.async_listen_keyed("test", "device_id", "abc", listener)
+    assert hass.bus.async_listeners()["test"] == old_count + 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.two"})
+    hass.bus.async_fire("test", {"entity_id": ["light.one"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.one"})
+    assert calls == []
+
+    hass.bus.async_fire("test", {"entity_id": "light.one"})
+    assert len(calls) == 1
+    hass.bus.async_fire("test", {"entity_id": "light.one", "device_id": "abc"})
+    assert len(calls) == 3
+
+    unsub_1()
+    hass.bus.async_fire("test", {"entity_id": "light.one"})
+    assert len(calls) == 3
+    unsub_2()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    # Should only log now
+    unsub_1()
+    assert "Unable to remove unknown keyed job listener" in caplog.text
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, "entity_id", "light.one", listener)
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1544,6 +1586,86 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states in one batch."""
+    hass.states.async_set("light.bowl", "on", {})
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many(
+        [
+            ("light.bowl", "on", None),
+            ("LIGHT.Kitchen", "off", {"brightness": 0}),
+            ("sensor.temperature", 20, None),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.kitchen",
+        "sensor.temperature",
+    ]
+    # The states share the timestamp but not the context
+    assert events[0].context is not events[1].context
+    assert events[0].time_fired == events[1].time_fired
+    assert hass.states.get("light.kitchen").attributes == {"brightness": 0}
+    assert hass.states.get("sensor.temperature").state == "20"
+
+    context = ha.Context()
+    hass.states.async_set_many(
+        [("light.bowl", "on", None), ("light.kitchen", "on", None)],
+        force_update=True,
+        context=context,
+    )
+    await hass.async_block_till_done()
+    assert len(events) == 4
+    assert events[2].context is context
+    assert events[3].context is context
+
+
+async def test_statemachine_scalar_attributes(hass: HomeAssistant) -> None:
+    """Test attributes with scalar values reuse their JSON."""
+    hass.states.async_set("light.bowl", "on", {"color": "red", "level": 1})
+    hass.states.async_set("light.kitchen", "on", {"color": "red", "level": 1})
+    hass.states.async_set("light.porch", "on", {"x": -0.0})
+    hass.states.async_set("light.hall", "on", {"x": 0.0})
+    hass.states.async_set("light.empty", "on", {})
+
+    bowl = hass.states.get("light.bowl")
+    kitchen = hass.states.get("light.kitchen")
+    assert type(bowl.attributes) is ha.ScalarAttributes
+    # Equal attributes of different entities are not shared
+    assert bowl.attributes is not kitchen.attributes
+    assert type(hass.states.get("light.empty").attributes) is ReadOnlyDict
+
+    with pytest.raises(RuntimeError):
+        bowl.attributes["level"] = 2
+
+    assert json_loads(bowl.as_dict_json)["attributes"] == {
+        "color": "red",
+        "level": 1,
+    }
+    assert json_loads(b"{" + kitchen.as_compressed_state_json + b"}") == {
+        "light.kitchen": {
+            "s": "on",
+            "a": {"color": "red", "level": 1},
+            "c": kitchen.context.id,
+            "lc": kitchen.last_changed_timestamp,
+        }
+    }
+    assert b'"attributes":{"x":-0.0}' in hass.states.get("light.porch").as_dict_json
+    assert b'"attributes":{"x":0.0}' in hass.states.get("light.hall").as_dict_json
+
+    # The attributes and their JSON are reused while they do not change
+    fragment = bowl.attributes.fragment
+    hass.states.async_set("light.bowl", "off", {"color": "red", "level": 1})
+    assert hass.states.get("light.bowl").attributes is bowl.attributes
+    assert hass.states.get("light.bowl").attributes.fragment is fragment
+
+    # Attributes with mutable values are kept as is
+    hass.states.async_set("light.bowl", "on", {"color": [1, 2]})
+    assert type(hass.states.get("light.bowl").attributes) is ReadOnlyDict
+
+
 async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> None:
     """Test async_set avoids recreating ReadOnly dicts when possible."""
     attrs = {"some_attr": "attr_value"}
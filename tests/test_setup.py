@@ -1150,6 +1150,45 @@ async def test_async_get_setup_timings(hass: HomeAssistant) -> None:
     }
 
 
+async def test_async_get_setup_timeline(hass: HomeAssistant) -> None:
+    """Test we can get the setup timeline relative to the first setup."""
+    hass.set_state(CoreState.not_running)
+    assert setup.async_get_setup_timeline(hass) == []
+
+    with (
+        setup.async_start_setup(
+            hass, integration="august", phase=setup.SetupPhases.SETUP
+        ),
+        setup.async_start_setup(
+            hass,
+            integration="august",
+            group="entry_id",
+            phase=setup.SetupPhases.CONFIG_ENTRY_SETUP,
+        ),
+    ):
+        pass
+
+    timeline = setup.async_get_setup_timeline(hass)
+    assert timeline == [
+        {
+            "domain": "august",
+            "group": "entry_id",
+            "phase": setup.SetupPhases.CONFIG_ENTRY_SETUP,
+            "start": ANY,
+            "seconds": ANY,
+        },
+        {
+            "domain": "august",
+            "group": None,
+            "phase": setup.SetupPhases.SETUP,
+            "start": 0,
+            "seconds": ANY,
+        },
+    ]
+    assert timeline[0]["start"] >= 0
+    assert timeline[1]["seconds"] >= timeline[0]["seconds"]
+
+
 async def test_setup_config_entry_from_yaml(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
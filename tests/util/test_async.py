@@ -1,6 +1,7 @@
 """Tests for async util methods from Python source."""
 
 import asyncio
+import math
 import time
 from unittest.mock import MagicMock, Mock, patch
 
@@ -213,3 +214,48 @@ async def test_get_scheduled_timer_handles(hass: HomeAssistant) -> None:
     timer_handle.cancel()
     timer_handle2.cancel()
     timer_handle3.cancel()
+
+
+async def test_timer_wheel(hass: HomeAssistant) -> None:
+    """Test timers firing in the same slot share one loop timer."""
+    loop = hass.loop
+    wheel = hass.timer_wheel
+    assert wheel is hasync.get_timer_wheel(loop)
+    calls = []
+    resolution = hasync.TIMER_WHEEL_RESOLUTION
+    # hass already has timers of its own on the wheel
+    existing_slot_handles = {id(handle) for handle in wheel.slot_handles()}
+
+    def new_slot_handles() -> list[asyncio.TimerHandle]:
+        return [
+            handle
+            for handle in wheel.slot_handles()
+            if id(handle) not in existing_slot_handles
+        ]
+
+    when = (math.ceil(loop.time() / resolution) + 1) * resolution - 0.01
+    handle1 = wheel.call_at(when, calls.append, 1)
+    handle2 = wheel.call_at(when + 0.001, calls.append, 2)
+    cancelled = wheel.call_at(when + 0.002, calls.append, 3)
+    handles = wheel.call_at_many(when, [(calls.append, (4,)), (calls.append, (4,))])
+
+    assert len(new_slot_handles()) == 1
+    scheduled = hasync.get_scheduled_timer_handles(loop)
+    assert {handle1, handle2, cancelled, *handles}.issubset(scheduled)
+    assert not any(
+        handle in scheduled for handle in new_slot_handles()
+    ), "slot timers are replaced by the timers on the wheel"
+
+    cancelled.cancel()
+    assert cancelled not in wheel.handles()
+    await asyncio.sleep(resolution * 3)
+    assert sorted(calls) == [1, 2, 4, 4]
+    assert not any(handle in wheel.handles() for handle in (handle1, *handles))
+    assert not new_slot_handles()
+
+    # Cancelling the last timer of a slot cancels its loop timer
+    handle = wheel.call_later(12.345, calls.append, 5)
+    (slot_handle,) = new_slot_handles()
+    handle.cancel()
+    assert slot_handle.cancelled()
+    assert not new_slot_handles()